@@ -1,16 +1,16 @@
+import sys
 import random
-import sqlite3
 
-# Set up SQLite database
-conn = sqlite3.connect('game_scores.db')
-c = conn.cursor()
-c.execute('''
-CREATE TABLE IF NOT EXISTS scores (
-    user_score INTEGER,
-    computer_score INTEGER,
-    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
-)
-''')
+import rps_engine
+import scorestore
+
+# headless: python RPS2.py tournament --rounds 1000000
+if sys.argv[1:2] == ["tournament"]:
+    from rps_engine import tournament
+    sys.exit(tournament.main(sys.argv[2:]))
+
+# shared score database of the hub games (scorestore/)
+scores = scorestore.open_store()
 
 # Game settings
 outcome = ["rock", "paper", "scissors"]
@@ -28,35 +28,37 @@ difficulty = input("Select difficulty (easy, medium, hard): ").lower()
 best_of = int(input("Enter the number of rounds for Best-of Mode (e.g., 3, 5, 7): "))
 rounds_to_win = (best_of // 2) + 1
 
-def ai_choice(user_input):
+# what the AI has learned about the player (moves as rps_engine indexes)
+predictor = rps_engine.Predictor()
+last_move = None
+
+def ai_choice():
+    # decided before the player's move of this round is looked at
     if difficulty == "easy":
         return random.choice(outcome)
     elif difficulty == "medium":
         # Bias AI to counter user's previous move
-        if user_input == "rock":
-            return "paper"
-        elif user_input == "paper":
-            return "scissors"
-        elif user_input == "scissors":
-            return "rock"
-        else:
+        if last_move is None:
             return random.choice(outcome)
+        return outcome[rps_engine.BEATS[last_move]]
     elif difficulty == "hard":
-        # Predictive logic (simple pattern recognition)
-        return random.choice(outcome)  # Add advanced logic here later
+        # Predictive logic: n-gram model of the user's move history (rps_engine/predictor.py)
+        return outcome[predictor.counter()]
     else:
         return random.choice(outcome)
 
 def match_up():
-    global user_score, computer_score  # Declare global variables
+    global user_score, computer_score, last_move  # Declare global variables
     user_input = input("Which one do you choose: ").lower()
    
     if user_input not in outcome:
         print(f"{user_input} is not valid, please try again.")
         return
    
-    computer_input = ai_choice(user_input)
+    computer_input = ai_choice()
     print(f"I chose {computer_input}.")
+    last_move = outcome.index(user_input)
+    predictor.update(last_move)
    
     if (user_input == "rock" and computer_input == "scissors") or \
        (user_input == "paper" and computer_input == "rock") or \
@@ -84,15 +86,11 @@ while True:
     if decider == "exit":
         break
 
-# Save scores to SQLite database
-c.execute('INSERT INTO scores (user_score, computer_score) VALUES (?, ?)', (user_score, computer_score))
-conn.commit()
+# Save scores to the shared score database
+scores.add("rps", user_score, opponent=computer_score,
+           detail={"difficulty": difficulty, "best_of": best_of})
 
 # Retrieve and display top scores
 print("Game over! Here are the top scores:")
-c.execute('SELECT * FROM scores ORDER BY user_score DESC LIMIT 5')
-high_scores = c.fetchall()
-for score in high_scores:
-    print(score)
-
-conn.close()
+for score in scores.top("rps", limit=5).rows:
+    print(f"{score.player}: {score.score} - {score.opponent}")
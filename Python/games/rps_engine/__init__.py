@@ -0,0 +1,7 @@
+"""
+rps_engine - opponents and simulation for RPS2.py
+- predictor: online n-gram / Markov model of the player's moves, O(1) per round
+- tournament: headless round robin between strategies on a process pool
+"""
+
+from .predictor import MOVES, BEATS, Predictor, outcome
@@ -0,0 +1,85 @@
+"""
+Online move prediction for rock-paper-scissors.
+Moves are ints: 0 rock, 1 paper, 2 scissors; BEATS[m] is the move that
+beats m. The predictor keeps, for every context length 1..order, a flat
+count table indexed by (the opponent's last k moves, next move). Each
+round it updates one cell per order and re-scores every order by whether
+it would have guessed right, so both update() and predict() cost O(order)
+- constant per round - whatever the length of the history.
+"""
+
+import random
+
+MOVES = ("rock", "paper", "scissors")
+BEATS = (1, 2, 0)
+DEFAULT_ORDER = 4
+COUNT_CAP = 64        # counts of a context are halved past this, so old habits fade
+SCORE_DECAY = 0.9     # per round, for the accuracy score of each order
+
+def outcome(a, b):
+    """1 if move a beats move b, -1 if it loses, 0 for a tie."""
+    return (0, 1, -1)[(a - b) % 3]
+
+class Predictor:
+    """n-gram / Markov model of one opponent's moves, learned while playing."""
+
+    def __init__(self, order=DEFAULT_ORDER):
+        self.order = order
+        # counts[k][context * 3 + move], context = last k+1 moves in base 3
+        self.counts = [[0] * (3 ** (k + 2)) for k in range(order)]
+        self.scores = [0.0] * (order + 1)     # order 0 = plain frequency
+        self.freq = [0, 0, 0]
+        self.context = 0                      # last `order` moves, newest in the low digit
+        self.seen = 0
+        self._guesses = [None] * (order + 1)
+
+    def _guess(self, k):
+        # most frequent next move after the last k moves (k = 0: overall)
+        if k == 0:
+            cells = self.freq
+        else:
+            if self.seen < k:
+                return None
+            base = (self.context % 3 ** k) * 3
+            cells = self.counts[k - 1][base:base + 3]
+        best = max(cells)
+        if best == 0:
+            return None
+        return cells.index(best)
+
+    def predict(self):
+        """The opponent's most likely next move, or None before any data."""
+        best, best_score = None, None
+        for k in range(self.order + 1):
+            guess = self._guesses[k] = self._guess(k)
+            if guess is not None and (best_score is None or self.scores[k] >= best_score):
+                best, best_score = guess, self.scores[k]
+        return best
+
+    def counter(self, rng=None):
+        """Our move against the predicted one (random if there is no prediction yet)."""
+        guess = self.predict()
+        if guess is None:
+            return (rng or random).randrange(3)
+        return BEATS[guess]
+
+    def update(self, move):
+        """Learn the opponent's actual move of this round."""
+        for k in range(self.order + 1):
+            # reuse the guesses of predict(); recompute if it was not called this round
+            guess = self._guesses[k] if self._guesses[k] is not None else self._guess(k)
+            self.scores[k] = self.scores[k] * SCORE_DECAY + (1.0 if guess == move else 0.0)
+            self._guesses[k] = None
+        self.freq[move] += 1
+        if self.freq[move] > COUNT_CAP:
+            self.freq = [c // 2 for c in self.freq]
+        for k in range(1, self.order + 1):
+            if self.seen >= k:
+                table = self.counts[k - 1]
+                base = (self.context % 3 ** k) * 3
+                table[base + move] += 1
+                if table[base + move] > COUNT_CAP:
+                    for i in range(base, base + 3):
+                        table[i] //= 2
+        self.context = (self.context * 3 + move) % 3 ** self.order
+        self.seen += 1
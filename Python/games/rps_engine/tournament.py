@@ -0,0 +1,315 @@
+"""
+Headless rock-paper-scissors tournament.
+Every pair of strategies plays a match of N rounds; matches run on a
+process pool and the report gives win / loss / tie rates per pairing and
+rounds per second:
+
+    python RPS2.py tournament --rounds 1000000
+    python -m rps_engine.tournament --strategies markov,cycle,biased --json
+
+Strategies whose moves do not depend on the opponent ("oblivious") are
+generated a block of rounds at a time, and a match between two of them is
+scored with array operations (NumPy if installed). Adaptive strategies
+(markov, frequency, ...) play round by round.
+"""
+
+import sys
+import json
+import time
+import random
+import argparse
+import itertools
+import concurrent.futures
+
+from .predictor import BEATS, Predictor
+
+BLOCK = 65536          # rounds generated / scored at a time
+DEFAULT_ROUNDS = 100000
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# ------------------------
+# Strategies
+# ------------------------
+class Strategy:
+    """Base: move() for the next round, observe() the finished one."""
+
+    oblivious = False     # True if moves never depend on the opponent
+
+    def __init__(self, rng):
+        self.rng = rng
+
+    def move(self):
+        raise NotImplementedError
+
+    def observe(self, own, other):
+        pass
+
+    def block(self, n):
+        """The next n moves at once (oblivious strategies only)."""
+        return [self.move() for _ in range(n)]
+
+class RandomPlayer(Strategy):
+    """Uniformly random: the unexploitable baseline."""
+
+    oblivious = True
+
+    def move(self):
+        return self.rng.randrange(3)
+
+    def block(self, n):
+        if np is not None:
+            return np.random.default_rng(self.rng.getrandbits(64)).integers(0, 3, n, dtype=np.int8)
+        return [self.rng.randrange(3) for _ in range(n)]
+
+class BiasedPlayer(Strategy):
+    """Rock half of the time, otherwise paper or scissors."""
+
+    oblivious = True
+    weights = (0.5, 0.25, 0.25)
+
+    def move(self):
+        return self.rng.choices((0, 1, 2), self.weights)[0]
+
+    def block(self, n):
+        if np is not None:
+            gen = np.random.default_rng(self.rng.getrandbits(64))
+            return gen.choice(3, size=n, p=self.weights).astype(np.int8)
+        return self.rng.choices((0, 1, 2), self.weights, k=n)
+
+class CyclePlayer(Strategy):
+    """rock, paper, scissors, rock, ..."""
+
+    oblivious = True
+
+    def __init__(self, rng):
+        super().__init__(rng)
+        self.next = rng.randrange(3)
+
+    def move(self):
+        m = self.next
+        self.next = (m + 1) % 3
+        return m
+
+    def block(self, n):
+        start = self.next
+        self.next = (start + n) % 3
+        if np is not None:
+            return ((np.arange(n) + start) % 3).astype(np.int8)
+        return [(start + i) % 3 for i in range(n)]
+
+class StickyPlayer(Strategy):
+    """Repeats the last move 80% of the time, like many people do."""
+
+    oblivious = True
+
+    def __init__(self, rng):
+        super().__init__(rng)
+        self.last = rng.randrange(3)
+
+    def move(self):
+        if self.rng.random() >= 0.8:
+            self.last = self.rng.randrange(3)
+        return self.last
+
+class CopyPlayer(Strategy):
+    """Plays the opponent's previous move."""
+
+    def __init__(self, rng):
+        super().__init__(rng)
+        self.last = rng.randrange(3)
+
+    def move(self):
+        return self.last
+
+    def observe(self, own, other):
+        self.last = other
+
+class BeatLastPlayer(CopyPlayer):
+    """Plays what beats the opponent's previous move (RPS2 'medium')."""
+
+    def move(self):
+        return BEATS[self.last]
+
+class FrequencyPlayer(Strategy):
+    """Counters the opponent's most frequent move so far."""
+
+    def __init__(self, rng):
+        super().__init__(rng)
+        self.counts = [0, 0, 0]
+
+    def move(self):
+        best = max(self.counts)
+        if best == 0:
+            return self.rng.randrange(3)
+        return BEATS[self.counts.index(best)]
+
+    def observe(self, own, other):
+        self.counts[other] += 1
+
+class MarkovPlayer(Strategy):
+    """n-gram predictor of the opponent's moves (RPS2 'hard')."""
+
+    def __init__(self, rng):
+        super().__init__(rng)
+        self.predictor = Predictor()
+
+    def move(self):
+        return self.predictor.counter(self.rng)
+
+    def observe(self, own, other):
+        self.predictor.update(other)
+
+STRATEGIES = {
+    "random": RandomPlayer,
+    "biased": BiasedPlayer,
+    "cycle": CyclePlayer,
+    "sticky": StickyPlayer,
+    "copy": CopyPlayer,
+    "beat_last": BeatLastPlayer,
+    "frequency": FrequencyPlayer,
+    "markov": MarkovPlayer,
+}
+
+# ------------------------
+# Matches
+# ------------------------
+def _score_blocks(a, b):
+    # (wins of a, wins of b) for two equally long move blocks
+    if np is not None:
+        diff = (np.asarray(a, dtype=np.int8) - np.asarray(b, dtype=np.int8)) % 3
+        return int(np.count_nonzero(diff == 1)), int(np.count_nonzero(diff == 2))
+    wins_a = wins_b = 0
+    for x, y in zip(a, b):
+        d = (x - y) % 3
+        wins_a += d == 1
+        wins_b += d == 2
+    return wins_a, wins_b
+
+def _pregenerate(player, n):
+    # an oblivious side is still generated a block at a time, as plain ints
+    if not player.oblivious:
+        return None
+    moves = player.block(n)
+    return moves.tolist() if hasattr(moves, "tolist") else moves
+
+def play_match(name_a, name_b, rounds=DEFAULT_ROUNDS, seed=None):
+    """Play one match; returns {"a", "b", "rounds", "wins_a", "wins_b", "ties", "seconds"}."""
+    rng = random.Random(seed)
+    a = STRATEGIES[name_a](random.Random(rng.getrandbits(64)))
+    b = STRATEGIES[name_b](random.Random(rng.getrandbits(64)))
+    wins_a = wins_b = 0
+    start = time.perf_counter()
+    if a.oblivious and b.oblivious:
+        # neither side reacts: score whole blocks at once
+        for done in range(0, rounds, BLOCK):
+            n = min(BLOCK, rounds - done)
+            wa, wb = _score_blocks(a.block(n), b.block(n))
+            wins_a += wa
+            wins_b += wb
+    else:
+        for done in range(0, rounds, BLOCK):
+            n = min(BLOCK, rounds - done)
+            moves_a, moves_b = _pregenerate(a, n), _pregenerate(b, n)
+            for i in range(n):
+                x = moves_a[i] if moves_a is not None else a.move()
+                y = moves_b[i] if moves_b is not None else b.move()
+                d = (x - y) % 3
+                if d == 1:
+                    wins_a += 1
+                elif d == 2:
+                    wins_b += 1
+                a.observe(x, y)
+                b.observe(y, x)
+    return {"a": name_a, "b": name_b, "rounds": rounds, "wins_a": wins_a, "wins_b": wins_b,
+            "ties": rounds - wins_a - wins_b, "seconds": round(time.perf_counter() - start, 4)}
+
+def _play(args):
+    return play_match(*args)
+
+def tournament(names=None, rounds=DEFAULT_ROUNDS, jobs=None, seed=None):
+    """Round robin of every pair of strategies; returns the summary dict."""
+    names = list(names or STRATEGIES)
+    rng = random.Random(seed)
+    pairs = [(a, b, rounds, rng.getrandbits(64)) for a, b in itertools.combinations(names, 2)]
+    start = time.perf_counter()
+    if jobs == 1:
+        matches = [_play(p) for p in pairs]
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as pool:
+            matches = list(pool.map(_play, pairs))
+    elapsed = time.perf_counter() - start
+    total = sum(m["rounds"] for m in matches)
+    standings = {n: {"wins": 0, "losses": 0, "ties": 0} for n in names}
+    for m in matches:
+        standings[m["a"]]["wins"] += m["wins_a"]
+        standings[m["a"]]["losses"] += m["wins_b"]
+        standings[m["b"]]["wins"] += m["wins_b"]
+        standings[m["b"]]["losses"] += m["wins_a"]
+        standings[m["a"]]["ties"] += m["ties"]
+        standings[m["b"]]["ties"] += m["ties"]
+    for s in standings.values():
+        played = s["wins"] + s["losses"] + s["ties"]
+        s["win_rate"] = round(s["wins"] / played, 4) if played else 0.0
+        s["net"] = round((s["wins"] - s["losses"]) / played, 4) if played else 0.0
+    return {
+        "strategies": names,
+        "rounds_per_match": rounds,
+        "rounds": total,
+        "seconds": round(elapsed, 3),
+        "rounds_per_second": round(total / elapsed) if elapsed else None,
+        "vectorized": np is not None,
+        "matches": matches,
+        "standings": standings,
+    }
+
+# ------------------------
+# Command line
+# ------------------------
+def print_report(summary):
+    names = summary["strategies"]
+    net = {(m["a"], m["b"]): (m["wins_a"] - m["wins_b"]) / m["rounds"] for m in summary["matches"]}
+    width = max(len(n) for n in names) + 2
+    print("net win rate of the row against the column (+0.33 = wins a third more rounds than it loses)")
+    print(" " * width + "".join(f"{n[:9]:>10}" for n in names))
+    for a in names:
+        cells = []
+        for b in names:
+            if a == b:
+                cells.append(f"{'-':>10}")
+            else:
+                value = net[a, b] if (a, b) in net else -net[b, a]
+                cells.append(f"{value:>+10.3f}")
+        print(f"{a:<{width}}" + "".join(cells))
+    print()
+    ranked = sorted(summary["standings"].items(), key=lambda kv: -kv[1]["net"])
+    for name, s in ranked:
+        print(f"{name:<{width}} win {s['win_rate'] * 100:5.1f}%  net {s['net']:+.3f}")
+    print(f"\n{summary['rounds']} rounds in {summary['seconds']}s, "
+          f"{summary['rounds_per_second']} rounds/s"
+          + ("" if summary["vectorized"] else " (NumPy not installed: no vectorized matches)"))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Play rock-paper-scissors strategies against each other.")
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS, help="rounds per match")
+    parser.add_argument("--strategies", help="comma separated, default: all of " + ", ".join(STRATEGIES))
+    parser.add_argument("-j", "--jobs", type=int, help="worker processes (default: CPU count)")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--json", action="store_true", help="print the summary as JSON")
+    args = parser.parse_args(argv)
+    names = [n.strip() for n in args.strategies.split(",")] if args.strategies else None
+    unknown = [n for n in names or () if n not in STRATEGIES]
+    if unknown:
+        parser.error("unknown strategy: " + ", ".join(unknown))
+    summary = tournament(names, args.rounds, args.jobs, args.seed)
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        print_report(summary)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,7 @@
+"""
+scorestore - shared high score database for the hub games
+(RPS2.py, Wordle.py, snake_terminal.py): one fixed SQLite file in WAL
+mode, batched inserts and indexed, keyset-paginated leaderboards.
+"""
+
+from .store import DB_FILE, Score, Leader, Page, ScoreStore, open_store, default_player
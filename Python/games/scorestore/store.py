@@ -0,0 +1,198 @@
+"""
+One SQLite score database for every hub game.
+- fixed location: <hub>/.data/scores.db (PYHUB_SCORES_DB overrides it),
+  not whatever directory a game happens to be started from
+- WAL journal, synchronous=NORMAL; inserts are queued and written in
+  batches, one transaction each (and at exit)
+- a per-player 'best' table is kept up to date on every batch, so
+  leaderboards never scan the whole score history
+- every listing is keyset-paginated on an index: a page is found by
+  seeking to the cursor of the previous one, never by OFFSET
+"""
+
+import os
+import json
+import time
+import atexit
+import sqlite3
+import getpass
+import threading
+from collections import namedtuple
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+HUB_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(HERE)))
+DB_FILE = os.environ.get("PYHUB_SCORES_DB") or os.path.join(HUB_ROOT, ".data", "scores.db")
+
+BATCH_SIZE = 256       # queued scores that trigger a write
+PAGE_SIZE = 10
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    id INTEGER PRIMARY KEY,
+    game TEXT NOT NULL,
+    player TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    opponent INTEGER,
+    detail TEXT,
+    ts REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS scores_board ON scores (game, score);
+CREATE INDEX IF NOT EXISTS scores_player ON scores (game, player, score);
+CREATE TABLE IF NOT EXISTS best (
+    game TEXT NOT NULL,
+    player TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    games INTEGER NOT NULL,
+    ts REAL NOT NULL,
+    PRIMARY KEY (game, player)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS best_board ON best (game, score, player);
+"""
+
+Score = namedtuple("Score", "id game player score opponent detail ts")
+Leader = namedtuple("Leader", "player score games ts")
+# rows of one listing plus the cursor for the next page (None on the last page)
+Page = namedtuple("Page", "rows next")
+
+def default_player():
+    """The login name, used when a game does not ask for one."""
+    try:
+        return getpass.getuser()
+    except Exception:
+        return "player"
+
+def _score(row):
+    detail = json.loads(row[5]) if row[5] else None
+    return Score(row[0], row[1], row[2], row[3], row[4], detail, row[6])
+
+class ScoreStore:
+    """Queued writes and paginated reads on one scores database."""
+
+    def __init__(self, path=None, batch_size=BATCH_SIZE):
+        self.path = path or DB_FILE
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self._pending = []
+        self._db = None
+
+    def _connect(self):
+        if self._db is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            db = sqlite3.connect(self.path, timeout=5.0, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.executescript(SCHEMA)
+            self._db = db
+        return self._db
+
+    # ------------------------
+    # Writing
+    # ------------------------
+    def add(self, game, score, player=None, opponent=None, detail=None, ts=None):
+        """Queue one finished game; written with the next batch."""
+        row = (game, player or default_player(), int(score), opponent,
+               json.dumps(detail) if detail is not None else None, ts or time.time())
+        with self._lock:
+            self._pending.append(row)
+            due = len(self._pending) >= self.batch_size
+        if due:
+            self.flush()
+
+    def add_many(self, rows):
+        """Write (game, score, player) tuples right away, in one batch."""
+        now = time.time()
+        queued = [(game, player or default_player(), int(score), None, None, now)
+                  for game, score, player in rows]
+        with self._lock:
+            self._pending.extend(queued)
+        self.flush()
+
+    def flush(self):
+        """Write every queued score, and the best-score updates, in one transaction."""
+        with self._lock:
+            rows, self._pending = self._pending, []
+            if not rows:
+                return
+            db = self._connect()
+            with db:
+                db.executemany("INSERT INTO scores (game, player, score, opponent, detail, ts)"
+                               " VALUES (?,?,?,?,?,?)", rows)
+                best = {}
+                for game, player, score, _, _, ts in rows:
+                    b = best.get((game, player))
+                    best[game, player] = (max(b[0], score) if b else score, (b[1] if b else 0) + 1, ts)
+                db.executemany(
+                    "INSERT INTO best (game, player, score, games, ts) VALUES (?,?,?,?,?)"
+                    " ON CONFLICT (game, player) DO UPDATE SET"
+                    " games = games + excluded.games, ts = excluded.ts,"
+                    " score = MAX(score, excluded.score)",
+                    [(g, p, s, n, ts) for (g, p), (s, n, ts) in best.items()])
+
+    # ------------------------
+    # Reading (flushes first, so a game sees its own score)
+    # ------------------------
+    def _query(self, sql, args):
+        self.flush()
+        with self._lock:
+            return self._connect().execute(sql, args).fetchall()
+
+    def top(self, game, limit=PAGE_SIZE, after=None):
+        """Highest scores of a game, best first. Pass page.next as after for the next page."""
+        if after is None:
+            rows = self._query("SELECT * FROM scores WHERE game = ?"
+                               " ORDER BY score DESC, id DESC LIMIT ?", (game, limit))
+        else:
+            rows = self._query("SELECT * FROM scores WHERE game = ? AND (score, id) < (?, ?)"
+                               " ORDER BY score DESC, id DESC LIMIT ?", (game, *after, limit))
+        rows = [_score(r) for r in rows]
+        return Page(rows, (rows[-1].score, rows[-1].id) if len(rows) == limit else None)
+
+    def player(self, game, player, limit=PAGE_SIZE, after=None):
+        """One player's scores of a game, best first."""
+        if after is None:
+            rows = self._query("SELECT * FROM scores WHERE game = ? AND player = ?"
+                               " ORDER BY score DESC, id DESC LIMIT ?", (game, player, limit))
+        else:
+            rows = self._query("SELECT * FROM scores WHERE game = ? AND player = ? AND (score, id) < (?, ?)"
+                               " ORDER BY score DESC, id DESC LIMIT ?", (game, player, *after, limit))
+        rows = [_score(r) for r in rows]
+        return Page(rows, (rows[-1].score, rows[-1].id) if len(rows) == limit else None)
+
+    def leaders(self, game, limit=PAGE_SIZE, after=None):
+        """Players ranked by their best score in a game."""
+        if after is None:
+            rows = self._query("SELECT player, score, games, ts FROM best WHERE game = ?"
+                               " ORDER BY score DESC, player DESC LIMIT ?", (game, limit))
+        else:
+            rows = self._query("SELECT player, score, games, ts FROM best WHERE game = ?"
+                               " AND (score, player) < (?, ?)"
+                               " ORDER BY score DESC, player DESC LIMIT ?", (game, *after, limit))
+        rows = [Leader(*r) for r in rows]
+        return Page(rows, (rows[-1].score, rows[-1].player) if len(rows) == limit else None)
+
+    def rank(self, game, score):
+        """1-based position a score would take in the game's leaderboard."""
+        return self._query("SELECT COUNT(*) FROM scores WHERE game = ? AND score > ?",
+                           (game, score))[0][0] + 1
+
+    def count(self, game):
+        return self._query("SELECT SUM(games) FROM best WHERE game = ?", (game,))[0][0] or 0
+
+    def close(self):
+        self.flush()
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+_store = None
+_store_lock = threading.Lock()
+
+def open_store():
+    """The process-wide store on DB_FILE; queued scores are written at exit."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ScoreStore()
+            atexit.register(_store.close)
+        return _store
@@ -1,8 +1,14 @@
 # simple terminal snake placeholder (non-pygame)
 import time
+
+import scorestore
+
 print("This is a simple placeholder for Snake.")
 print("In a full version you would use pygame for graphics.")
 time.sleep(1)
 print("Pretend the snake moved and ate an apple. Score: 10")
+scores = scorestore.open_store()
+scores.add("snake", 10)
+print(f"High score: {scores.top('snake', limit=1).rows[0].score}")
 input("Press ENTER to exit...")
 
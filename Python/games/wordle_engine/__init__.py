@@ -0,0 +1,12 @@
+"""
+wordle_engine - word lists and scoring for Wordle.py
+- wordlist: dictionaries packed into fixed-size records, memory-mapped,
+  with an on-disk hash table for O(1) guess validation
+- scoring: allocation-free feedback patterns that handle repeated letters
+- solver: entropy hints from a precomputed, memory-mapped pattern matrix
+  (NumPy if installed, pure Python otherwise)
+"""
+
+from .scoring import MISS, PRESENT, CORRECT, MAX_GUESSES, score, solved, decode, encode, render, counts
+from .wordlist import WordList, load, dictionaries, pack, read_words
+from .solver import Solver
@@ -0,0 +1,63 @@
+"""
+Wordle feedback scoring.
+A pattern is an int with one base-3 digit per position (position 0 is the
+lowest digit): MISS, PRESENT (right letter, wrong place) or CORRECT.
+score() works on str or bytes of any length, handles repeated letters the
+way Wordle does, and allocates nothing but the resulting int.
+"""
+
+MISS, PRESENT, CORRECT = 0, 1, 2
+MARKS = ".!#"     # Wordle.py: '#' right place, '!' wrong place
+MAX_GUESSES = 5   # guesses per game, in Wordle.py and the simulations
+
+def score(guess, answer):
+    """Feedback pattern of guess against answer (same length)."""
+    n = len(answer)
+    pattern = 0
+    weight = 1
+    for i in range(n):
+        g = guess[i]
+        if g == answer[i]:
+            pattern += CORRECT * weight
+        else:
+            # copies of g in the answer not matched in place, minus the ones
+            # already claimed by earlier misplaced copies in the guess
+            free = 0
+            for j in range(n):
+                if answer[j] == g and guess[j] != g:
+                    free += 1
+            for j in range(i):
+                if guess[j] == g and answer[j] != g:
+                    free -= 1
+            if free > 0:
+                pattern += PRESENT * weight
+        weight *= 3
+    return pattern
+
+def solved(length):
+    """The all-CORRECT pattern for words of this length."""
+    return 3 ** length - 1
+
+def decode(pattern, length):
+    """Pattern as a tuple of MISS / PRESENT / CORRECT per position."""
+    marks = []
+    for _ in range(length):
+        pattern, mark = divmod(pattern, 3)
+        marks.append(mark)
+    return tuple(marks)
+
+def encode(marks):
+    """Inverse of decode()."""
+    pattern = 0
+    for mark in reversed(marks):
+        pattern = pattern * 3 + mark
+    return pattern
+
+def render(pattern, length, marks=MARKS):
+    """Pattern as one character per position, e.g. '#!..#'."""
+    return "".join(marks[m] for m in decode(pattern, length))
+
+def counts(pattern, length):
+    """(correct, present) totals of a pattern."""
+    marks = decode(pattern, length)
+    return marks.count(CORRECT), marks.count(PRESENT)
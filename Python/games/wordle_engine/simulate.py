@@ -0,0 +1,263 @@
+"""
+Headless Wordle simulation.
+Plays many games with a guess strategy on a process pool and reports the
+guess-count distribution, win rate and games per second:
+
+    python Wordle.py simulate --games 5000 --strategy frequency --jobs 4
+    python -m wordle_engine.simulate --strategy solver --check 100000
+
+Strategies: random (any word that fits the feedback), frequency (the
+fitting word with the most common letters per position) and solver
+(solver.Solver, entropy). Every game also checks the engine: the answer
+must fit all feedback it produced, and --check compares score() with a
+straightforward reference implementation on random word pairs.
+"""
+
+import sys
+import json
+import time
+import random
+import argparse
+import concurrent.futures
+
+from . import scoring
+from . import wordlist
+
+MAX_GUESSES = scoring.MAX_GUESSES
+CHUNK_GAMES = 64      # games per pool task
+
+# ------------------------
+# Strategies
+# ------------------------
+class RandomStrategy:
+    """Guess a random word that still fits all the feedback."""
+
+    def __init__(self, words, rng):
+        self.words = words
+        self.rng = rng
+        self.all = list(words)
+
+    def reset(self):
+        self.candidates = self.all
+
+    def guess(self):
+        return self.rng.choice(self.candidates)
+
+    def update(self, guess, pattern):
+        self.candidates = [w for w in self.candidates if scoring.score(guess, w) == pattern]
+
+    def possible(self, word):
+        return word in self.candidates
+
+class FrequencyStrategy(RandomStrategy):
+    """Guess the fitting word whose letters are most common at their positions."""
+
+    def guess(self):
+        length = self.words.length
+        counts = [{} for _ in range(length)]
+        for word in self.candidates:
+            for i, ch in enumerate(word):
+                counts[i][ch] = counts[i].get(ch, 0) + 1
+        best, best_score = self.candidates[0], -1
+        for word in self.candidates:
+            # repeated letters are scored once, they tell less
+            seen = set()
+            value = 0
+            for i, ch in enumerate(word):
+                value += counts[i][ch] if ch not in seen else 0
+                seen.add(ch)
+            if value > best_score:
+                best, best_score = word, value
+        return best
+
+class SolverStrategy:
+    """Guess the word with the highest expected information (solver.Solver)."""
+
+    def __init__(self, words, rng):
+        self.words = words
+
+    def reset(self):
+        from .solver import Solver
+        self.solver = Solver(self.words)
+
+    def guess(self):
+        best = self.solver.hint()
+        return best[0] if best else None
+
+    def update(self, guess, pattern):
+        self.solver.update(guess, pattern)
+
+    def possible(self, word):
+        index = self.words.index(word)
+        candidates = self.solver.candidates
+        if self.solver.vectorized:
+            return bool((candidates == index).any())
+        return index in candidates
+
+STRATEGIES = {
+    "random": RandomStrategy,
+    "frequency": FrequencyStrategy,
+    "solver": SolverStrategy,
+}
+
+def play(strategy, answer, max_guesses=MAX_GUESSES):
+    """
+    One game. Returns (guesses used or 0 if lost, consistent), where
+    consistent is False if the strategy lost track of the real answer.
+    """
+    strategy.reset()
+    solved = scoring.solved(len(answer))
+    for turn in range(1, max_guesses + 1):
+        guess = strategy.guess()
+        if guess is None:
+            return 0, False
+        pattern = scoring.score(guess, answer)
+        if pattern == solved:
+            return turn, True
+        strategy.update(guess, pattern)
+        if not strategy.possible(answer):
+            return 0, False
+    return 0, True
+
+# ------------------------
+# Pool workers
+# ------------------------
+_worker = None    # (words, strategy) per process
+
+def _init_worker(length, name, extra, strategy):
+    global _worker
+    words = wordlist.load(length, name, extra)
+    _worker = (words, STRATEGIES[strategy](words, random.Random()))
+
+def _play_chunk(answers, max_guesses, seed):
+    # seeded per chunk, so results do not depend on --jobs
+    words, strategy = _worker
+    if seed is not None and hasattr(strategy, "rng"):
+        strategy.rng.seed(seed)
+    return [play(strategy, words[a], max_guesses) for a in answers]
+
+def simulate(games=1000, strategy="frequency", jobs=None, seed=None, length=5, name="en",
+             extra=(), max_guesses=MAX_GUESSES):
+    """Play `games` games on random answers; returns the summary dict."""
+    words = wordlist.load(length, name, extra)
+    rng = random.Random(seed)
+    answers = [rng.randrange(len(words)) for _ in range(games)]
+    chunks = [answers[i:i + CHUNK_GAMES] for i in range(0, games, CHUNK_GAMES)]
+    seeds = [rng.getrandbits(32) if seed is not None else None for _ in chunks]
+    if strategy == "solver":
+        from . import solver
+        if solver.np is not None:
+            # built and saved once here; every worker then just maps the file
+            solver.load_matrix(words)
+    start = time.perf_counter()
+    results = []
+    if jobs == 1:
+        _init_worker(length, name, extra, strategy)
+        for chunk, chunk_seed in zip(chunks, seeds):
+            results.extend(_play_chunk(chunk, max_guesses, chunk_seed))
+    else:
+        with concurrent.futures.ProcessPoolExecutor(
+                max_workers=jobs, initializer=_init_worker,
+                initargs=(length, name, extra, strategy)) as pool:
+            for found in pool.map(_play_chunk, chunks, [max_guesses] * len(chunks), seeds):
+                results.extend(found)
+    elapsed = time.perf_counter() - start
+    distribution = {str(n): 0 for n in range(1, max_guesses + 1)}
+    distribution["lost"] = 0
+    for turns, _ in results:
+        distribution[str(turns) if turns else "lost"] += 1
+    wins = games - distribution["lost"]
+    return {
+        "strategy": strategy,
+        "games": games,
+        "words": len(words),
+        "wins": wins,
+        "win_rate": round(wins / games, 4) if games else 0.0,
+        "mean_guesses": round(sum(t for t, _ in results if t) / wins, 3) if wins else None,
+        "distribution": distribution,
+        "inconsistent": sum(1 for _, ok in results if not ok),
+        "seconds": round(elapsed, 3),
+        "games_per_second": round(games / elapsed, 1) if elapsed else None,
+    }
+
+# ------------------------
+# Engine check
+# ------------------------
+def reference_score(guess, answer):
+    """Textbook two-pass scoring, kept simple on purpose to check score() against."""
+    marks = [scoring.MISS] * len(answer)
+    left = list(answer)
+    for i, ch in enumerate(guess):
+        if ch == answer[i]:
+            marks[i] = scoring.CORRECT
+            left[i] = None
+    for i, ch in enumerate(guess):
+        if marks[i] != scoring.CORRECT and ch in left:
+            marks[i] = scoring.PRESENT
+            left[left.index(ch)] = None
+    return scoring.encode(marks)
+
+def check(pairs=100000, seed=None, length=5, name="en", extra=()):
+    """Compare score() (and the solver matrix, if NumPy is there) with reference_score()."""
+    words = wordlist.load(length, name, extra)
+    rng = random.Random(seed)
+    matrix = None
+    from . import solver
+    if solver.np is not None:
+        matrix = solver.load_matrix(words)
+    mismatches = []
+    for _ in range(pairs):
+        g, a = rng.randrange(len(words)), rng.randrange(len(words))
+        expected = reference_score(words[g], words[a])
+        got = scoring.score(words[g], words[a])
+        if got != expected or (matrix is not None and int(matrix[g, a]) != expected):
+            mismatches.append((words[g], words[a]))
+    return {"pairs": pairs, "matrix": matrix is not None, "mismatches": len(mismatches),
+            "examples": mismatches[:5]}
+
+# ------------------------
+# Command line
+# ------------------------
+def print_report(summary):
+    print(f"strategy {summary['strategy']}: {summary['games']} games on {summary['words']} words")
+    print(f"win rate {summary['win_rate'] * 100:.1f}%, mean guesses {summary['mean_guesses']}")
+    most = max(summary["distribution"].values()) or 1
+    for turns, count in summary["distribution"].items():
+        print(f"  {turns:>4} {count:>7} {'#' * round(40 * count / most)}")
+    print(f"{summary['seconds']}s, {summary['games_per_second']} games/s")
+    if summary["inconsistent"]:
+        print(f"ENGINE ERROR: {summary['inconsistent']} game(s) lost track of the answer")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Play Wordle headless and report strategy statistics.")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--strategy", choices=sorted(STRATEGIES), default="frequency")
+    parser.add_argument("-j", "--jobs", type=int, help="worker processes (default: CPU count)")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--length", type=int, default=5, help="word length")
+    parser.add_argument("--dictionary", default="en", help="dictionaries/<name>.txt")
+    parser.add_argument("--extra", action="append", default=[], help="extra word list file")
+    parser.add_argument("--max-guesses", type=int, default=MAX_GUESSES)
+    parser.add_argument("--check", type=int, metavar="PAIRS",
+                        help="also compare scoring with the reference on PAIRS random pairs")
+    parser.add_argument("--json", action="store_true", help="print the summary as JSON")
+    args = parser.parse_args(argv)
+
+    summary = simulate(args.games, args.strategy, args.jobs, args.seed, args.length,
+                       args.dictionary, tuple(args.extra), args.max_guesses)
+    failed = summary["inconsistent"] > 0
+    if args.check:
+        summary["check"] = check(args.check, args.seed, args.length, args.dictionary, tuple(args.extra))
+        failed = failed or summary["check"]["mismatches"] > 0
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        print_report(summary)
+        if args.check:
+            c = summary["check"]
+            print(f"check: {c['mismatches']} mismatch(es) in {c['pairs']} pairs"
+                  + (" (score and matrix)" if c["matrix"] else ""))
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
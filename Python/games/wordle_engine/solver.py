@@ -0,0 +1,176 @@
+"""
+Entropy-based Wordle hints.
+With NumPy, the feedback pattern of every guess against every answer is
+precomputed once into a words x words matrix (uint8 for 5 letters), saved
+next to the packed word list as .npy and memory-mapped on later loads.
+Filtering candidates and ranking guesses by expected information are then
+array operations. Without NumPy the ranking is done in pure Python, using
+a sample of the remaining candidates as both guesses and answers.
+"""
+
+import os
+import math
+import random
+
+from . import scoring
+
+CHUNK_ROWS = 512       # guesses per block when building / ranking (bounds memory)
+SAMPLE = 150           # pure-Python fallback: guesses and answers considered
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_matrices = {}    # matrix path -> mapped array
+_openings = {}    # matrix path -> best first guess, it only depends on the word list
+
+def _dtype(length):
+    if 3 ** length <= 256:
+        return np.uint8
+    return np.uint16 if 3 ** length <= 65536 else np.uint32
+
+def _letters(words):
+    raw = "".join(words).encode("ascii")
+    return np.frombuffer(raw, dtype=np.uint8).reshape(len(words), words.length)
+
+def build_matrix(words):
+    """patterns[g, a] = scoring.score(words[g], words[a]) for every pair, vectorized."""
+    codes = _letters(words)
+    n, length = codes.shape
+    out = np.empty((n, n), dtype=_dtype(length))
+    answers = codes[None, :, :]
+    for r0 in range(0, n, CHUNK_ROWS):
+        guesses = codes[r0:r0 + CHUNK_ROWS, None, :]
+        green = guesses == answers                               # (R, n, L)
+        pattern = np.zeros(green.shape[:2], dtype=np.int32)
+        for i in range(length):
+            g = guesses[..., i]                                  # (R, 1)
+            # answer letters equal to g that are not matched in place ...
+            free = ((answers == g[..., None]) & ~green).sum(axis=-1)
+            # ... minus the ones claimed by earlier misplaced copies of g
+            for j in range(i):
+                free -= (guesses[..., j] == g) & ~green[..., j]
+            mark = np.where(green[..., i], scoring.CORRECT, free > 0)
+            pattern += mark * 3 ** i
+        out[r0:r0 + CHUNK_ROWS] = pattern
+    return out
+
+def _matrix_path(words):
+    return words.path[:-len(".pak")] + ".patterns.npy"
+
+def load_matrix(words):
+    """The pattern matrix for a WordList: mapped from disk, built and saved on first use."""
+    path = _matrix_path(words)
+    matrix = _matrices.get(path)
+    if matrix is None:
+        try:
+            matrix = np.load(path, mmap_mode="r")
+        except (OSError, ValueError):
+            matrix = build_matrix(words)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            try:
+                with open(tmp, "wb") as fh:
+                    np.save(fh, matrix)
+                os.replace(tmp, path)
+            except OSError:
+                pass
+        _matrices[path] = matrix
+    return matrix
+
+def _entropies(counts, total):
+    # expected information (bits) of each row of pattern counts
+    if np is not None and not isinstance(counts, list):
+        c = counts.astype(np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            weighted = np.where(c > 0, c * np.log2(c), 0.0).sum(axis=1)
+        return math.log2(total) - weighted / total
+    return [math.log2(total) - sum(c * math.log2(c) for c in row) / total for row in counts]
+
+class Solver:
+    """Tracks the words still possible and suggests the most informative next guess."""
+
+    def __init__(self, words, use_numpy=True):
+        self.words = words
+        self.length = words.length
+        self.vectorized = use_numpy and np is not None
+        if self.vectorized:
+            self.matrix = load_matrix(words)
+            self.candidates = np.arange(len(words))
+        else:
+            self.candidates = list(range(len(words)))
+
+    def remaining(self):
+        return len(self.candidates)
+
+    def update(self, guess, pattern):
+        """Keep only the candidates that would have given `pattern` for `guess`."""
+        index = self.words.index(guess)
+        if self.vectorized and index >= 0:
+            keep = self.matrix[index, self.candidates] == pattern
+            self.candidates = self.candidates[keep]
+            return
+        words = self.words
+        kept = [a for a in self.candidates if scoring.score(guess, words[a]) == pattern]
+        self.candidates = np.array(kept, dtype=np.int64) if self.vectorized else kept
+
+    def rank(self, top=5):
+        """
+        [(word, bits)] best first. Possible answers get a bonus of 1/remaining
+        bits, their chance to end the game right away.
+        """
+        total = len(self.candidates)
+        if total == 0:
+            return []
+        if total <= 2:
+            return [(self.words[int(i)], float(total - 1)) for i in self.candidates[:top]]
+        if self.vectorized:
+            return self._rank_numpy(top)
+        return self._rank_python(top)
+
+    def _rank_numpy(self, top):
+        cols = self.candidates
+        total = len(cols)
+        npat = 3 ** self.length
+        n = len(self.words)
+        scores = np.empty(n)
+        for r0 in range(0, n, CHUNK_ROWS):
+            block = self.matrix[r0:r0 + CHUNK_ROWS]
+            block = (block if total == n else block[:, cols]).astype(np.int32)
+            rows = block.shape[0]
+            block += (np.arange(rows, dtype=np.int32) * npat)[:, None]
+            counts = np.bincount(block.ravel(), minlength=rows * npat).reshape(rows, npat)
+            scores[r0:r0 + rows] = _entropies(counts, total)
+        # a possible answer also has a 1/total chance to win right away
+        scores[cols] += 1.0 / total
+        best = np.argsort(-scores, kind="stable")[:top]
+        return [(self.words[int(i)], float(scores[i])) for i in best]
+
+    def _rank_python(self, top):
+        words = self.words
+        answers = [words[a] for a in self.candidates]
+        rng = random.Random(len(answers))
+        if len(answers) > SAMPLE:
+            answers = rng.sample(answers, SAMPLE)
+        total = len(answers)
+        ranked = []
+        for guess in answers:
+            counts = {}
+            for answer in answers:
+                p = scoring.score(guess, answer)
+                counts[p] = counts.get(p, 0) + 1
+            bits = _entropies([list(counts.values())], total)[0]
+            ranked.append((bits, guess))
+        ranked.sort(key=lambda r: -r[0])
+        return [(word, bits) for bits, word in ranked[:top]]
+
+    def hint(self):
+        """(best guess, bits) or None if no word fits the feedback so far."""
+        key = _matrix_path(self.words), self.vectorized
+        if len(self.candidates) == len(self.words) and key in _openings:
+            return _openings[key]
+        ranked = self.rank(1)
+        best = ranked[0] if ranked else None
+        if len(self.candidates) == len(self.words):
+            _openings[key] = best
+        return best
@@ -0,0 +1,186 @@
+"""
+Packed, memory-mapped word lists.
+Dictionaries are plain text files (one word per line, '#' comments) in
+dictionaries/. For a given word length they are packed once into a binary
+file under packed/ (rebuilt when a source changes):
+
+    header   magic, format version, word length, word count, hash slots
+    records  count fixed-size records of `length` ASCII bytes, sorted
+    table    open-addressing hash table of uint32 (record index + 1, 0 = empty)
+
+The file is mapped with mmap, so loading costs no parsing, and membership
+tests hash the word and probe the table in place: O(1), no word set in memory.
+"""
+
+import os
+import sys
+import mmap
+import array
+import random
+import struct
+import hashlib
+import tempfile
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DICT_DIR = os.path.join(HERE, "dictionaries")
+PACK_DIR = os.path.join(HERE, "packed")
+
+MAGIC = b"WDLP"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sBBHII")   # magic, version, length, unused, count, slots
+LETTER_BITS = 5
+MAX_LENGTH = 12                      # 12 * 5 bits still fits the 64-bit hash input
+_MIX = 0x9E3779B97F4A7C15
+_MASK64 = (1 << 64) - 1
+
+_loaded = {}    # pack path -> WordList
+
+def _code(word):
+    # letters a-z as 5-bit digits; works on str and bytes
+    code = 0
+    for ch in word.encode("ascii") if isinstance(word, str) else word:
+        code = (code << LETTER_BITS) | (ch & 31)
+    return code
+
+def _slot_bits(count):
+    bits = 4
+    while (1 << bits) < count * 2:      # load factor <= 0.5
+        bits += 1
+    return bits
+
+def read_words(paths, length):
+    """Sorted unique lowercase a-z words of `length` letters from text files."""
+    words = set()
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as fh:
+            for line in fh:
+                word = line.split("#", 1)[0].strip().lower()
+                if len(word) == length and word.isascii() and word.isalpha():
+                    words.add(word)
+    return sorted(words)
+
+def pack(words, length, dest):
+    """Write words (all `length` letters) as a packed file at dest."""
+    if not 1 <= length <= MAX_LENGTH:
+        raise ValueError(f"word length must be 1..{MAX_LENGTH}")
+    bits = _slot_bits(len(words))
+    slots = 1 << bits
+    shift = 64 - bits
+    table = array.array("I", bytes(4 * slots))
+    for index, word in enumerate(words):
+        slot = ((_code(word) * _MIX) & _MASK64) >> shift
+        while table[slot]:
+            slot = (slot + 1) & (slots - 1)
+        table[slot] = index + 1
+    records = "".join(words).encode("ascii")
+    padding = -(HEADER.size + len(records)) % 4
+    os.makedirs(os.path.dirname(os.path.abspath(dest)), exist_ok=True)
+    tmp = f"{dest}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as fh:
+        fh.write(HEADER.pack(MAGIC, FORMAT_VERSION, length, 0, len(words), slots))
+        fh.write(records)
+        fh.write(bytes(padding))
+        fh.write(table.tobytes())
+    os.replace(tmp, dest)
+
+class WordList:
+    """A read-only word list backed by a mapped packed file."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as fh:
+            self._map = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, length, _, count, slots = HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self._map.close()
+            raise ValueError(f"not a packed word list: {path}")
+        self.length = length
+        self._count = count
+        self._records = HEADER.size
+        table_at = self._records + count * length
+        table_at += -table_at % 4
+        self._table = memoryview(self._map)[table_at:table_at + 4 * slots].cast("I")
+        self._mask = slots - 1
+        self._shift = 64 - slots.bit_length() + 1
+
+    def __len__(self):
+        return self._count
+
+    def record(self, index):
+        """Word number index as bytes (no decoding)."""
+        start = self._records + index * self.length
+        return self._map[start:start + self.length]
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("word index out of range")
+        return self.record(index).decode("ascii")
+
+    def __iter__(self):
+        data = self._map[self._records:self._records + self._count * self.length].decode("ascii")
+        n = self.length
+        return (data[i:i + n] for i in range(0, len(data), n))
+
+    def index(self, word):
+        """Position of word in the list, or -1."""
+        if len(word) != self.length:
+            return -1
+        try:
+            raw = word.lower().encode("ascii") if isinstance(word, str) else word
+        except UnicodeEncodeError:
+            return -1
+        if not raw.isalpha():
+            return -1
+        table, mask = self._table, self._mask
+        slot = ((_code(raw) * _MIX) & _MASK64) >> self._shift
+        while True:
+            entry = table[slot]
+            if not entry:
+                return -1
+            if self.record(entry - 1) == raw:
+                return entry - 1
+            slot = (slot + 1) & mask
+
+    def __contains__(self, word):
+        return self.index(word) >= 0
+
+    def random(self, rng=random):
+        """A random word."""
+        return self[rng.randrange(self._count)]
+
+    def close(self):
+        self._table.release()
+        self._map.close()
+
+def dictionaries():
+    """Names of the bundled dictionaries (dictionaries/<name>.txt)."""
+    try:
+        return sorted(f[:-4] for f in os.listdir(DICT_DIR) if f.endswith(".txt"))
+    except OSError:
+        return []
+
+def _pack_path(sources, length):
+    h = hashlib.sha1(f"{FORMAT_VERSION}|{length}|{sys.byteorder}".encode())
+    for path in sources:
+        st = os.stat(path)
+        h.update(f"|{os.path.abspath(path)}|{st.st_mtime_ns}|{st.st_size}".encode())
+    name = f"words{length}-{h.hexdigest()[:16]}.pak"
+    if os.access(HERE, os.W_OK):
+        return os.path.join(PACK_DIR, name)
+    return os.path.join(tempfile.gettempdir(), "wordle_engine", name)
+
+def load(length=5, name="en", extra=()):
+    """
+    WordList of every `length`-letter word in dictionaries/<name>.txt plus
+    the text files in extra. Packed on first use, then just mapped.
+    """
+    sources = [os.path.join(DICT_DIR, f"{name}.txt")] + [os.path.abspath(p) for p in extra]
+    path = _pack_path(sources, length)
+    words = _loaded.get(path)
+    if words is None:
+        if not os.path.exists(path):
+            pack(read_words(sources, length), length, path)
+        words = _loaded[path] = WordList(path)
+    return words
@@ -0,0 +1,365 @@
+"""Find duplicate files fast: size, then first/last blocks, then a full hash only where needed."""
+import os
+import sys
+import json
+import time
+import hashlib
+import argparse
+import itertools
+import threading
+import concurrent.futures
+
+EDGE = 64 * 1024            # bytes hashed at each end in the partial stage
+READ_SIZE = 1024 * 1024     # read size of the full hash
+DIGEST = 20                 # blake2b digest bytes
+PROGRESS_EVERY = 0.2        # seconds between live count updates
+CHUNK = 256                 # files per hash task...
+CHUNK_BYTES = 64 * READ_SIZE  # ...or fewer, once they add up to this much reading
+
+def human(n):
+    for unit in ("B", "KB", "MB", "GB"):
+        if n < 1024:
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+    return f"{n:.1f} TB"
+
+class Stats:
+    """Counters shared by the walker and the hash workers."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.stage = "scan"
+        self.dirs = self.files = self.linked = 0
+        self.size_candidates = self.partial_candidates = 0
+        self.hashed = self.partial_bytes = self.full_bytes = 0
+        self.errors = []           # (path, error name, message)
+
+    def error(self, path, exc):
+        with self.lock:
+            message = (exc.strerror or str(exc)) if isinstance(exc, OSError) else str(exc)
+            self.errors.append((path, type(exc).__name__, message))
+
+    def line(self):
+        return (f"[{self.stage}] {self.dirs} dirs, {self.files} files, {self.size_candidates} same size, "
+                f"{self.hashed} hashed ({human(self.partial_bytes + self.full_bytes)}), "
+                f"{len(self.errors)} errors")
+
+# ------------------------
+# Stage 1: one scandir pass, grouped by size
+# ------------------------
+def by_size(roots, stats, min_size=1, follow_links=False, tick=None):
+    """
+    {size: [(path, stat)]} of every file under roots. Only the stat data
+    cached on the DirEntry is used, so no file is opened. Further hard links
+    of a file already seen are counted, not listed: they take no extra space.
+    With follow_links every directory is still read once, so symlink loops end.
+    """
+    sizes = {}
+    inodes = set()
+    seen_dirs = set()
+    stack = list(roots)
+    while stack:
+        if tick:
+            tick()
+        folder = stack.pop()
+        if follow_links:
+            # only followed links can lead back into a directory already read
+            try:
+                st = os.stat(folder)
+            except OSError as e:
+                stats.error(folder, e)
+                continue
+            if (st.st_dev, st.st_ino) in seen_dirs:
+                continue
+            seen_dirs.add((st.st_dev, st.st_ino))
+        try:
+            with os.scandir(folder) as it:
+                entries = list(it)
+        except OSError as e:
+            stats.error(folder, e)
+            continue
+        stats.dirs += 1
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=follow_links):
+                    stack.append(entry.path)
+                    continue
+                if not entry.is_file(follow_symlinks=follow_links):
+                    continue
+                st = entry.stat(follow_symlinks=follow_links)
+            except OSError as e:
+                stats.error(entry.path, e)
+                continue
+            stats.files += 1
+            if st.st_size < min_size:
+                continue
+            key = (st.st_dev, st.st_ino)
+            if key in inodes:
+                stats.linked += 1
+                continue
+            inodes.add(key)
+            sizes.setdefault(st.st_size, []).append((entry.path, st))
+    return sizes
+
+# ------------------------
+# Stage 2 and 3: hashes on a thread pool (hashlib releases the GIL)
+# ------------------------
+def partial_hash(path, size):
+    """Hash of the first and last EDGE bytes (the whole file if it is small)."""
+    h = hashlib.blake2b(digest_size=DIGEST)
+    with open(path, "rb") as fh:
+        if size <= 2 * EDGE:
+            h.update(fh.read())
+        else:
+            h.update(fh.read(EDGE))
+            fh.seek(size - EDGE)
+            h.update(fh.read(EDGE))
+    return h.digest()
+
+def full_hash(path):
+    """Streaming hash of the whole file, read in READ_SIZE chunks into one buffer."""
+    h = hashlib.blake2b(digest_size=DIGEST)
+    buf = bytearray(READ_SIZE)
+    view = memoryview(buf)
+    with open(path, "rb", buffering=0) as fh:
+        while True:
+            n = fh.readinto(buf)
+            if not n:
+                break
+            h.update(view[:n])
+    return h.digest()
+
+def _partial(path, st):
+    return partial_hash(path, st.st_size)
+
+def _full(path, st):
+    return full_hash(path)
+
+def _chunks(groups, cost):
+    # (key, path, stat) items of every group, CHUNK files or CHUNK_BYTES at a time
+    chunk, size = [], 0
+    for key, files in groups.items():
+        for path, st in files:
+            chunk.append((key, path, st))
+            size += cost(st)
+            if len(chunk) >= CHUNK or size >= CHUNK_BYTES:
+                yield chunk
+                chunk, size = [], 0
+    if chunk:
+        yield chunk
+
+def _hash_chunk(fn, chunk, stats):
+    hashed = []
+    for key, path, st in chunk:
+        try:
+            hashed.append((key, fn(path, st), path, st))
+        except OSError as e:
+            stats.error(path, e)
+    return hashed
+
+def _regroup(groups, full, stats, pool, jobs, tick=None):
+    """
+    Split every group by the partial (or full) hash of its files, keeping
+    the sub-groups that still collide. The pool is fed a chunk at a time
+    with at most 2 * jobs chunks in flight, so memory stays flat no matter
+    how many candidates there are.
+    """
+    fn, cost = (_full, lambda st: st.st_size) if full else (_partial, lambda st: min(st.st_size, 2 * EDGE))
+    chunks = _chunks(groups, cost)
+    result = {}
+    inflight = set()
+    while True:
+        for chunk in itertools.islice(chunks, 2 * jobs - len(inflight)):
+            inflight.add(pool.submit(_hash_chunk, fn, chunk, stats))
+        if not inflight:
+            break
+        done, inflight = concurrent.futures.wait(inflight, timeout=PROGRESS_EVERY,
+                                                 return_when=concurrent.futures.FIRST_COMPLETED)
+        for future in done:
+            for key, digest, path, st in future.result():
+                stats.hashed += 1
+                if full:
+                    stats.full_bytes += cost(st)
+                else:
+                    stats.partial_bytes += cost(st)
+                result.setdefault((key, digest), []).append((path, st))
+        if tick:
+            tick()
+    return {k: v for k, v in result.items() if len(v) > 1}
+
+def find_duplicates(roots, min_size=1, jobs=8, follow_links=False, progress=None):
+    """
+    Staged search: one scandir pass groups files by size, files sharing a
+    size get a partial hash of their first and last EDGE bytes, and only
+    files that still collide are hashed in full. Hashing runs on `jobs`
+    threads. Returns (groups, stats); each group is a list of (path, stat)
+    of identical files, oldest first, biggest waste first.
+    """
+    stats = Stats()
+    last = time.monotonic()
+
+    def tick(force=False):
+        nonlocal last
+        if progress and (force or time.monotonic() - last >= PROGRESS_EVERY):
+            last = time.monotonic()
+            progress(stats)
+
+    sizes = by_size(roots, stats, min_size, follow_links, tick)
+    candidates = {size: files for size, files in sizes.items() if len(files) > 1}
+    stats.size_candidates = sum(len(f) for f in candidates.values())
+    with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as pool:
+        stats.stage = "partial"
+        partial = _regroup(candidates, False, stats, pool, jobs, tick)
+        stats.partial_candidates = sum(len(f) for f in partial.values())
+        # files of up to 2 * EDGE bytes were hashed whole already
+        small = {k: v for k, v in partial.items() if k[0] <= 2 * EDGE}
+        big = {k: v for k, v in partial.items() if k[0] > 2 * EDGE}
+        stats.stage = "full"
+        full = _regroup(big, True, stats, pool, jobs, tick)
+    stats.stage = "done"
+    tick(True)
+    groups = list(small.values()) + list(full.values())
+    for files in groups:
+        files.sort(key=lambda f: (f[1].st_mtime, f[0]))     # oldest first
+    groups.sort(key=lambda files: -files[0][1].st_size * (len(files) - 1))
+    return groups, stats
+
+# ------------------------
+# Actions
+# ------------------------
+def _unchanged(path, st):
+    try:
+        now = os.stat(path)
+    except OSError:
+        return False
+    return (now.st_size, now.st_mtime_ns, now.st_ino) == (st.st_size, st.st_mtime_ns, st.st_ino)
+
+def act(groups, action, keep="oldest", dry_run=False, stats=None, log=print):
+    """
+    Hardlink or delete every file of a group except the kept one ('oldest',
+    'newest' or 'first' by path). Files changed since they were hashed are
+    skipped. Returns (files handled, bytes freed).
+    """
+    done = freed = 0
+    for files in groups:
+        if keep == "newest":
+            files = files[::-1]
+        elif keep == "first":
+            files = sorted(files, key=lambda f: f[0])
+        (kept, kept_st), rest = files[0], files[1:]
+        for path, st in rest:
+            if not (_unchanged(path, st) and _unchanged(kept, kept_st)):
+                log(f"skipped (changed since scan): {path}")
+                continue
+            if dry_run:
+                log(f"would {action} {path} -> {kept}")
+            else:
+                try:
+                    if action == "delete":
+                        os.unlink(path)
+                    else:
+                        # link next to the duplicate, then swap it in atomically
+                        tmp = f"{path}.dup_finder.{os.getpid()}"
+                        os.link(kept, tmp)
+                        os.replace(tmp, path)
+                except OSError as e:
+                    if stats is not None:
+                        stats.error(path, e)
+                    log(f"failed: {path}: {e}")
+                    continue
+            done += 1
+            freed += st.st_size
+    return done, freed
+
+# ------------------------
+# Report / command line
+# ------------------------
+def report(groups, stats, elapsed):
+    wasted = sum(files[0][1].st_size * (len(files) - 1) for files in groups)
+    return {
+        "groups": [{"size": files[0][1].st_size, "files": [p for p, _ in files]} for files in groups],
+        "duplicate_files": sum(len(files) - 1 for files in groups),
+        "wasted_bytes": wasted,
+        "scanned": {"dirs": stats.dirs, "files": stats.files, "already_linked": stats.linked},
+        "stages": {
+            "same_size": stats.size_candidates,
+            "same_partial_hash": stats.partial_candidates,
+            "partial_hashed_bytes": stats.partial_bytes,
+            "full_hashed_bytes": stats.full_bytes,
+        },
+        "errors": [{"path": p, "error": f"{name}: {m}"} for p, name, m in stats.errors],
+        "seconds": round(elapsed, 3),
+    }
+
+def show_progress(stats):
+    print("\r" + stats.line(), end="", file=sys.stderr, flush=True)
+
+def print_report(rep, limit=None):
+    for group in rep["groups"][:limit]:
+        print(f"{len(group['files'])} x {human(group['size'])}")
+        for path in group["files"]:
+            print(f"    {path}")
+    if limit is not None and len(rep["groups"]) > limit:
+        print(f"... and {len(rep['groups']) - limit} more groups")
+    s, st = rep["scanned"], rep["stages"]
+    print(f"\n{s['files']} files in {s['dirs']} dirs; {st['same_size']} share a size, "
+          f"{st['same_partial_hash']} share first/last blocks")
+    print(f"hashed {human(st['partial_hashed_bytes'])} partially, {human(st['full_hashed_bytes'])} fully")
+    print(f"{rep['duplicate_files']} duplicate files in {len(rep['groups'])} groups, "
+          f"{human(rep['wasted_bytes'])} wasted ({rep['seconds']}s)")
+    if rep["errors"]:
+        print(f"{len(rep['errors'])} errors:")
+        for e in rep["errors"][:10]:
+            print(f"    {e['path']}: {e['error']}")
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Find duplicate files under one or more folders.")
+    parser.add_argument("paths", nargs="+")
+    parser.add_argument("--min-size", type=int, default=1, help="ignore smaller files (bytes)")
+    parser.add_argument("-j", "--jobs", type=int, default=8, help="hashing threads (default: %(default)s)")
+    parser.add_argument("--follow-links", action="store_true", help="follow symlinks")
+    action = parser.add_mutually_exclusive_group()
+    action.add_argument("--hardlink", action="store_true", help="replace duplicates by hard links")
+    action.add_argument("--delete", action="store_true", help="delete duplicates")
+    parser.add_argument("--keep", choices=("oldest", "newest", "first"), default="oldest",
+                        help="which file of a group is kept (default: %(default)s)")
+    parser.add_argument("-n", "--dry-run", action="store_true", help="show the actions only")
+    parser.add_argument("--json", metavar="FILE", help="write the full report as JSON")
+    parser.add_argument("--show", type=int, default=20, help="groups to list (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    groups, stats = find_duplicates(args.paths, max(0, args.min_size), max(1, args.jobs),
+                                    args.follow_links, show_progress)
+    print(file=sys.stderr)
+    rep = report(groups, stats, time.perf_counter() - start)
+    print_report(rep, args.show)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as fh:
+            json.dump(rep, fh, indent=2)
+    if args.hardlink or args.delete:
+        name = "hardlink" if args.hardlink else "delete"
+        done, freed = act(groups, name, args.keep, args.dry_run, stats)
+        verb = "would free" if args.dry_run else "freed"
+        print(f"{name}: {done} files, {verb} {human(freed)}")
+    return 1 if stats.errors else 0
+
+def interactive():
+    path = input("Enter folder to search for duplicates (or leave blank for current): ").strip() or "."
+    start = time.perf_counter()
+    groups, stats = find_duplicates([path], progress=show_progress)
+    print(file=sys.stderr)
+    print_report(report(groups, stats, time.perf_counter() - start))
+    if not groups:
+        return 0
+    # nothing is touched without seeing the report first
+    answer = input("Replace duplicates by hard links (h), delete them (d) or keep everything (n)? [n]: ")
+    action = {"h": "hardlink", "d": "delete"}.get(answer.strip().lower())
+    if action:
+        done, freed = act(groups, action, stats=stats)
+        print(f"{action}: {done} files, freed {human(freed)}")
+    return 1 if stats.errors else 0
+
+if __name__ == "__main__":
+    # python dup_finder.py ~/Downloads ~/Pictures --hardlink --dry-run
+    sys.exit(main(sys.argv[1:]) if len(sys.argv) > 1 else interactive())
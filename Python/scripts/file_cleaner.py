@@ -1,11 +1,245 @@
+"""Delete temp/log files recursively, with glob, age and size filters and a dry run."""
 import os
-path = input("Enter folder to clean (or leave blank for current): ").strip() or "."
-deleted = 0
-for f in os.listdir(path):
-    if f.endswith((".log", ".tmp")):
+import re
+import sys
+import time
+import fnmatch
+import argparse
+import threading
+import concurrent.futures
+
+DEFAULT_PATTERNS = ("*.log", "*.tmp")
+CHUNK = 512                # paths per delete task
+PROGRESS_EVERY = 0.2       # seconds between live count updates
+UNITS = {"": 1, "k": 1024, "m": 1024 ** 2, "g": 1024 ** 3, "t": 1024 ** 4}
+AGE_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 7 * 86400}
+
+def parse_size(text):
+    """'500', '10K', '1.5M', '2G' -> bytes."""
+    m = re.fullmatch(r"\s*([\d.]+)\s*([kmgt]?)i?b?\s*", text.lower())
+    if not m:
+        raise argparse.ArgumentTypeError(f"bad size: {text}")
+    return int(float(m.group(1)) * UNITS[m.group(2)])
+
+def parse_age(text):
+    """'30s', '15m', '12h', '7d', '2w' (a plain number means days) -> seconds."""
+    m = re.fullmatch(r"\s*([\d.]+)\s*([smhdw]?)\s*", text.lower())
+    if not m:
+        raise argparse.ArgumentTypeError(f"bad age: {text}")
+    return float(m.group(1)) * AGE_UNITS[m.group(2) or "d"]
+
+def human(n):
+    for unit in ("B", "KB", "MB", "GB"):
+        if n < 1024:
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+    return f"{n:.1f} TB"
+
+class Stats:
+    """Counters shared by the walker and the delete workers."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.dirs = self.seen = self.matched = self.matched_bytes = 0
+        self.deleted = self.freed = 0
+        self.errors = []           # (path, error name, message)
+
+    def error(self, path, exc):
+        with self.lock:
+            message = (exc.strerror or str(exc)) if isinstance(exc, OSError) else str(exc)
+            self.errors.append((path, type(exc).__name__, message))
+
+    def line(self, dry_run):
+        done = "would delete" if dry_run else "deleted"
+        count, size = (self.matched, self.matched_bytes) if dry_run else (self.deleted, self.freed)
+        return (f"{self.dirs} dirs, {self.seen} files scanned, {self.matched} matched, "
+                f"{done} {count} ({human(size)}), {len(self.errors)} errors")
+
+# ------------------------
+# Walking
+# ------------------------
+def walk(root, match, stats, recursive=True, min_size=None, max_size=None, older_than=None,
+         skip_dirs=None):
+    """
+    Yield (path, size) of matching files under root. Iterative os.scandir
+    walk: the name filter runs first, and the stat data cached on the
+    DirEntry is only fetched for files whose name matched. Symlinks are
+    never followed or deleted through.
+    """
+    cutoff = time.time() - older_than if older_than is not None else None
+    stack = [root]
+    while stack:
+        folder = stack.pop()
         try:
-            os.remove(os.path.join(path, f))
+            with os.scandir(folder) as it:
+                entries = list(it)
+        except OSError as e:
+            stats.error(folder, e)
+            continue
+        stats.dirs += 1
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive and not (skip_dirs and skip_dirs(entry.name)):
+                        stack.append(entry.path)
+                    continue
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                stats.seen += 1
+                if not match(entry.name):
+                    continue
+                st = entry.stat(follow_symlinks=False)
+            except OSError as e:
+                stats.error(entry.path, e)
+                continue
+            if min_size is not None and st.st_size < min_size:
+                continue
+            if max_size is not None and st.st_size > max_size:
+                continue
+            if cutoff is not None and st.st_mtime > cutoff:
+                continue
+            stats.matched += 1
+            stats.matched_bytes += st.st_size
+            yield entry.path, st.st_size
+
+# ------------------------
+# Deleting
+# ------------------------
+def _delete_chunk(chunk, stats):
+    deleted = freed = 0
+    for path, size in chunk:
+        try:
+            os.unlink(path)
             deleted += 1
-        except Exception:
-            pass
-print("Deleted", deleted, "temp files.")
+            freed += size
+        except OSError as e:
+            stats.error(path, e)
+    with stats.lock:
+        stats.deleted += deleted
+        stats.freed += freed
+
+def clean(root, patterns=DEFAULT_PATTERNS, recursive=True, min_size=None, max_size=None,
+          older_than=None, exclude_dirs=(), dry_run=False, jobs=8, progress=None):
+    """
+    Delete matching files under root on a pool of `jobs` threads (at most
+    2 * jobs chunks in flight, so memory stays flat on huge trees).
+    progress(stats) is called a few times a second. Returns the Stats.
+    """
+    match = re.compile("|".join(fnmatch.translate(p) for p in patterns)).match
+    skip = re.compile("|".join(fnmatch.translate(p) for p in exclude_dirs)).match if exclude_dirs else None
+    stats = Stats()
+    files = walk(root, match, stats, recursive, min_size, max_size, older_than, skip)
+    last = time.monotonic()
+
+    def tick(force=False):
+        nonlocal last
+        if progress and (force or time.monotonic() - last >= PROGRESS_EVERY):
+            last = time.monotonic()
+            progress(stats)
+
+    if dry_run:
+        for _ in files:
+            tick()
+        tick(True)
+        return stats
+    slots = threading.BoundedSemaphore(2 * jobs)
+    inflight = set()
+
+    def finished(future):
+        inflight.discard(future)
+        slots.release()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as pool:
+        def submit(chunk):
+            slots.acquire()
+            future = pool.submit(_delete_chunk, chunk, stats)
+            inflight.add(future)
+            future.add_done_callback(finished)
+
+        chunk = []
+        for item in files:
+            chunk.append(item)
+            if len(chunk) >= CHUNK:
+                submit(chunk)
+                chunk = []
+            tick()
+        if chunk:
+            submit(chunk)
+        while inflight:      # drain, still showing progress
+            concurrent.futures.wait(list(inflight), timeout=PROGRESS_EVERY)
+            tick()
+    tick(True)
+    return stats
+
+def error_report(stats, limit=5):
+    """Errors grouped by kind, with the first few paths of each."""
+    groups = {}
+    for path, name, message in stats.errors:
+        groups.setdefault(f"{name}: {message}", []).append(path)
+    lines = []
+    for kind, paths in sorted(groups.items(), key=lambda kv: -len(kv[1])):
+        lines.append(f"{len(paths):>7}  {kind}")
+        lines.extend(f"         {p}" for p in paths[:limit])
+        if len(paths) > limit:
+            lines.append(f"         ... and {len(paths) - limit} more")
+    return lines
+
+# ------------------------
+# Command line / interactive
+# ------------------------
+def show_progress(dry_run):
+    def show(stats):
+        print("\r" + stats.line(dry_run), end="", file=sys.stderr, flush=True)
+    return show
+
+def finish(stats, dry_run, errors_file=None):
+    print(file=sys.stderr)
+    print(stats.line(dry_run))
+    if stats.errors:
+        print("Errors:")
+        for line in error_report(stats):
+            print(line)
+        if errors_file:
+            with open(errors_file, "w", encoding="utf-8") as fh:
+                for path, name, message in stats.errors:
+                    fh.write(f"{path}\t{name}\t{message}\n")
+            print(f"full error list written to {errors_file}")
+    return 1 if stats.errors else 0
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Delete matching files under a folder.")
+    parser.add_argument("path", nargs="?", default=".")
+    parser.add_argument("-p", "--pattern", action="append",
+                        help="glob for file names, repeatable (default: *.log, *.tmp)")
+    parser.add_argument("--older-than", type=parse_age, metavar="AGE", help="e.g. 7d, 12h (modification time)")
+    parser.add_argument("--min-size", type=parse_size, metavar="SIZE", help="e.g. 10K, 5M")
+    parser.add_argument("--max-size", type=parse_size, metavar="SIZE")
+    parser.add_argument("--exclude-dir", action="append", default=[], metavar="GLOB",
+                        help="do not descend into matching folders, repeatable")
+    parser.add_argument("--no-recursive", action="store_true", help="only the top folder")
+    parser.add_argument("-n", "--dry-run", action="store_true", help="only count what would be deleted")
+    parser.add_argument("-j", "--jobs", type=int, default=8, help="delete threads (default: %(default)s)")
+    parser.add_argument("--errors", metavar="FILE", help="write every error to FILE")
+    args = parser.parse_args(argv)
+    stats = clean(args.path, tuple(args.pattern or DEFAULT_PATTERNS), not args.no_recursive,
+                  args.min_size, args.max_size, args.older_than, tuple(args.exclude_dir),
+                  args.dry_run, max(1, args.jobs), show_progress(args.dry_run))
+    return finish(stats, args.dry_run, args.errors)
+
+def interactive():
+    path = input("Enter folder to clean (or leave blank for current): ").strip() or "."
+    recursive = input("Include subfolders? (y/n) [n]: ").strip().lower() == "y"
+    # count first, then ask: nothing is deleted without seeing the numbers
+    stats = clean(path, recursive=recursive, dry_run=True, progress=show_progress(True))
+    finish(stats, True)
+    if not stats.matched:
+        return 0
+    if input(f"Delete {stats.matched} temp files? (y/n) [n]: ").strip().lower() != "y":
+        return 0
+    stats = clean(path, recursive=recursive, progress=show_progress(False))
+    print("Deleted", stats.deleted, "temp files.")
+    return finish(stats, False)
+
+if __name__ == "__main__":
+    # python file_cleaner.py /var/log/app -p "*.log" --older-than 7d --dry-run
+    sys.exit(main(sys.argv[1:]) if len(sys.argv) > 1 else interactive())
@@ -1,7 +1,24 @@
-import random
+"""Password generator: one interactive password, or millions in bulk (secure random)."""
+import os
+import re
+import sys
+import string
+import secrets
+import argparse
 
 chars = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789'!@#$%^&*(){}[]:;.,~_-+/<>"
 
+# characters that are easy to mix up when read or typed by hand
+AMBIGUOUS = "Il1|O0o'`.,;:"
+CLASSES = {
+    "lower": string.ascii_lowercase,
+    "upper": string.ascii_uppercase,
+    "digit": string.digits,
+    "symbol": "".join(c for c in chars if not c.isalnum()),
+}
+BLOCK_SIZE = 1 << 20          # random bytes read at a time
+BATCH = 4096                  # passwords written per write() call
+
 def generate():
     while True:
         length_input = input("What do you want the length of the password to be: ")
@@ -13,8 +30,99 @@ def generate():
                 print(f"{length} is not valid. Please enter a positive integer.")
             else:
                 break #Exit the loop if valid input is entered.
-    password = "".join(random.choice(chars) for _ in range(length))
+    # secrets, not random: passwords must not be predictable
+    password = "".join(secrets.choice(chars) for _ in range(length))
     return password
 
+# ------------------------
+# Bulk mode
+# ------------------------
+def make_alphabet(exclude_ambiguous=False, exclude=""):
+    """chars without the excluded (and optionally the ambiguous) characters."""
+    drop = set(exclude) | (set(AMBIGUOUS) if exclude_ambiguous else set())
+    return "".join(c for c in chars if c not in drop)
+
+def random_chars(alphabet, block_size=BLOCK_SIZE):
+    """
+    Endless stream of uniformly random alphabet characters, as bytes chunks.
+    Bytes come from secrets.token_bytes (os.urandom) in large blocks; a byte b
+    is kept only if b < 256 - 256 % len(alphabet) and then mapped to
+    alphabet[b % len(alphabet)], so every character is equally likely. The
+    mapping and the rejection are one bytes.translate() call per block.
+    """
+    n = len(alphabet)
+    if not 0 < n <= 256:
+        raise ValueError("alphabet must have 1..256 characters")
+    limit = 256 - 256 % n
+    encoded = alphabet.encode("latin-1")
+    table = bytes(encoded[b % n] if b < limit else 0 for b in range(256))
+    rejected = bytes(range(limit, 256))
+    while True:
+        yield secrets.token_bytes(block_size).translate(table, rejected)
+
+def bulk(count, length, alphabet, required=(), out=None):
+    """
+    Write count passwords of the given length, one per line, to out (a
+    binary file; stdout by default). Passwords missing a character of any
+    required class are dropped and replaced, which keeps the result uniform
+    over all passwords that satisfy the policy.
+    """
+    out = out or sys.stdout.buffer
+    # one lookahead per required class, so each password is checked in a single match() call
+    policy = b"".join(b"(?=.*?[" + re.escape(CLASSES[name].encode()) + b"])" for name in required)
+    check = re.compile(policy, re.S).match if required else None
+    stream = random_chars(alphabet)
+    pending = b""
+    written = 0
+    while written < count:
+        pending += next(stream)
+        usable = len(pending) - len(pending) % length
+        passwords = [pending[i:i + length] for i in range(0, usable, length)]
+        pending = pending[usable:]
+        if check:
+            passwords = [p for p in passwords if check(p)]
+        passwords = passwords[:count - written]
+        for i in range(0, len(passwords), BATCH):
+            out.write(b"\n".join(passwords[i:i + BATCH]) + b"\n")
+        written += len(passwords)
+    out.flush()
+    return written
+
+def bulk_main(argv):
+    parser = argparse.ArgumentParser(prog="Password_Generator.py bulk",
+                                     description="Generate many cryptographically secure passwords.")
+    parser.add_argument("--count", type=int, default=1000, help="number of passwords")
+    parser.add_argument("--length", type=int, default=16)
+    parser.add_argument("--require", default="", metavar="CLASSES",
+                        help="comma separated classes every password must contain: " + ", ".join(CLASSES))
+    parser.add_argument("--no-ambiguous", action="store_true", help="leave out " + AMBIGUOUS)
+    parser.add_argument("--exclude", default="", metavar="CHARS", help="other characters to leave out")
+    parser.add_argument("--out", help="output file (default: stdout)")
+    args = parser.parse_args(argv)
+
+    alphabet = make_alphabet(args.no_ambiguous, args.exclude)
+    required = [c.strip() for c in args.require.split(",") if c.strip()]
+    for name in required:
+        if name not in CLASSES:
+            parser.error(f"unknown class: {name}")
+        if not set(CLASSES[name]) & set(alphabet):
+            parser.error(f"class {name} has no characters left after the exclusions")
+    if args.length < max(1, len(required)):
+        parser.error("length is too short for the required classes")
+    if not alphabet:
+        parser.error("every character was excluded")
+    if args.out:
+        # owner-only: the file holds credentials
+        fd = os.open(args.out, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb", buffering=BLOCK_SIZE) as out:
+            bulk(args.count, args.length, alphabet, required, out)
+        print(f"{args.count} passwords written to {args.out}", file=sys.stderr)
+    else:
+        bulk(args.count, args.length, alphabet, required)
+    return 0
+
 if __name__ == "__main__":
+    # python Password_Generator.py bulk --count 1000000 --length 20 --require lower,upper,digit
+    if sys.argv[1:2] == ["bulk"]:
+        sys.exit(bulk_main(sys.argv[2:]))
     print("Your generated password is:", generate())
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+PythonHub animation.py
+Non-blocking loading animations:
+- each style (spinner/progress/diagonal/dots) is a generator of frames
+- running() draws it on a background thread while the caller does the
+  real work, and stops it as soon as that work is finished
+- min_duration keeps very fast work from flashing the animation; with the
+  default of 0 an animation costs no time at all
+- frames are written straight to the terminal, so once one was drawn the
+  next screen.py frame is redrawn in full
+"""
+
+import sys
+import time
+import threading
+
+import screen
+
+KINDS = ("spinner", "progress", "diagonal", "dots", "none")
+RESET = "\u001b[0m"
+
+# ------------------------
+# Frame generators: yield (text, seconds until next frame)
+# ------------------------
+def spinner_frames(text="Loading", speed=0.10):
+    frames = ["|", "/", "-", "\\"]
+    while True:
+        for f in frames:
+            yield f"\r{text} {f}", speed
+
+def progress_frames(text="Loading", length=24, speed=0.03):
+    # work length is unknown, so the bar keeps filling and wrapping around
+    while True:
+        for i in range(length + 1):
+            filled = "#" * i
+            empty = "-" * (length - i)
+            pct = int((i / length) * 100)
+            yield f"\r{text}: [{filled}{empty}] {pct}%", speed
+
+def diagonal_frames(text="Loading", lines=8, speed=0.08):
+    while True:
+        for i in range(lines):
+            yield "\u001b[H\u001b[2J" + "\n" * i + " " * (i * 2) + "•", speed
+
+def dots_frames(text="Loading", speed=0.4):
+    while True:
+        for i in range(1, 4):
+            yield f"\r{text}{'.' * i}   ", speed
+
+def _frames_for(kind, text, speed):
+    makers = {
+        "spinner": spinner_frames,
+        "progress": progress_frames,
+        "diagonal": diagonal_frames,
+        "dots": dots_frames,
+    }
+    maker = makers.get(kind, dots_frames)
+    return maker(text) if speed is None else maker(text, speed=speed)
+
+def _final_for(kind, text):
+    if kind == "progress":
+        return f"\r{text}: [{'#' * 24}] 100%\n"
+    if kind == "diagonal":
+        return "\u001b[H\u001b[2J"
+    return "\r" + " " * (len(text) + 6) + "\r"
+
+# ------------------------
+# Runner
+# ------------------------
+class running:
+    """
+    Context manager: animate while the body runs.
+
+        with animation.running("spinner", "Opening"):
+            do_real_work()
+    """
+
+    def __init__(self, kind="spinner", text="Loading", min_duration=0.0, speed=None, out=None):
+        self.kind = kind
+        self.text = text
+        self.min_duration = max(0.0, float(min_duration or 0))
+        self.speed = speed
+        self.out = out or sys.stdout
+        self._stop = threading.Event()
+        self._thread = None
+        self._start = 0.0
+
+    def _draw(self):
+        for frame, delay in _frames_for(self.kind, self.text, self.speed):
+            self.out.write(frame)
+            self.out.flush()
+            if self._stop.wait(delay):
+                break
+
+    def __enter__(self):
+        self._start = time.monotonic()
+        if self.kind != "none":
+            self._thread = threading.Thread(target=self._draw, name="animation", daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        remaining = self.min_duration - (time.monotonic() - self._start)
+        if remaining > 0 and exc[0] is None:
+            time.sleep(remaining)
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self.out.write(_final_for(self.kind, self.text) + RESET)
+            self.out.flush()
+            screen.invalidate()
+        return False
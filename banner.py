@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+PythonHub banner.py
+Cached figlet banners:
+- rendered banners are keyed by title, font, color codes and terminal
+  width, so editing a theme's colors never serves a stale banner
+- kept in memory and in .cache/banners.json, so a banner is only laid out
+  once per change and every redraw is a plain write
+- pyfiglet is imported only on a cache miss (plain text if it is missing)
+"""
+
+import os
+import json
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(ROOT, ".cache")
+BANNER_FILE = os.path.join(CACHE_DIR, "banners.json")
+MAX_ENTRIES = 64
+
+_cache = None
+
+def _load():
+    global _cache
+    if _cache is None:
+        try:
+            with open(BANNER_FILE, "r", encoding="utf-8") as fh:
+                _cache = json.load(fh)
+        except (OSError, ValueError):
+            _cache = {}
+    return _cache
+
+def _save():
+    # keep only the newest entries (dicts preserve insertion order)
+    while len(_cache) > MAX_ENTRIES:
+        del _cache[next(iter(_cache))]
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp = BANNER_FILE + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(_cache, fh)
+        os.replace(tmp, BANNER_FILE)
+    except OSError:
+        pass
+
+def _figlet(text, font, width):
+    try:
+        import pyfiglet
+    except ImportError:
+        return None
+    try:
+        return pyfiglet.figlet_format(text, font=font, width=width)
+    except pyfiglet.FontNotFound:
+        return pyfiglet.figlet_format(text, width=width)
+
+def render(text, font, width, color="", reset=""):
+    """Return the colored figlet banner for text, computing it only on a miss."""
+    cache = _load()
+    key = "\0".join((text, font, color, reset, str(width)))
+    out = cache.get(key)
+    if out is None:
+        art = _figlet(text, font, width)
+        if art is None:
+            # no pyfiglet: plain title, kept out of the disk cache
+            return color + text + "\n" + reset
+        out = color + art + reset
+        cache[key] = out
+        _save()
+    return out
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+PythonHub benchmarks/bench_hub.py
+Times the launchers' hot paths against synthetic hubs of different sizes:
+- category scan / folder listing (catalog.py, cold and warm)
+- full menu redraw: print_header + listing, in full and as a diff
+- launch overhead of run_script_interactive vs run_script_captured
+  (warm pool and fresh interpreter)
+- captured output throughput in MB/s
+- README generation and type-ahead search
+Synthetic trees and every cache live in a temp dir; the real hub is not
+touched. Results are written as JSON so two commits can be compared:
+
+    python benchmarks/bench_hub.py --sizes 10,1000,50000
+    python benchmarks/bench_hub.py --compare benchmarks/results/bench-<old>.json
+"""
+
+import os
+import io
+import sys
+import json
+import time
+import shutil
+import tempfile
+import argparse
+import platform
+import statistics
+import subprocess
+import contextlib
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import capture
+import catalog
+import runner
+import scriptmeta
+import screen
+import telemetry
+
+RESULTS_DIR = os.path.join(ROOT, "benchmarks", "results")
+DEFAULT_SIZES = (10, 1000, 50000)
+FILES_PER_CATEGORY = 500
+THROUGHPUT_MB = 32
+
+SCRIPT_TEMPLATE = '"""Synthetic script {n} for the {cat} category."""\nprint("script {n}")\n'
+WRITER = (
+    "import sys\n"
+    "block = b'x' * 65535 + b'\\n'\n"
+    "for _ in range({blocks}):\n"
+    "    sys.stdout.buffer.write(block)\n"
+)
+
+# ------------------------
+# Helpers
+# ------------------------
+def measure(fn, repeat=5, setup=None):
+    """Run fn repeat times; returns {"min", "median", "max"} in milliseconds."""
+    times = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start) * 1000)
+    return {"min": round(min(times), 3), "median": round(statistics.median(times), 3),
+            "max": round(max(times), 3)}
+
+def make_tree(base, count):
+    """Create Python/<category>/<script>.py files, FILES_PER_CATEGORY per category."""
+    py = os.path.join(base, "Python")
+    categories = max(1, -(-count // FILES_PER_CATEGORY))
+    for c in range(categories):
+        cat = f"category_{c:03d}"
+        folder = os.path.join(py, cat)
+        os.makedirs(folder)
+        for n in range(c * FILES_PER_CATEGORY, min(count, (c + 1) * FILES_PER_CATEGORY)):
+            with open(os.path.join(folder, f"script_{n:05d}.py"), "w") as fh:
+                fh.write(SCRIPT_TEMPLATE.format(n=n, cat=cat))
+    # age the directories past catalog.MTIME_SLACK, like a hub that is not being edited
+    settled = time.time() - 60
+    for folder in [py] + [os.path.join(py, d) for d in os.listdir(py)]:
+        os.utime(folder, (settled, settled))
+    return py
+
+def isolate_caches(cache_dir):
+    """Point every persistent cache at cache_dir and reset the in-memory state."""
+    catalog.CACHE_DIR = cache_dir
+    catalog.CATALOG_FILE = os.path.join(cache_dir, "catalog.json")
+    scriptmeta.CACHE_DIR = cache_dir
+    scriptmeta.META_FILE = os.path.join(cache_dir, "scriptmeta.json")
+    scriptmeta.MODULES_FILE = os.path.join(cache_dir, "modules.json")
+    reset_catalog()
+
+def reset_catalog():
+    with catalog._lock:
+        catalog._index.clear()
+        catalog._loaded = False
+        catalog._dirty = False
+
+@contextlib.contextmanager
+def quiet():
+    """Send stdout (menu frames, script echo) to a sink."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+def git_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                             capture_output=True, text=True, check=True)
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+# ------------------------
+# Benchmarks per tree size
+# ------------------------
+def bench_tree(size, repeat):
+    import menu2
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="pyhub-bench-") as base:
+        start = time.perf_counter()
+        py = make_tree(base, size)
+        results["generate_tree_s"] = round(time.perf_counter() - start, 3)
+        cache_dir = os.path.join(base, ".cache")
+        isolate_caches(cache_dir)
+        menu2.PY_CONTENT = py
+        menu2.ROOT = base
+        first = menu2.scan_categories()[0]
+
+        def list_everything():
+            for cat in menu2.scan_categories():
+                menu2.list_folder_files(cat)
+
+        # cold: no in-memory index and no cache file, every directory is read
+        def cold_setup():
+            reset_catalog()
+            shutil.rmtree(cache_dir, ignore_errors=True)
+        results["scan_categories_cold"] = measure(menu2.scan_categories, repeat, cold_setup)
+        results["list_all_folders_cold"] = measure(list_everything, repeat, cold_setup)
+        # restart: index loaded back from .cache/catalog.json
+        list_everything()
+        catalog.save()
+        results["list_all_folders_from_cache_file"] = measure(list_everything, repeat, reset_catalog)
+        list_everything()
+        results["scan_categories_warm"] = measure(menu2.scan_categories, repeat)
+        results["list_folder_files_warm"] = measure(lambda: menu2.list_folder_files(first), repeat)
+
+        def redraw(full):
+            def draw():
+                if full:
+                    screen.invalidate()
+                menu2.print_header()
+                screen.echo(menu2.tpl(menu2.TEXT).format(f"[ {first} ]"))
+                item = menu2.tpl(menu2.ITEM)
+                for i, f in enumerate(menu2.list_folder_files(first), 1):
+                    screen.echo(item.format(i, f))
+                screen.flush()
+            return draw
+        with quiet():
+            results["redraw_full"] = measure(redraw(True), repeat)
+            results["redraw_diff"] = measure(redraw(False), repeat)
+            results["readme_generation"] = measure(menu2.update_readme_auto, repeat)
+
+        import search
+        search._index = None
+        results["search_index_build"] = measure(
+            lambda: search.Index(py, menu2.IGNORE_LIST), max(1, repeat // 2))
+        index = search.get_index(py, menu2.IGNORE_LIST)
+        results["search_query_hit"] = measure(lambda: index.query("script_0", 12), repeat)
+        results["search_query_miss"] = measure(lambda: index.query("zzqx", 12), repeat)
+    reset_catalog()
+    return results
+
+# ------------------------
+# Launch benchmarks (tree size does not matter)
+# ------------------------
+def bench_launch(repeat):
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="pyhub-bench-") as base:
+        noop = os.path.join(base, "noop.py")
+        with open(noop, "w") as fh:
+            fh.write("pass\n")
+        writer = os.path.join(base, "writer.py")
+        with open(writer, "w") as fh:
+            fh.write(WRITER.format(blocks=THROUGHPUT_MB * 16))
+        # keep benchmark launches out of the hub's run statistics
+        telemetry.CACHE_DIR = base
+        telemetry.DB_FILE = os.path.join(base, "telemetry.db")
+
+        def interactive(mode):
+            # run_script_interactive: inherited stdio (a sink here), just wait
+            return lambda: runner.wait(runner.spawn(noop, mode=mode, stdout=subprocess.DEVNULL))
+
+        def captured(mode, path=noop):
+            # run_script_captured: pipes pumped through capture.stream
+            def run():
+                proc = runner.spawn(path, mode=mode, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+                with capture.stream(proc, echo=False):
+                    pass
+            return run
+
+        for mode in runner.LAUNCH_MODES:
+            if mode == "warm":
+                runner.warm_up("warm")
+                if not runner.ready("warm"):
+                    results["warm"] = "unavailable"
+                    continue
+            results[f"launch_interactive_{mode}"] = measure(interactive(mode), repeat)
+            results[f"launch_captured_{mode}"] = measure(captured(mode), repeat)
+        timing = measure(captured("fresh", writer), max(1, repeat // 2))
+        results["captured_throughput_mb_s"] = round(THROUGHPUT_MB / (timing["median"] / 1000), 1)
+        runner.shutdown()
+        telemetry.flush()
+    return results
+
+# ------------------------
+# Reporting
+# ------------------------
+def flatten(results, prefix=""):
+    """{"a": {"b": {"median": x}}} -> {"a.b": x} for every median / plain number."""
+    flat = {}
+    for key, value in results.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict) and "median" in value:
+            flat[name] = value["median"]
+        elif isinstance(value, dict):
+            flat.update(flatten(value, name + "."))
+        elif isinstance(value, (int, float)):
+            flat[name] = value
+    return flat
+
+def compare(old, new):
+    old_flat, new_flat = flatten(old["results"]), flatten(new["results"])
+    print(f"\n{'metric':<52} {old['commit']:>10} {new['commit']:>10}  change")
+    for name, value in new_flat.items():
+        before = old_flat.get(name)
+        if before is None:
+            continue
+        change = f"{(value - before) / before * 100:+.1f}%" if before else ""
+        print(f"{name:<52} {before:>10} {value:>10}  {change}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the hub's hot paths on synthetic trees.")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="comma separated script counts (default: %(default)s)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--skip-launch", action="store_true", help="skip the process launch benchmarks")
+    parser.add_argument("--out", help="result file (default: benchmarks/results/bench-<commit>.json)")
+    parser.add_argument("--compare", metavar="OLD", help="print the change against an older result file")
+    args = parser.parse_args(argv)
+
+    commit = git_commit()
+    report = {
+        "commit": commit,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "results": {},
+    }
+    for size in (int(s) for s in args.sizes.split(",") if s.strip()):
+        print(f"tree with {size} scripts ...", flush=True)
+        report["results"][f"tree_{size}"] = bench_tree(size, args.repeat)
+    if not args.skip_launch:
+        print("launch overhead ...", flush=True)
+        report["results"]["launch"] = bench_launch(args.repeat)
+
+    for name, value in flatten(report["results"]).items():
+        print(f"  {name:<52} {value}")
+    out = args.out or os.path.join(RESULTS_DIR, f"bench-{commit}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    with open(out, "w", encoding="utf-8") as fh:
+        json.dump(report, fh, indent=2)
+    print(f"results written to {out}")
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as fh:
+            compare(json.load(fh), report)
+
+if __name__ == "__main__":
+    main()
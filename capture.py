@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+PythonHub capture.py
+Streaming, memory-bounded output capture for launched scripts:
+- stdout/stderr are teed live to the terminal while the script runs
+- everything is spooled to anonymous temp files, not kept in memory
+- only the last few stderr lines stay in RAM for the error summary
+- the full output is read back lazily, chunk by chunk, on request
+"""
+
+import os
+import sys
+import tempfile
+import threading
+from collections import deque
+
+import runner
+
+CHUNK_SIZE = 64 * 1024
+TAIL_LINES = 10
+# longest partial stderr line we keep while waiting for its newline
+MAX_PARTIAL = 4096
+
+class _Stream:
+    """One captured pipe: spool file, byte count and optional line tail."""
+
+    def __init__(self, pipe, echo, tail_lines):
+        self.pipe = pipe
+        self.echo = echo
+        self.spool = tempfile.TemporaryFile(prefix="pyhub-capture-")
+        self.nbytes = 0
+        self.tail = deque(maxlen=tail_lines) if tail_lines else None
+        self._partial = b""
+        self.thread = threading.Thread(target=self._pump, daemon=True)
+
+    def _pump(self):
+        fd = self.pipe.fileno()
+        while True:
+            try:
+                chunk = os.read(fd, CHUNK_SIZE)
+            except OSError:
+                break
+            if not chunk:
+                break
+            self.nbytes += len(chunk)
+            self.spool.write(chunk)
+            if self.echo is not None:
+                try:
+                    self.echo.write(chunk)
+                    self.echo.flush()
+                except (OSError, ValueError):
+                    self.echo = None
+            if self.tail is not None:
+                self._collect_lines(chunk)
+        if self.tail is not None and self._partial:
+            self.tail.append(self._partial)
+            self._partial = b""
+        self.pipe.close()
+        self.spool.flush()
+
+    def _collect_lines(self, chunk):
+        lines = (self._partial + chunk).split(b"\n")
+        self._partial = lines.pop()[-MAX_PARTIAL:]
+        # only the last tail_lines complete lines can survive in the deque
+        self.tail.extend(lines[-self.tail.maxlen:])
+
+class CapturedRun:
+    """Result of a streamed run; full output stays on disk until read."""
+
+    def __init__(self, returncode, out, err, limit=None):
+        self.returncode = returncode
+        self.limit = limit      # resource limit the run hit (limits.py), or None
+        self._out = out
+        self._err = err
+
+    @property
+    def stdout_bytes(self):
+        return self._out.nbytes
+
+    @property
+    def stderr_bytes(self):
+        return self._err.nbytes
+
+    def stderr_tail(self):
+        """Last TAIL_LINES lines of stderr, decoded."""
+        return [line.decode("utf-8", "replace").rstrip("\r") for line in self._err.tail]
+
+    def _iter_spool(self, stream):
+        stream.spool.seek(0)
+        while True:
+            chunk = stream.spool.read(CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
+    def iter_stdout(self):
+        return self._iter_spool(self._out)
+
+    def iter_stderr(self):
+        return self._iter_spool(self._err)
+
+    def dump(self, which, fh=None):
+        """Copy the spooled 'stdout' or 'stderr' to a binary file (terminal by default)."""
+        fh = fh or sys.stdout.buffer
+        stream = self._out if which == "stdout" else self._err
+        for chunk in self._iter_spool(stream):
+            fh.write(chunk)
+        fh.flush()
+
+    def close(self):
+        self._out.spool.close()
+        self._err.spool.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def stream(proc, echo=True, tail_lines=TAIL_LINES):
+    """
+    Pump proc.stdout/proc.stderr (binary pipes) until EOF, teeing to the
+    terminal when echo is set, then reap the process with runner.wait()
+    (which also records the run in telemetry.py).
+    """
+    out = _Stream(proc.stdout, sys.stdout.buffer if echo else None, 0)
+    err = _Stream(proc.stderr, sys.stderr.buffer if echo else None, tail_lines)
+    sys.stdout.flush()
+    out.thread.start()
+    err.thread.start()
+    for thread in (out.thread, err.thread):
+        while thread.is_alive():
+            thread.join(0.25)
+            # a script killed by a limit may leave children holding the pipes
+            if thread.is_alive():
+                runner.kill_leftovers(proc)
+    tail = [line.decode("utf-8", "replace") for line in err.tail or ()]
+    returncode = runner.wait(proc, out.nbytes, err.nbytes, tail)
+    return CapturedRun(returncode, out, err, getattr(proc, "limit_hit", None))
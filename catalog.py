@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+PythonHub catalog.py
+Persistent, change-aware index of the hub's directories:
+- every directory listing is cached in memory and in .cache/catalog.json
+- a listing is only re-read when the directory's mtime changes
+- an optional polling watcher keeps the index fresh in the background,
+  so menus read straight from memory without touching the disk
+- shared by menu2.py, menu_done.py and main.py
+"""
+
+import os
+import json
+import time
+import atexit
+import threading
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+PY_CONTENT = os.path.join(ROOT, "Python")
+CACHE_DIR = os.path.join(ROOT, ".cache")
+CATALOG_FILE = os.path.join(CACHE_DIR, "catalog.json")
+CATALOG_VERSION = 1
+
+# A directory modified within this many seconds of being scanned may still
+# change inside the same mtime tick (coarse timestamps on FAT/flash storage),
+# so such entries are re-checked on the next lookup instead of being trusted.
+MTIME_SLACK = 2.0
+# the index file is rewritten at most this often (seconds) while scanning;
+# anything newer is written by stop_watcher() or at exit
+SAVE_INTERVAL = 1.0
+
+_lock = threading.RLock()
+_index = {}        # abs dir path -> {"mtime": ns, "scanned": ts, "dirs": [...], "files": [...]}
+_loaded = False
+_dirty = False
+_watcher = None
+_generation = 0    # bumped whenever a listing's contents change
+_last_save = 0.0
+
+# ------------------------
+# Persistence
+# ------------------------
+def _load():
+    global _loaded
+    if _loaded:
+        return
+    _loaded = True
+    try:
+        with open(CATALOG_FILE, "r", encoding="utf-8") as fh:
+            data = json.load(fh)
+        if data.get("version") == CATALOG_VERSION:
+            _index.update(data.get("dirs", {}))
+    except (OSError, ValueError):
+        pass
+
+def save():
+    """Write the index to disk if it changed since the last save."""
+    global _dirty, _last_save
+    with _lock:
+        if not _dirty:
+            return
+        _last_save = time.monotonic()
+        data = {"version": CATALOG_VERSION, "dirs": _index}
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            tmp = CATALOG_FILE + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as fh:
+                json.dump(data, fh)
+            os.replace(tmp, CATALOG_FILE)
+            _dirty = False
+        except OSError:
+            pass
+
+atexit.register(save)
+
+# ------------------------
+# Scanning
+# ------------------------
+def _scan(path, mtime):
+    dirs, files = [], []
+    with os.scandir(path) as it:
+        for entry in it:
+            try:
+                (dirs if entry.is_dir() else files).append(entry.name)
+            except OSError:
+                continue
+    dirs.sort()
+    files.sort()
+    return {"mtime": mtime, "scanned": time.time(), "dirs": dirs, "files": files}
+
+def _fresh(entry, mtime):
+    if entry is None or entry["mtime"] != mtime:
+        return False
+    # listing taken in the same tick as the last change: don't trust it yet
+    return entry["scanned"] - mtime / 1e9 > MTIME_SLACK
+
+def _entry(path, trust_watcher=True):
+    """Return the cached listing for path, rescanning only if it changed."""
+    global _dirty, _generation
+    path = os.path.abspath(path)
+    with _lock:
+        _load()
+        entry = _index.get(path)
+        if entry is not None and trust_watcher and _watcher is not None and _watcher.covers(path):
+            return entry
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            if _index.pop(path, None) is not None:
+                _dirty = True
+                _generation += 1
+            return None
+        if _fresh(entry, mtime):
+            return entry
+        try:
+            new = _scan(path, mtime)
+        except OSError:
+            return None
+        if entry is None or entry["dirs"] != new["dirs"] or entry["files"] != new["files"]:
+            _generation += 1
+        _index[path] = new
+        _dirty = True
+    if time.monotonic() - _last_save >= SAVE_INTERVAL:
+        save()
+    return new
+
+def generation():
+    """Counter that changes whenever any indexed listing changed; cheap to poll."""
+    return _generation
+
+def refresh(path=None):
+    """Drop the cached listing for path (or everything) so it is re-read."""
+    global _dirty, _generation
+    with _lock:
+        _load()
+        if path is None:
+            _index.clear()
+        else:
+            _index.pop(os.path.abspath(path), None)
+        _dirty = True
+        _generation += 1
+
+# ------------------------
+# Public lookups
+# ------------------------
+def list_dirs(path):
+    """Sorted names of the subdirectories of path ([] if missing)."""
+    entry = _entry(path)
+    return list(entry["dirs"]) if entry else []
+
+def list_files(path, extensions=None):
+    """Sorted names of the files in path, optionally filtered by extension."""
+    entry = _entry(path)
+    if not entry:
+        return []
+    files = entry["files"]
+    if extensions:
+        files = [f for f in files if f.endswith(tuple(extensions))]
+    return list(files)
+
+def categories(root=PY_CONTENT, ignore=()):
+    """Category folders under root, skipping hidden names and the ignore list."""
+    return [d for d in list_dirs(root) if d not in ignore and not d.startswith(".")]
+
+def scripts(category, extensions=(".py", ".md"), root=PY_CONTENT):
+    """Visible files with the given extensions inside a category."""
+    return [f for f in list_files(os.path.join(root, category), extensions) if not f.startswith(".")]
+
+# ------------------------
+# Polling watcher
+# ------------------------
+class _Watcher(threading.Thread):
+    """
+    Background thread that stats every known directory under its roots once
+    per interval and rescans only those whose mtime moved. While it runs,
+    lookups under those roots are served from memory with no syscalls.
+    """
+
+    def __init__(self, roots, interval):
+        super().__init__(name="catalog-watcher", daemon=True)
+        self.roots = [os.path.abspath(r) for r in roots]
+        self.interval = interval
+        self._stop_event = threading.Event()
+
+    def covers(self, path):
+        return any(path == r or path.startswith(r + os.sep) for r in self.roots)
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            with _lock:
+                known = [p for p in _index if self.covers(p)]
+            for path in known:
+                try:
+                    mtime = os.stat(path).st_mtime_ns
+                except OSError:
+                    mtime = None
+                with _lock:
+                    entry = _index.get(path)
+                    stale = mtime is None or not _fresh(entry, mtime)
+                if stale:
+                    _entry(path, trust_watcher=False)
+
+    def stop(self):
+        self._stop_event.set()
+
+def start_watcher(roots=(PY_CONTENT,), interval=2.0):
+    """Start the polling watcher (idempotent). Returns the watcher thread."""
+    global _watcher
+    with _lock:
+        if _watcher is None:
+            # make sure every directory we are about to trust is indexed
+            for root in roots:
+                _entry(root)
+                for d in list_dirs(root):
+                    _entry(os.path.join(root, d))
+            _watcher = _Watcher(roots, interval)
+            _watcher.start()
+        return _watcher
+
+def stop_watcher():
+    global _watcher
+    with _lock:
+        if _watcher is not None:
+            _watcher.stop()
+            _watcher = None
+    save()
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+PythonHub hubcli.py
+Headless command line entry point (no banner, no animation, no menus):
+- list                       categories, or the scripts of one category
+                             (scripts that cannot run are flagged)
+- run <category>/<script>    run one or more scripts
+- run --all <category>       run every .py script of a category
+Scripts run concurrently on a bounded pool (--jobs) with stdin closed; exit
+codes, durations and captured output are collected into a summary that can
+be written as JSON (--json) and as a JUnit-style XML report (--junit).
+Scripts that fail the static preflight (scriptmeta.problems: syntax error,
+missing module) are reported as errors without being started.
+The exit status is 0 only if every script succeeded.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import subprocess
+import concurrent.futures
+from xml.etree import ElementTree as ET
+
+import capture
+import catalog
+import hubconfig
+import limits
+import resultcache
+import runner
+import scriptmeta
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+PY_CONTENT = catalog.PY_CONTENT
+# same folders/files the menus hide
+IGNORE_LIST = {"themes", "sounds", "menu.py", "config.txt", "README.md", "settings.txt", "update_readme.py"}
+# captured output kept per script in the summary (the end is kept)
+OUTPUT_LIMIT = 64 * 1024
+
+# ------------------------
+# Selecting scripts
+# ------------------------
+def resolve(targets, run_all=False):
+    """
+    Turn 'category/script' (or category names with run_all) into (category, name)
+    pairs. Only scripts the catalog lists are accepted, so a target can never
+    point outside Python/ (e.g. games/../../x.py).
+    """
+    selected = []
+    categories = catalog.categories(PY_CONTENT, IGNORE_LIST)
+    for target in targets:
+        target = target.strip("/")
+        if run_all:
+            cat = target
+            if cat not in categories:
+                raise ValueError(f"unknown category: {cat}")
+            selected.extend((cat, name) for name in catalog.scripts(cat, (".py",), PY_CONTENT))
+            continue
+        cat, _, name = target.partition("/")
+        if not name:
+            raise ValueError(f"expected <category>/<script>, got: {target}")
+        if not name.endswith(".py"):
+            name += ".py"
+        if cat not in categories or name not in catalog.scripts(cat, (".py",), PY_CONTENT):
+            raise ValueError(f"no such script: {cat}/{name}")
+        selected.append((cat, name))
+    # keep the first occurrence of each script
+    return list(dict.fromkeys(selected))
+
+# ------------------------
+# Running
+# ------------------------
+def _tail(chunks, limit=OUTPUT_LIMIT):
+    data = b""
+    for chunk in chunks:
+        data = (data + chunk)[-limit:]
+    return data.decode("utf-8", "replace")
+
+def _replay(record, hit):
+    stdout, stderr = hit.read("stdout"), hit.read("stderr")
+    record.update(returncode=hit.returncode, stdout_bytes=len(stdout), stderr_bytes=len(stderr),
+                  stdout=_tail([stdout]), stderr=_tail([stderr]), error=None, cached=True)
+
+def run_one(cat, name, mode="fresh", pristine=(), cache=None, refresh=False, timeout=None):
+    """
+    Run one script headless and return its result record. cache is
+    (cached scripts, ttl) from resultcache.options(), or None to never use it;
+    timeout overrides the script's timeout from settings.txt (0 = none).
+    """
+    path = os.path.join(PY_CONTENT, cat, name)
+    cwd = os.path.dirname(path)
+    record = {"category": cat, "script": name, "path": path, "cached": False, "limit": None}
+    start = time.monotonic()
+    key = None
+    if cache is not None and resultcache.is_cacheable(path, cache[0]):
+        key = resultcache.cache_key(path, cwd=cwd)
+        hit = None if refresh else resultcache.lookup(key, cache[1])
+        if hit is not None:
+            _replay(record, hit)
+            record["duration"] = round(time.monotonic() - start, 4)
+            record["ok"] = record["returncode"] == 0
+            return record
+    problems = scriptmeta.problems(path)
+    if problems:
+        record.update(returncode=None, stdout_bytes=0, stderr_bytes=0, stdout="", stderr="",
+                      error="preflight: " + "; ".join(problems))
+        record["duration"] = round(time.monotonic() - start, 4)
+        record["ok"] = False
+        return record
+    policy = limits.policy_for(path)
+    if timeout is not None:
+        policy.pop("timeout", None)
+        if timeout:
+            policy["timeout"] = timeout
+    try:
+        proc = runner.spawn(path, mode=mode, pristine=pristine, stdin=subprocess.DEVNULL,
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                            cwd=cwd, policy=policy)
+        with capture.stream(proc, echo=False) as result:
+            if key is not None:
+                resultcache.store(key, path, result, cache[1])
+            record.update(
+                returncode=result.returncode,
+                stdout_bytes=result.stdout_bytes,
+                stderr_bytes=result.stderr_bytes,
+                stdout=_tail(result.iter_stdout()),
+                stderr=_tail(result.iter_stderr()),
+                error=None,
+                limit=result.limit,
+            )
+    except (subprocess.SubprocessError, OSError) as e:
+        record.update(returncode=None, stdout_bytes=0, stderr_bytes=0,
+                      stdout="", stderr="", error=str(e), limit=None)
+    record["duration"] = round(time.monotonic() - start, 4)
+    record["ok"] = record["returncode"] == 0
+    return record
+
+def run_many(selected, jobs=None, mode="fresh", pristine=(), progress=None, cache=None, refresh=False,
+             timeout=None):
+    """Run (category, name) pairs on a pool of `jobs` workers; results keep the input order."""
+    jobs = max(1, jobs or os.cpu_count() or 1)
+    runner.ready(mode)
+    results = [None] * len(selected)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = {pool.submit(run_one, cat, name, mode, pristine, cache, refresh, timeout): i
+                   for i, (cat, name) in enumerate(selected)}
+        for future in concurrent.futures.as_completed(futures):
+            record = future.result()
+            results[futures[future]] = record
+            if progress:
+                progress(record)
+    return results
+
+# ------------------------
+# Reports
+# ------------------------
+def summarize(results, wall):
+    passed = sum(1 for r in results if r["ok"])
+    return {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "interpreter": sys.executable,
+        "total": len(results),
+        "passed": passed,
+        "failed": len(results) - passed,
+        "wall_time": round(wall, 4),
+        "results": results,
+    }
+
+def write_json(summary, path):
+    hubconfig.atomic_write(path, json.dumps(summary, indent=2))
+
+def write_junit(summary, path):
+    suites = ET.Element("testsuites", tests=str(summary["total"]),
+                        failures=str(summary["failed"]), time=str(summary["wall_time"]))
+    by_cat = {}
+    for r in summary["results"]:
+        by_cat.setdefault(r["category"], []).append(r)
+    for cat, records in by_cat.items():
+        suite = ET.SubElement(suites, "testsuite", name=cat, tests=str(len(records)),
+                              failures=str(sum(1 for r in records if not r["ok"])),
+                              time=str(round(sum(r["duration"] for r in records), 4)))
+        for r in records:
+            case = ET.SubElement(suite, "testcase", classname=cat, name=r["script"],
+                                 time=str(r["duration"]))
+            if not r["ok"]:
+                message = r["error"] or r["limit"] or f"exit code {r['returncode']}"
+                failure = ET.SubElement(case, "failure", message=message)
+                failure.text = "\n".join(r["stderr"].splitlines()[-capture.TAIL_LINES:])
+            ET.SubElement(case, "system-out").text = r["stdout"]
+            ET.SubElement(case, "system-err").text = r["stderr"]
+    ET.indent(suites)
+    hubconfig.atomic_write(path, ET.tostring(suites, encoding="unicode", xml_declaration=True) + "\n")
+
+def _print_record(r):
+    status = "ok" if r["ok"] else (r["error"] or r["limit"] or f"exit {r['returncode']}")
+    if r["cached"]:
+        status += " (cached)"
+    label = f"{r['category']}/{r['script']}"
+    print(f"{label:<40} {r['duration']:8.3f}s  {status}", flush=True)
+
+# ------------------------
+# Commands
+# ------------------------
+def cmd_list(args):
+    if args.category:
+        if args.category not in catalog.categories(PY_CONTENT, IGNORE_LIST):
+            print(f"unknown category: {args.category}", file=sys.stderr)
+            return 2
+        names = catalog.scripts(args.category, (".py", ".md"), PY_CONTENT)
+        folder = os.path.join(PY_CONTENT, args.category)
+        broken = scriptmeta.flags([os.path.join(folder, name) for name in names])
+        for name in names:
+            problem = broken.get(os.path.join(folder, name))
+            print(f"{args.category}/{name}" + (f"  [{problem}]" if problem else ""))
+        return 0
+    for cat in catalog.categories(PY_CONTENT, IGNORE_LIST):
+        count = len(catalog.scripts(cat, (".py",), PY_CONTENT))
+        print(f"{cat:<20} {count} script(s)")
+    return 0
+
+def cmd_run(args):
+    try:
+        selected = resolve(args.targets, args.all)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+    if not selected:
+        print("nothing to run", file=sys.stderr)
+        return 2
+    settings = hubconfig.store().settings
+    mode = args.mode or settings.get("launch_mode", "fresh")
+    pristine = runner.parse_list(settings.get("pristine", ""))
+    if mode == "warm":
+        runner.warm_up(mode, runner.parse_list(settings.get("preload", "")))
+    start = time.monotonic()
+    try:
+        results = run_many(selected, args.jobs, mode, pristine,
+                           progress=None if args.quiet else _print_record,
+                           cache=None if args.no_cache else resultcache.options(),
+                           refresh=args.refresh, timeout=args.timeout)
+    finally:
+        runner.shutdown()
+    summary = summarize(results, time.monotonic() - start)
+    if args.json:
+        write_json(summary, args.json)
+    if args.junit:
+        write_junit(summary, args.junit)
+    print(f"{summary['passed']}/{summary['total']} passed in {summary['wall_time']:.2f}s")
+    return 0 if summary["failed"] == 0 else 1
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="hubcli.py", description="Run PythonHub scripts without the menus.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_list = sub.add_parser("list", help="list categories, or the scripts of one category")
+    p_list.add_argument("category", nargs="?")
+    p_list.set_defaults(func=cmd_list)
+
+    p_run = sub.add_parser("run", help="run scripts headless")
+    p_run.add_argument("targets", nargs="+", metavar="target",
+                       help="<category>/<script>, or a category name with --all")
+    p_run.add_argument("--all", action="store_true", help="run every .py script of the given categories")
+    p_run.add_argument("-j", "--jobs", type=int, default=None, help="scripts run at once (default: CPU count)")
+    p_run.add_argument("--mode", choices=runner.LAUNCH_MODES, help="launch mode (default: settings.txt)")
+    p_run.add_argument("--json", metavar="PATH", help="write the summary as JSON")
+    p_run.add_argument("--junit", metavar="PATH", help="write a JUnit-style XML report")
+    p_run.add_argument("--timeout", type=float, metavar="SECONDS",
+                       help="wall-clock limit per script, overrides settings.txt (0 = none)")
+    p_run.add_argument("--refresh", action="store_true", help="run cacheable scripts again and update their cached output")
+    p_run.add_argument("--no-cache", action="store_true", help="neither replay nor store cached output")
+    p_run.add_argument("-q", "--quiet", action="store_true", help="only print the final count")
+    p_run.set_defaults(func=cmd_run)
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
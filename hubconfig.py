@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""
+PythonHub hubconfig.py
+One cached store for every configuration source:
+- config.txt / settings.txt (menu2.py, "key = value" lines)
+- config.json / themes.json (menu_done.py) and themes/*.json (menu2.py)
+Each file is parsed and validated once, re-read only when its mtime changes
+(hot reload), and written atomically and only when its content changed.
+The active theme is compiled into ready-made escape-sequence templates, so
+a redraw formats whole lines instead of looking colors up per fragment.
+"""
+
+import os
+import json
+import time
+import string
+import threading
+
+import animation
+import runner
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+CONFIG_FILE = os.path.join(ROOT, "config.txt")
+SETTINGS_FILE = os.path.join(ROOT, "settings.txt")
+APP_CONFIG_FILE = os.path.join(ROOT, "config.json")
+APP_THEMES_FILE = os.path.join(ROOT, "themes.json")
+THEME_DIR = os.path.join(ROOT, "themes")
+RESET = "\u001b[0m"
+
+# mtimes are checked at most this often (seconds)
+REFRESH_INTERVAL = 0.5
+
+DEFAULT_CONFIG = {
+    "title": "HURON",
+    "subtitle": "AI-LINUX v1.0",
+    "theme": "cyber_neon",
+    "sound": "on",
+}
+
+DEFAULT_SETTINGS = {
+    "animation": "spinner",
+    "animation_min": "0",
+    "launch_mode": "fresh",
+    "preload": "json, sqlite3, random, platform, psutil",
+    "pristine": "",
+    "cache": "",
+    "cache_ttl": "600",
+    "timeout": "0",
+    "cpu_limit": "0",
+    "memory_limit": "0",
+    "nofile_limit": "0",
+    "nice": "0",
+}
+
+DEFAULT_APP_CONFIG = {
+    "main_title": "PY-HUB",
+    "subtitle": "",
+    "creator": "",
+    "default_theme": "neon-cyan",
+    "ascii_font": "ansi_shadow",
+    "animation_speed": 0.25,
+    "animation_min": 0,
+    "launch_mode": "fresh",
+}
+
+# ------------------------
+# Validators: return the cleaned value or raise ValueError
+# ------------------------
+def one_of(*choices):
+    def check(value):
+        value = str(value).strip().lower()
+        if value not in choices:
+            raise ValueError(f"expected one of {', '.join(choices)}")
+        return value
+    return check
+
+def non_negative(kind):
+    def check(value):
+        number = kind(value)
+        if number < 0:
+            raise ValueError("must not be negative")
+        return value if isinstance(value, (int, float)) else str(value).strip()
+    return check
+
+CONFIG_RULES = {"sound": one_of("on", "off")}
+SETTINGS_RULES = {
+    "animation": one_of(*animation.KINDS),
+    "animation_min": non_negative(float),
+    "launch_mode": one_of(*runner.LAUNCH_MODES),
+    "cache_ttl": non_negative(float),
+    "timeout": non_negative(float),
+    "cpu_limit": non_negative(float),
+    "memory_limit": non_negative(float),
+    "nofile_limit": non_negative(int),
+    "nice": non_negative(int),
+}
+APP_CONFIG_RULES = {
+    "animation_speed": non_negative(float),
+    "animation_min": non_negative(float),
+    "launch_mode": one_of(*runner.LAUNCH_MODES),
+}
+
+# ------------------------
+# Sources
+# ------------------------
+def atomic_write(path, text):
+    """Write text to path via a temp file + rename, so readers never see half a file."""
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as fh:
+        fh.write(text)
+    os.replace(tmp, path)
+
+def _mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+class Source:
+    """
+    One configuration file, kept parsed in memory. Behaves like a dict;
+    set values with [] and call save() to persist them. Only keys read from
+    the file or set with [] are written back; the rest keep following the
+    defaults.
+    """
+
+    def __init__(self, path, defaults=None, rules=None, fmt="kv"):
+        self.path = path
+        self.defaults = dict(defaults or {})
+        self.rules = rules or {}
+        self.fmt = fmt
+        self.data = dict(self.defaults)
+        self.problems = []
+        self._keys = set()
+        self._mtime = None
+        self._text = None
+        self.load()
+
+    def _parse(self, text):
+        if self.fmt == "json":
+            return json.loads(text) if text.strip() else {}
+        data = {}
+        for line in text.splitlines():
+            if "=" in line:
+                k, v = line.split("=", 1)
+                data[k.strip()] = v.strip()
+        return data
+
+    def _render(self):
+        data = {k: v for k, v in self.data.items() if k in self._keys}
+        if self.fmt == "json":
+            return json.dumps(data, indent=4)
+        return "".join(f"{k} = {v}\n" for k, v in data.items())
+
+    def _validate(self, data):
+        self.problems = []
+        for key, check in self.rules.items():
+            if key not in data:
+                continue
+            try:
+                data[key] = check(data[key])
+            except (ValueError, TypeError) as e:
+                self.problems.append(f"{os.path.basename(self.path)}: {key} = {data[key]!r} ({e})")
+                # a rejected value is not pinned to the default on save
+                self._keys.discard(key)
+                if key in self.defaults:
+                    data[key] = self.defaults[key]
+                else:
+                    del data[key]
+        return data
+
+    def load(self):
+        """(Re)read the file; a missing or unreadable file leaves the defaults."""
+        self._mtime = _mtime(self.path)
+        data = dict(self.defaults)
+        self._keys = set()
+        try:
+            with open(self.path, "r", encoding="utf-8") as fh:
+                self._text = fh.read()
+            parsed = self._parse(self._text)
+            if isinstance(parsed, dict):
+                data.update(parsed)
+                self._keys = set(parsed)
+            else:
+                self.problems = [f"{os.path.basename(self.path)}: not a JSON object"]
+        except (OSError, ValueError) as e:
+            self._text = None
+            if self._mtime is not None:
+                self.problems = [f"{os.path.basename(self.path)}: {e}"]
+        self.data = self._validate(data)
+
+    def changed(self):
+        return _mtime(self.path) != self._mtime
+
+    def save(self):
+        """Persist the current values, skipping the write if nothing changed."""
+        text = self._render()
+        if text == self._text:
+            return False
+        atomic_write(self.path, text)
+        self._text = text
+        self._mtime = _mtime(self.path)
+        return True
+
+    # dict behaviour
+    def get(self, key, default=None):
+        return self.data.get(key, default)
+
+    def __getitem__(self, key):
+        return self.data[key]
+
+    def __setitem__(self, key, value):
+        check = self.rules.get(key)
+        self.data[key] = check(value) if check else value
+        self._keys.add(key)
+
+    def __contains__(self, key):
+        return key in self.data
+
+    def items(self):
+        return self.data.items()
+
+    def copy(self):
+        return dict(self.data)
+
+# ------------------------
+# Compiled themes
+# ------------------------
+class Palette:
+    """
+    A theme compiled for drawing. palette[key] is an escape code, and
+    palette.compile(fmt) bakes the colors named in fmt into a plain
+    str.format template, e.g.
+
+        item = palette.compile("{menu_number_color}{0:02d}{reset} {menu_text_color}{1}{reset}")
+        item.format(3, "games")
+    """
+
+    def __init__(self, name, codes):
+        self.name = name
+        self.codes = {k: v for k, v in codes.items() if isinstance(v, str)}
+        self.codes.setdefault("reset", RESET)
+        self._templates = {}
+
+    def __getitem__(self, key):
+        return self.codes.get(key, "")
+
+    def get(self, key, default=""):
+        return self.codes.get(key, default)
+
+    def compile(self, fmt):
+        template = self._templates.get(fmt)
+        if template is None:
+            parts = []
+            for literal, field, spec, conv in string.Formatter().parse(fmt):
+                parts.append(literal.replace("{", "{{").replace("}", "}}"))
+                if field is None:
+                    continue
+                if field and not field.isdigit() and field in self.codes or field == "reset":
+                    parts.append(self[field].replace("{", "{{").replace("}", "}}"))
+                elif field and not field.isdigit() and not spec and not conv:
+                    # unknown color name: themes may leave roles out
+                    continue
+                else:
+                    conv = f"!{conv}" if conv else ""
+                    spec = f":{spec}" if spec else ""
+                    parts.append("{" + field + conv + spec + "}")
+            template = "".join(parts)
+            self._templates[fmt] = template
+        return template
+
+# ------------------------
+# The store
+# ------------------------
+class Store:
+    """Every config source plus the compiled themes, loaded once per process."""
+
+    def __init__(self):
+        self.config = Source(CONFIG_FILE, DEFAULT_CONFIG, CONFIG_RULES)
+        self.settings = Source(SETTINGS_FILE, DEFAULT_SETTINGS, SETTINGS_RULES)
+        self.app = Source(APP_CONFIG_FILE, DEFAULT_APP_CONFIG, APP_CONFIG_RULES, fmt="json")
+        self.app_themes = Source(APP_THEMES_FILE, fmt="json")
+        self._theme_sources = {}
+        self._palettes = {}
+        self._checked = time.monotonic()
+
+    def sources(self):
+        return [self.config, self.settings, self.app, self.app_themes] + list(self._theme_sources.values())
+
+    def problems(self):
+        return [p for s in self.sources() for p in s.problems]
+
+    def refresh(self, force=False):
+        """Reload files whose mtime moved. Returns True if anything was reloaded."""
+        now = time.monotonic()
+        if not force and now - self._checked < REFRESH_INTERVAL:
+            return False
+        self._checked = now
+        reloaded = False
+        for source in self.sources():
+            if source.changed():
+                source.load()
+                reloaded = True
+        if reloaded:
+            self._palettes.clear()
+        return reloaded
+
+    # menu2 themes: themes/<name>.json
+    def theme_names(self):
+        try:
+            return sorted(t[:-5] for t in os.listdir(THEME_DIR) if t.endswith(".json"))
+        except OSError:
+            return []
+
+    def _theme_source(self, name):
+        path = os.path.join(THEME_DIR, f"{name}.json")
+        if not os.path.exists(path):
+            # fallback: first available theme
+            names = self.theme_names()
+            if not names:
+                return None
+            name = names[0]
+            path = os.path.join(THEME_DIR, f"{name}.json")
+        source = self._theme_sources.get(path)
+        if source is None:
+            source = self._theme_sources[path] = Source(path, fmt="json")
+        return source
+
+    def palette(self):
+        """Compiled palette of the menu2 theme named in config.txt."""
+        name = self.config.get("theme", DEFAULT_CONFIG["theme"])
+        key = ("menu", name)
+        pal = self._palettes.get(key)
+        if pal is None:
+            source = self._theme_source(name)
+            pal = self._palettes[key] = Palette(name, source.copy() if source else {})
+        return pal
+
+    def app_palette(self):
+        """Compiled palette of the themes.json entry named in config.json."""
+        name = self.app.get("default_theme")
+        key = ("app", name)
+        pal = self._palettes.get(key)
+        if pal is None:
+            codes = self.app_themes.get(name)
+            if not isinstance(codes, dict):
+                codes = next((t for t in self.app_themes.data.values() if isinstance(t, dict)), {})
+            pal = self._palettes[key] = Palette(name, codes)
+        return pal
+
+_store = None
+_store_lock = threading.Lock()
+
+def store():
+    """The process-wide store, created on first use."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = Store()
+    return _store
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+PythonHub hubindex.py
+The one README index generator (used by update.readme.py and menu2.py):
+- categories and files come from the catalog (catalog.py), not a rescan
+- each script gets a one-line description from its module docstring,
+  parsed with ast and never imported (scriptmeta.py, cached per mtime)
+- only the generated block between the index markers is replaced, so
+  hand-written parts of README.md survive; without markers it is appended
+- README.md is rewritten (atomically) only when the block's content hash
+  changed, so regenerating an unchanged hub costs no write at all
+"""
+
+import os
+import hashlib
+
+import catalog
+import hubconfig
+import scriptmeta
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+README_FILE = os.path.join(ROOT, "README.md")
+EXTENSIONS = (".py", ".md")
+IGNORE = {"themes", "sounds", "__pycache__"}
+
+START_MARKER = "<!-- hub-index:start -->"
+END_MARKER = "<!-- hub-index:end -->"
+HASH_PREFIX = "<!-- hub-index:sha256 "
+
+def render(root=catalog.PY_CONTENT):
+    """Markdown index of every category and file under root."""
+    root = os.path.abspath(root)
+    cats = catalog.categories(root, IGNORE)
+    files = {c: catalog.scripts(c, EXTENSIONS, root) for c in cats}
+    prefix = {c: os.path.join(root, c, "") for c in cats}
+    docs = scriptmeta.summaries([prefix[c] + f for c in cats for f in files[c]])
+    lines = ["## Categories and files", ""]
+    if not cats:
+        lines.append("No categories found. Add folders under `Python/` (games, scripts, tools, etc.)")
+        lines.append("")
+    for c in cats:
+        lines.append(f"### {c}")
+        lines.append("")
+        if not files[c]:
+            lines.append("- (empty)")
+        for f in files[c]:
+            doc = docs.get(prefix[c] + f, "")
+            lines.append(f"- `{f}` — {doc}" if doc else f"- `{f}`")
+        lines.append("")
+    return "\n".join(lines)
+
+def _block(body):
+    digest = hashlib.sha256(body.encode("utf-8")).hexdigest()
+    return f"{START_MARKER}\n{HASH_PREFIX}{digest} -->\n{body}\n{END_MARKER}", digest
+
+def _stored_hash(text):
+    start = text.find(START_MARKER)
+    if start < 0:
+        return None
+    line_start = text.find(HASH_PREFIX, start)
+    if line_start < 0:
+        return None
+    line_start += len(HASH_PREFIX)
+    return text[line_start:text.find(" ", line_start)]
+
+def update(readme=README_FILE, root=catalog.PY_CONTENT):
+    """Regenerate the index in readme. Returns True if the file was written."""
+    block, digest = _block(render(root))
+    try:
+        with open(readme, "r", encoding="utf-8") as fh:
+            text = fh.read()
+    except FileNotFoundError:
+        text = "# Python Hub\n"
+    if _stored_hash(text) == digest:
+        return False
+    start, end = text.find(START_MARKER), text.find(END_MARKER)
+    if start >= 0 and end > start:
+        text = text[:start] + block + text[end + len(END_MARKER):]
+    else:
+        text = text.rstrip("\n") + "\n\n" + block + "\n"
+    hubconfig.atomic_write(readme, text)
+    return True
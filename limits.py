@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+PythonHub limits.py
+Resource policies for launched scripts, read from settings.txt:
+- timeout       wall-clock seconds before the script's process group is killed
+- cpu_limit     CPU seconds (RLIMIT_CPU)
+- memory_limit  address space in MB (RLIMIT_AS)
+- nofile_limit  open files (RLIMIT_NOFILE)
+- nice          scheduling niceness added to the script
+0 means no limit. Any key can be overridden per category or per script:
+
+    timeout = 120
+    timeout[games] = 0
+    memory_limit[scripts/sysinfo.py] = 256
+
+Limits are applied inside the child before the script starts: warm forks
+call apply() (warmpool.py); a fresh interpreter with limits to set is
+started through bootstrap(), a tiny interpreter that applies them to itself
+and execs the script (no preexec_fn: the launchers have threads). Every
+script runs in its own process group, so a timeout kills everything it
+started.
+"""
+
+import os
+import sys
+import signal
+
+try:
+    import resource
+except ImportError:       # not available on Windows
+    resource = None
+
+LIMIT_KEYS = ("timeout", "cpu_limit", "memory_limit", "nofile_limit", "nice")
+# seconds between SIGTERM and SIGKILL when a timeout expires
+KILL_GRACE = 2.0
+
+def _number(value):
+    number = float(value)
+    if number < 0:
+        raise ValueError("must not be negative")
+    return number
+
+def policy_for(script_path, settings=None):
+    """
+    Resolve the limits for one script: plain key, then key[category],
+    then key[script] / key[category/script]. Returns {key: number}, only
+    for limits that are set (non-zero).
+    """
+    if settings is None:
+        import hubconfig
+        settings = hubconfig.store().settings
+    path = os.path.abspath(script_path)
+    name = os.path.basename(path)
+    category = os.path.basename(os.path.dirname(path))
+    policy = {}
+    for key in LIMIT_KEYS:
+        value = None
+        for candidate in (key, f"{key}[{category}]", f"{key}[{name}]", f"{key}[{category}/{name}]"):
+            raw = settings.get(candidate)
+            if raw is None or str(raw).strip() == "":
+                continue
+            try:
+                value = _number(raw)
+            except (TypeError, ValueError):
+                continue
+        if value:
+            policy[key] = value
+    return policy
+
+def _rlimits(policy, current):
+    # (resource, (soft, hard)) for every rlimit the policy sets; current(which) -> (soft, hard)
+    for key, rlimit, scale in (("cpu_limit", "RLIMIT_CPU", 1),
+                               ("memory_limit", "RLIMIT_AS", 1024 * 1024),
+                               ("nofile_limit", "RLIMIT_NOFILE", 1)):
+        if policy.get(key) and hasattr(resource, rlimit):
+            which = getattr(resource, rlimit)
+            soft = int(policy[key] * scale)
+            _, hard = current(which)
+            if hard != resource.RLIM_INFINITY:
+                soft = min(soft, hard)
+            # the hard CPU limit sits a little higher so SIGXCPU arrives first
+            new_hard = soft + 5 if rlimit == "RLIMIT_CPU" and hard == resource.RLIM_INFINITY else hard
+            yield which, (soft, new_hard)
+
+def needs_setup(policy):
+    """True if the policy sets anything beyond the timeout (rlimits or niceness)."""
+    return any(policy.get(key) for key in LIMIT_KEYS if key != "timeout")
+
+def apply(policy, foreground=False):
+    """
+    Run in the child, before the script starts: own process group, optional
+    terminal foreground, niceness and rlimits. Used by warm forks (forked
+    from a single-threaded server) and by the bootstrap() interpreter.
+    """
+    os.setpgid(0, 0)
+    if foreground:
+        take_terminal(0)
+    if policy.get("nice"):
+        os.nice(int(policy["nice"]))
+    if resource is None:
+        return
+    for which, limit in _rlimits(policy, resource.getrlimit):
+        resource.setrlimit(which, limit)
+
+def bootstrap(policy, argv):
+    """
+    argv that runs argv (interpreter and script) with the policy in place:
+    a tiny interpreter joins its own process group, applies the rlimits and
+    niceness to itself, then execs argv, so the script never runs unlimited.
+    """
+    import json
+    hub = os.path.dirname(os.path.abspath(__file__))
+    code = (f"import sys; sys.path.insert(0, {hub!r}); import json, os, limits; "
+            "limits.apply(json.loads(sys.argv[1])); os.execv(sys.argv[2], sys.argv[2:])")
+    return [sys.executable, "-c", code, json.dumps(policy)] + list(argv)
+
+def give_terminal(pgid, fd=0):
+    """Make process group pgid the terminal's foreground group (no-op without a tty)."""
+    try:
+        if not os.isatty(fd):
+            return
+        old = signal.signal(signal.SIGTTOU, signal.SIG_IGN)
+        try:
+            os.tcsetpgrp(fd, pgid)
+        finally:
+            signal.signal(signal.SIGTTOU, old)
+    except (OSError, ValueError):
+        pass
+
+def take_terminal(fd=0):
+    """Make the calling process group the terminal's foreground group (no-op without a tty)."""
+    give_terminal(os.getpgrp(), fd)
+
+def kill_group(pgid, sig=signal.SIGKILL):
+    try:
+        os.killpg(pgid, sig)
+        return True
+    except (ProcessLookupError, PermissionError):
+        return False
+
+def describe(policy, returncode, timed_out=False, stderr_tail=()):
+    """Name the limit a finished run ran into, or None."""
+    if timed_out:
+        return f"timeout ({policy.get('timeout', 0):g}s)"
+    if returncode is not None and returncode < 0:
+        sig = -returncode
+        if sig == getattr(signal, "SIGXCPU", None) or (sig == signal.SIGKILL and policy.get("cpu_limit")):
+            return f"cpu_limit ({policy.get('cpu_limit', 0):g}s)"
+    if returncode:
+        text = "\n".join(stderr_tail)
+        if "MemoryError" in text and policy.get("memory_limit"):
+            return f"memory_limit ({policy['memory_limit']:g} MB)"
+        if "Too many open files" in text and policy.get("nofile_limit"):
+            return f"nofile_limit ({policy['nofile_limit']:g})"
+    return None
@@ -1,14 +1,21 @@
 #!/usr/bin/env python3
+import startup   # first: its import starts the startup clock (--startup-profile)
+
 import os
-import subprocess
 from colorama import Fore, Style, init
 
+import catalog
+import runner
+import screen
+
 init(autoreset=True)
+startup.mark("import")
 
 # === CONFIG: change only these =================================================
 APP_NAME = "PY-HUB"     # <- Change this to rename the big ASCII title everywhere
 VERSION = "1.0"
 CREATOR = "Unkn0wn_4uth0r"   # <- change author/creator info
+LAUNCH_MODE = "fresh"        # <- "fresh" or "warm" (preloaded interpreter pool)
 # ==============================================================================
 
 
@@ -33,59 +40,69 @@ def build_ascii_title(text):
 
 
 def banner():
-    """Clear the screen and print the banner with current app name and creator."""
-    os.system("clear")
-    print(build_ascii_title(APP_NAME))
-    print(Fore.YELLOW + f"[-] Tool Created by {CREATOR}\n")
+    """Start a new menu frame with the banner, current app name and creator."""
+    screen.begin()
+    screen.echo(build_ascii_title(APP_NAME))
+    screen.echo(Fore.YELLOW + f"[-] Tool Created by {CREATOR}\n")
 
 
 def print_menu():
     """Displays the menu options"""
-    print(Fore.RED + "[::] " + Fore.WHITE + "Select an Option For You " + Fore.RED + "[::]\n")
-    print(Fore.GREEN + "[01]" + Fore.WHITE + " Games")
-    print(Fore.GREEN + "[02]" + Fore.WHITE + " Scripts")
-    print(Fore.GREEN + "[03]" + Fore.WHITE + " Cool Information")
-    print(Fore.GREEN + "[04]" + Fore.WHITE + " View README")
-    print(Fore.GREEN + "[99]" + Fore.WHITE + " About")
-    print(Fore.GREEN + "[00]" + Fore.WHITE + " Exit\n")
+    screen.echo(Fore.RED + "[::] " + Fore.WHITE + "Select an Option For You " + Fore.RED + "[::]\n")
+    screen.echo(Fore.GREEN + "[01]" + Fore.WHITE + " Games")
+    screen.echo(Fore.GREEN + "[02]" + Fore.WHITE + " Scripts")
+    screen.echo(Fore.GREEN + "[03]" + Fore.WHITE + " Cool Information")
+    screen.echo(Fore.GREEN + "[04]" + Fore.WHITE + " View README")
+    screen.echo(Fore.GREEN + "[99]" + Fore.WHITE + " About")
+    screen.echo(Fore.GREEN + "[00]" + Fore.WHITE + " Exit\n")
 
 
 def run_python_file(folder, filename):
     """
     Runs a python file inside the given folder.
-    Explanation: using subprocess.run is safer and cleaner than os.system for
-    invoking Python scripts — it inherits the terminal and exits back to menu.
+    Explanation: runner.spawn forks the script from the warm interpreter pool
+    (or starts the same Python interpreter) — it inherits the terminal and
+    exits back to menu.
     """
-    os.system("clear")
+    import scriptmeta
+    screen.clear()
     path = os.path.join(folder, filename)
+    problems = scriptmeta.problems(path)
+    if problems:
+        print(Fore.RED + f"{filename} cannot run:")
+        for problem in problems:
+            print(Fore.RED + "  " + problem)
+        if not scriptmeta.info(path).get("compiles", True):
+            input(Fore.YELLOW + "\nPress Enter to return to menu...")
+            return
+        if input(Fore.YELLOW + "Run anyway? (y/n) [n]: ").strip().lower() != "y":
+            return
     print(Fore.CYAN + f"Running {filename}...\n")
-    # Use the same Python interpreter
-    subprocess.run([os.sys.executable, path])
+    runner.wait(runner.spawn(path, mode=LAUNCH_MODE))
     input(Fore.YELLOW + "\nPress Enter to return to menu...")
 
 
 def list_files(folder, extensions=(".py", ".md")):
     """Return a sorted list of files in folder with chosen extensions."""
-    try:
-        items = [f for f in sorted(os.listdir(folder)) if f.endswith(extensions)]
-    except FileNotFoundError:
-        items = []
-    return items
+    return catalog.list_files(folder, extensions)
 
 
 def list_and_select(folder):
     """Generic handler to list .py and .md and run/show the chosen file."""
-    os.system("clear")
+    screen.begin()
     files = list_files(folder)
     if not files:
-        print(Fore.RED + f"No files found in '{folder}'.")
-        input(Fore.YELLOW + "\nPress Enter to return...")
+        screen.echo(Fore.RED + f"No files found in '{folder}'.")
+        screen.prompt(Fore.YELLOW + "\nPress Enter to return...")
         return
 
+    import scriptmeta
+    broken = scriptmeta.flags([os.path.join(folder, f) for f in files])
     for i, f in enumerate(files, 1):
-        print(Fore.GREEN + f"[{i:02}] " + Fore.WHITE + f)
-    print(Fore.RED + "[00] Back\n")
-    choice = input(Fore.YELLOW + "Select: ").strip()
+        problem = broken.get(os.path.abspath(os.path.join(folder, f)))
+        screen.echo(Fore.GREEN + f"[{i:02}] " + Fore.WHITE + f + (Fore.RED + f"  [{problem}]" if problem else ""))
+    screen.echo(Fore.RED + "[00] Back\n")
+    choice = screen.prompt(Fore.YELLOW + "Select: ").strip()
     if not choice.isdigit():
         print(Fore.RED + "Invalid input.")
         input(Fore.YELLOW + "Press Enter...")
@@ -99,7 +116,7 @@ def list_and_select(folder):
             run_python_file(folder, selected)
         else:
             # show markdown or text
-            os.system("clear")
+            screen.clear()
             path = os.path.join(folder, selected)
             with open(path, "r", encoding="utf-8") as fh:
                 print(fh.read())
@@ -107,7 +124,7 @@ def list_and_select(folder):
 
 
 def view_readme():
-    os.system("clear")
+    screen.clear()
     try:
         with open("README.md", "r", encoding="utf-8") as fh:
             print(fh.read())
@@ -117,7 +134,7 @@ def view_readme():
 
 
 def about():
-    os.system("clear")
+    screen.clear()
     print(Fore.CYAN + f"📘 {APP_NAME} v{VERSION}\nCreated by {CREATOR}\n")
     print("A stylish Python Hub for organizing and running games, scripts, and notes.")
     input(Fore.YELLOW + "\nPress Enter to return...")
@@ -127,7 +144,7 @@ def main_loop():
     while True:
         banner()
         print_menu()
-        choice = input(Fore.YELLOW + "[-] Select an option: ").strip()
+        choice = screen.prompt(Fore.YELLOW + "[-] Select an option: ").strip()
 
         if choice in ("1", "01"):
             list_and_select("games")
@@ -140,12 +157,18 @@ def main_loop():
         elif choice in ("99",):
             about()
         elif choice in ("0", "00"):
-            os.system("clear")
+            screen.clear()
             print(Fore.GREEN + f"Exiting {APP_NAME}... Goodbye!\n")
+            catalog.stop_watcher()
+            runner.shutdown()
             break
         else:
             print(Fore.RED + "❌ Invalid option.")
             input(Fore.YELLOW + "Press Enter...")
 
 if __name__ == "__main__":
+    # background services start once the first menu frame is on screen
+    screen.on_first_frame(startup.first_frame)
+    startup.defer(catalog.start_watcher, (os.getcwd(),))
+    startup.defer(runner.warm_up, LAUNCH_MODE)
     main_loop()
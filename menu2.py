@@ -2,260 +2,210 @@
 """
 PythonHub menu.py
 Full-featured launcher:
-- auto-detects subfolders under 'Python/'
-- two-step navigation (folder -> file)
+- auto-detects subfolders under 'Python/' (cached by catalog.py)
+- two-step navigation (folder -> file), or type-ahead search (search.py)
 - themes (themes/*.json)
 - animations (spinner/progress/diagonal/dots)
-- sound support (termux-media-player or playsound fallback)
+- sound support (background service: simpleaudio, termux-media-player or playsound)
 - safe execution modes (interactive OR capture + error display)
+- warm interpreter pool for fast launches (runner.py / warmpool.py)
 - config stored in config.txt
 - settings stored in settings.txt
+  (both read through the hubconfig.py store together with the themes)
 """
 
+import startup   # first: its import starts the startup clock (--startup-profile)
+
 import os
 import sys
-import json
-import time
-import subprocess
-import traceback
+
+import animation
+import catalog
+import hubconfig
+import runner
+import screen
+import sound
+
+# capture.py (subprocess, tempfile), search.py and scriptmeta.py (ast) are imported on
+# first use, so they cost nothing before the first menu frame
+startup.mark("import")
 
 ROOT = os.path.dirname(os.path.abspath(__file__))
 PY_CONTENT = os.path.join(ROOT, "Python")
-THEME_DIR = os.path.join(ROOT, "themes")
+THEME_DIR = hubconfig.THEME_DIR
 SOUND_DIR = os.path.join(ROOT, "sounds")
-CONFIG_FILE = os.path.join(ROOT, "config.txt")
-SETTINGS_FILE = os.path.join(ROOT, "settings.txt")
 IGNORE_LIST = {"themes", "sounds", "menu.py", "config.txt", "README.md", "settings.txt", "update_readme.py"}
 
 # ------------------------
 # Utility functions
 # ------------------------
 def clear():
-    os.system("cls" if os.name == "nt" else "clear")
+    screen.clear()
 
 def safe_input(prompt=""):
-    try:
-        return input(prompt)
-    except EOFError:
-        return ""
+    # flushes any pending menu frame (only changed lines are redrawn) first
+    return screen.prompt(prompt)
 
 # ------------------------
-# Config loader/saver
+# Config, settings and theme
+# (hubconfig.py: loaded once, validated, hot-reloaded, written atomically)
 # ------------------------
-DEFAULT_CONFIG = {
-    "title": "HURON",
-    "subtitle": "AI-LINUX v1.0",
-    "theme": "cyber_neon",
-    "sound": "on"
-}
-
-def load_config():
-    cfg = DEFAULT_CONFIG.copy()
-    if not os.path.exists(CONFIG_FILE):
-        save_config(cfg)
-        return cfg
-    try:
-        with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-            for line in f:
-                if "=" in line:
-                    k, v = line.split("=", 1)
-                    cfg[k.strip()] = v.strip()
-    except Exception:
-        pass
-    return cfg
+with startup.phase("config"):
+    store = hubconfig.store()
+config = store.config
+settings = store.settings
+DEFAULT_CONFIG = hubconfig.DEFAULT_CONFIG
+DEFAULT_SETTINGS = hubconfig.DEFAULT_SETTINGS
 
 def save_config(cfg):
-    with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-        for k, v in cfg.items():
-            f.write(f"{k} = {v}\n")
-
-config = load_config()
-
-# ------------------------
-# Settings loader (animation)
-# ------------------------
-DEFAULT_SETTINGS = {"animation": "spinner"}
-
-def load_settings():
-    s = DEFAULT_SETTINGS.copy()
-    if not os.path.exists(SETTINGS_FILE):
-        save_settings(s)
-        return s
-    try:
-        with open(SETTINGS_FILE, "r", encoding="utf-8") as f:
-            for line in f:
-                if "=" in line:
-                    k, v = line.split("=", 1)
-                    s[k.strip()] = v.strip()
-    except Exception:
-        pass
-    return s
+    cfg.save()
 
 def save_settings(s):
-    with open(SETTINGS_FILE, "w", encoding="utf-8") as f:
-        for k, v in s.items():
-            f.write(f"{k} = {v}\n")
-
-settings = load_settings()
-
-# ------------------------
-# Theme loader
-# ------------------------
-def load_theme(name):
-    path = os.path.join(THEME_DIR, f"{name}.json")
-    if not os.path.exists(path):
-        # fallback: first available theme
-        try:
-            first = next(f for f in os.listdir(THEME_DIR) if f.endswith(".json"))
-            path = os.path.join(THEME_DIR, first)
-        except StopIteration:
-            return {}
-    try:
-        with open(path, "r", encoding="utf-8") as fh:
-            return json.load(fh)
-    except Exception:
-        return {}
-
-theme = load_theme(config.get("theme", DEFAULT_CONFIG["theme"]))
+    s.save()
 
 # helper for color
 def color(key):
-    return theme.get(key, "")
+    return store.palette()[key]
 
 RESET = "\u001b[0m"
 
+# line templates; tpl() bakes the active theme's escape codes into them once
+TITLE = "{title_color}{0}{reset}"
+SUBTITLE = "{subtitle_color}{0}{reset}"
+RULE = "{accent_color}" + "=" * 48 + "{reset}"
+TEXT = "{menu_text_color}{0}{reset}"
+ERROR = "{error_color}{0}{reset}"
+ITEM = "{menu_number_color}{0:02d}{reset} {menu_text_color}{1}{reset}"
+FLAG = "  {error_color}[{0}]{reset}"
+ACTION = "{menu_number_color}{0}{reset} {menu_text_color}{1}{reset}"
+EXIT_ACTION = "{menu_number_color}{0}{reset} {error_color}{1}{reset}"
+BACK = "{menu_number_color}00{reset} Back"
+
+def tpl(fmt):
+    return store.palette().compile(fmt)
+
 # ------------------------
 # Sound system
 # ------------------------
-# We will try termux-media-player first (Termux). Fallback to playsound if installed.
+# sound.py plays preloaded sounds on its own thread: simpleaudio, then
+# termux-media-player (Termux), then playsound if installed.
 def play_sound_file(filename):
     if config.get("sound", "on").lower() != "on":
         return
-    path = os.path.join(SOUND_DIR, filename)
-    if not os.path.exists(path):
-        return
-    # Try termux-media-player (Termux)
-    try:
-        subprocess.Popen(["termux-media-player", "play", path], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        return
-    except Exception:
-        pass
-    # Fallback to playsound module if available
-    try:
-        from playsound import playsound
-        playsound(path, block=False)
-    except Exception:
-        pass
+    sound.play(filename)
 
 # ------------------------
-# Animations
+# Animations (drawn on a background thread while the real work runs)
 # ------------------------
-def spinner_animation(text="Loading", cycles=8, speed=0.10):
-    frames = ["|", "/", "-", "\\"]
-    for _ in range(cycles):
-        for f in frames:
-            print(f"{text} {f}", end="\r")
-            time.sleep(speed)
-    print(" " * 40, end="\r")
-
-def progress_bar_animation(text="Loading", length=24, speed=0.03):
-    for i in range(length + 1):
-        filled = "#" * i
-        empty = "-" * (length - i)
-        pct = int((i / length) * 100)
-        print(f"{text}: [{filled}{empty}] {pct}%", end="\r")
-        time.sleep(speed)
-    print()
-
-def diagonal_animation(text="Loading", lines=8, cycles=3, speed=0.08):
-    for _ in range(cycles):
-        for i in range(lines):
-            print("\n" * i + " " * (i*2) + "•")
-            time.sleep(speed)
-            clear()
-    print()
-
-def dots_animation(text="Loading", repeats=3, speed=0.4):
-    for _ in range(repeats):
-        for i in range(1,4):
-            print(f"{text}{'.'*i}", end="\r")
-            time.sleep(speed)
-    print(" " * 40, end="\r")
-
 def run_animation(kind, text="Loading"):
-    if kind == "spinner":
-        spinner_animation(text)
-    elif kind == "progress":
-        progress_bar_animation(text)
-    elif kind == "diagonal":
-        diagonal_animation(text)
-    else:
-        dots_animation(text)
+    # use as a with-block around the work; stops as soon as the work is done
+    try:
+        min_duration = float(settings.get("animation_min", "0"))
+    except ValueError:
+        min_duration = 0.0
+    return animation.running(kind, text, min_duration)
 
 # ------------------------
 # Auto-detect folders (main categories)
 # ------------------------
 def scan_categories():
-    try:
-        items = [d for d in os.listdir(PY_CONTENT) if os.path.isdir(os.path.join(PY_CONTENT, d))]
-    except FileNotFoundError:
-        items = []
-    # filter hidden/system folders and ignore list
-    items = [i for i in items if i not in IGNORE_LIST and not i.startswith(".")]
-    items.sort()
-    return items
+    # served from the catalog index; only directories whose mtime changed are re-read
+    return catalog.categories(PY_CONTENT, IGNORE_LIST)
 
 # ------------------------
 # List files inside a folder (.py and .md)
 # ------------------------
 def list_folder_files(folder):
-    p = os.path.join(PY_CONTENT, folder)
-    try:
-        files = os.listdir(p)
-    except FileNotFoundError:
-        return []
     # show only .py and .md
-    files = [f for f in files if (f.endswith(".py") or f.endswith(".md")) and not f.startswith(".")]
-    files.sort()
-    return files
+    return catalog.scripts(folder, (".py", ".md"), PY_CONTENT)
 
 # ------------------------
 # Run script - two modes:
 #  - interactive: spawn subprocess directly (useful for interactive apps)
-#  - captured : run and capture output; on error allow viewing full traceback (A+B)
+#  - captured : stream output live and spool it; on error allow viewing full traceback (A+B)
 # ------------------------
+def launch_options():
+    return {
+        "mode": settings.get("launch_mode", "fresh"),
+        "pristine": runner.parse_list(settings.get("pristine", "")),
+    }
+
+def preflight(script_path):
+    # refuse scripts that cannot compile; missing modules may be a false alarm, so ask
+    import scriptmeta
+    problems = scriptmeta.problems(script_path)
+    if not problems:
+        return True
+    print(color("error_color") + f"[ERROR] {os.path.basename(script_path)} cannot run:" + RESET)
+    for problem in problems:
+        print(color("error_color") + "  " + problem + RESET)
+    if not scriptmeta.info(script_path).get("compiles", True):
+        safe_input("\nPress ENTER to return...")
+        return False
+    return safe_input("\nRun anyway? (y/n) [n]: ").strip().lower() == "y"
+
 def run_script_interactive(script_path):
     # run with the same interpreter, interactive (no capture)
     try:
-        subprocess.run([sys.executable, script_path])
+        proc = runner.spawn(script_path, **launch_options())
+        runner.wait(proc)
+        if proc.limit_hit:
+            print(color("error_color") + f"\n[LIMIT] Script stopped: {proc.limit_hit}" + RESET)
+            safe_input("Press ENTER to return...")
     except Exception as e:
         print(color("error_color") + "[ERROR] Failed to launch interactively." + RESET)
         print(str(e))
         safe_input("Press ENTER to return...")
 
-def run_script_captured(script_path):
-    # run and capture stdout/stderr
+def replay_cached(script_path, hit):
+    # opted-in scripts (resultcache.py): show the stored output instantly
+    print(color("accent_color") + f"[cached result from {int(hit.age)}s ago]" + RESET)
+    print(color("menu_text_color"), end="", flush=True)
+    hit.dump("stdout")
+    hit.dump("stderr")
+    print(RESET, end="")
+    choice = safe_input("\nProgram finished (cached). Press ENTER to return, or 'r' to run it again: ")
+    if choice.strip().lower() == "r":
+        clear()
+        run_script_captured(script_path, refresh=True)
+
+def run_script_captured(script_path, refresh=False):
+    # stream stdout/stderr live while spooling them to temp files (bounded memory)
+    import subprocess
+    import capture
+    import resultcache
+    cached, ttl = resultcache.options()
+    key = None
+    if resultcache.is_cacheable(script_path, cached):
+        key = resultcache.cache_key(script_path)
+        hit = None if refresh else resultcache.lookup(key, ttl)
+        if hit is not None:
+            replay_cached(script_path, hit)
+            return
     try:
-        proc = subprocess.run([sys.executable, script_path], capture_output=True, text=True, timeout=None)
-        out = proc.stdout
-        err = proc.stderr
-        if out:
-            print(color("menu_text_color") + out + RESET)
-        if proc.returncode != 0:
-            print(color("error_color") + "[ERROR] Script finished with errors." + RESET)
-            # show short summary
-            err_summary = err.strip().splitlines()[-10:]
-            print(color("error_color") + "\n".join(err_summary) + RESET)
-            choice = safe_input("\nPress ENTER to view full output & traceback, or type 'skip' to skip: ")
-            if choice.strip().lower() != "skip":
-                print("\n--- FULL STDOUT ---")
-                print(out)
-                print("\n--- FULL STDERR ---")
-                print(err)
-            safe_input("\nPress ENTER to return to menu...")
-        else:
-            safe_input("\nProgram finished. Press ENTER to return.")
-    except subprocess.SubprocessError as e:
+        proc = runner.spawn(script_path, stdout=subprocess.PIPE, stderr=subprocess.PIPE, **launch_options())
+        print(color("menu_text_color"), end="", flush=True)
+        with capture.stream(proc) as result:
+            print(RESET, end="")
+            if key is not None:
+                resultcache.store(key, script_path, result, ttl)
+            if result.returncode != 0:
+                print(color("error_color") + "[ERROR] Script finished with errors." + RESET)
+                if result.limit:
+                    print(color("error_color") + f"[LIMIT] {result.limit}" + RESET)
+                # show short summary
+                err_summary = result.stderr_tail()
+                print(color("error_color") + "\n".join(err_summary) + RESET)
+                choice = safe_input("\nPress ENTER to view full output & traceback, or type 'skip' to skip: ")
+                if choice.strip().lower() != "skip":
+                    print("\n--- FULL STDOUT ---", flush=True)
+                    result.dump("stdout")
+                    print("\n--- FULL STDERR ---", flush=True)
+                    result.dump("stderr")
+                safe_input("\nPress ENTER to return to menu...")
+            else:
+                safe_input("\nProgram finished. Press ENTER to return.")
+    except (subprocess.SubprocessError, OSError) as e:
         print(color("error_color") + "[ERROR] Running script error: " + str(e) + RESET)
         safe_input("Press ENTER to return...")
 
@@ -263,45 +213,54 @@ def run_script_captured(script_path):
 # Menu UI rendering
 # ------------------------
 def print_header():
-    clear()
-    tcolor = color("title_color") or ""
-    scolor = color("subtitle_color") or ""
-    acolor = color("accent_color") or ""
-    mcolor = color("menu_text_color") or ""
-    print(tcolor + config.get("title", "") + RESET)
-    print(scolor + config.get("subtitle", "") + RESET)
-    print(acolor + "=" * 48 + RESET)
-    print()
+    # starts a new off-screen frame; safe_input() draws it
+    store.refresh()
+    with startup.phase("theme"):
+        store.palette()
+    screen.begin()
+    screen.echo(tpl(TITLE).format(config.get("title", "")))
+    screen.echo(tpl(SUBTITLE).format(config.get("subtitle", "")))
+    screen.echo(tpl(RULE))
+    screen.echo()
 
 def category_menu():
     while True:
         print_header()
-        cats = scan_categories()
+        with startup.phase("catalog"):
+            cats = scan_categories()
         if not cats:
-            print(color("error_color") + "No content found in 'Python/' folder." + RESET)
-            print("Create folders under Python/ like games, scripts, tools etc.")
+            screen.echo(tpl(ERROR).format("No content found in 'Python/' folder."))
+            screen.echo("Create folders under Python/ like games, scripts, tools etc.")
             safe_input("\nPress ENTER to open Python folder or Ctrl+C to quit...")
             # try auto-create
             os.makedirs(PY_CONTENT, exist_ok=True)
             continue
 
-        print(color("menu_text_color") + "Categories:" + RESET)
+        screen.echo(tpl(TEXT).format("Categories:"))
+        item = tpl(ITEM)
         for i, c in enumerate(cats, 1):
-            print(f"{color('menu_number_color')}{i:02d}{RESET} {color('menu_text_color')}{c}{RESET}")
-        print()
-        print(f"{color('menu_number_color')}99{RESET} {color('menu_text_color')}Settings{RESET}")
-        print(f"{color('menu_number_color')}00{RESET} {color('error_color')}Exit{RESET}")
+            screen.echo(item.format(i, c))
+        screen.echo()
+        screen.echo(tpl(ACTION).format("s", "Search"))
+        screen.echo(tpl(ACTION).format("99", "Settings"))
+        screen.echo(tpl(EXIT_ACTION).format("00", "Exit"))
 
         choice = safe_input("\nEnter number: ").strip()
         play_click()
         if choice == "00":
             play_exit()
-            run_animation(settings.get("animation", "spinner"), "Exiting")
+            with run_animation(settings.get("animation", "spinner"), "Exiting"):
+                catalog.stop_watcher()
+                runner.shutdown()
+                sound.stop()
             clear()
             sys.exit(0)
         if choice == "99":
             settings_menu()
             continue
+        if choice.lower() in ("s", "/"):
+            search_menu()
+            continue
         if not choice.isdigit():
             continue
         idx = int(choice) - 1
@@ -311,12 +270,19 @@ def category_menu():
 def open_category(cat):
     while True:
         print_header()
-        print(color("menu_text_color") + f"[ {cat} ]" + RESET)
+        screen.echo(tpl(TEXT).format(f"[ {cat} ]"))
         files = list_folder_files(cat)
+        folder = os.path.join(PY_CONTENT, cat)
+        import scriptmeta
+        # broken scripts are marked from cached static metadata, nothing is spawned
+        broken = scriptmeta.flags([os.path.join(folder, f) for f in files])
+        item = tpl(ITEM)
+        flag = tpl(FLAG)
         for i, f in enumerate(files, 1):
-            print(f"{color('menu_number_color')}{i:02d}{RESET} {color('menu_text_color')}{f}{RESET}")
-        print()
-        print(f"{color('menu_number_color')}00{RESET} {color('error_color')}Back{RESET}")
+            problem = broken.get(os.path.join(folder, f))
+            screen.echo(item.format(i, f) + (flag.format(problem) if problem else ""))
+        screen.echo()
+        screen.echo(tpl(EXIT_ACTION).format("00", "Back"))
 
         choice = safe_input("\nEnter number: ").strip()
         play_click()
@@ -326,23 +292,96 @@ def open_category(cat):
             continue
         idx = int(choice) - 1
         if 0 <= idx < len(files):
-            selected = files[idx]
-            full_path = os.path.join(PY_CONTENT, cat, selected)
-            # if file is markdown, show it
-            if selected.endswith(".md"):
-                show_markdown(full_path)
-            elif selected.endswith(".py"):
-                # ask how to run (interactive or captured)
-                mode = safe_input("Run interactively? (y/n) [n]: ").strip().lower() or "n"
-                play_open()
-                run_animation(settings.get("animation", "spinner"), "Opening")
-                clear()
-                print(color("accent_color") + f"--- Running {selected} ---" + RESET)
-                print()
-                if mode == "y":
-                    run_script_interactive(full_path)
-                else:
-                    run_script_captured(full_path)
+            open_file(cat, files[idx])
+
+def open_file(cat, selected):
+    full_path = os.path.join(PY_CONTENT, cat, selected)
+    # if file is markdown, show it
+    if selected.endswith(".md"):
+        show_markdown(full_path)
+    elif selected.endswith(".py"):
+        if not preflight(full_path):
+            return
+        import scriptmeta
+        # ask how to run (interactive or captured); scripts that read stdin default to interactive
+        default = "y" if scriptmeta.info(full_path).get("stdin") else "n"
+        mode = safe_input(f"Run interactively? (y/n) [{default}]: ").strip().lower() or default
+        play_open()
+        with run_animation(settings.get("animation", "spinner"), "Opening"):
+            runner.ready(launch_options()["mode"], preload=runner.parse_list(settings.get("preload", "")))
+        clear()
+        print(color("accent_color") + f"--- Running {selected} ---" + RESET)
+        print()
+        if mode == "y":
+            run_script_interactive(full_path)
+        else:
+            run_script_captured(full_path)
+
+# ------------------------
+# Type-ahead search across all categories and scripts
+# ------------------------
+SEARCH_LIMIT = 12
+SEARCH_ITEM = "{menu_number_color}{0}{reset} {menu_text_color}{1}{reset} {accent_color}{2}{reset}"
+
+def open_entry(entry):
+    if entry.kind == "category":
+        open_category(entry.category)
+    else:
+        open_file(entry.category, entry.name)
+
+def draw_search(query, results, selected):
+    print_header()
+    screen.echo(tpl(TEXT).format(f"Search: {query}_"))
+    screen.echo()
+    item = tpl(SEARCH_ITEM)
+    for i, e in enumerate(results):
+        marker = ">" if i == selected else " "
+        label = f"{e.category}/" if e.kind == "category" else f"{e.category}/{e.name}"
+        screen.echo(item.format(marker, label, e.doc[:60]))
+    if query and not results:
+        screen.echo(tpl(ERROR).format("No matches."))
+    screen.echo()
+    screen.echo(tpl(TEXT).format("Type to filter, UP/DOWN to pick, ENTER to open, ESC to go back"))
+
+def search_menu():
+    import search
+    index = search.get_index(PY_CONTENT, IGNORE_LIST)
+    if not screen.can_read_keys():
+        # no raw terminal: one query per line, then pick by number
+        query = safe_input("Search: ").strip()
+        results = index.query(query, SEARCH_LIMIT)
+        print_header()
+        item = tpl(ITEM)
+        for i, e in enumerate(results, 1):
+            screen.echo(item.format(i, f"{e.category}/{e.name}"))
+        choice = safe_input("\nEnter number (ENTER for top hit): ").strip() or "1"
+        if choice.isdigit() and 0 < int(choice) <= len(results):
+            open_entry(results[int(choice) - 1])
+        return
+    query, selected, chosen = "", 0, None
+    with screen.raw_keys():
+        while chosen is None:
+            results = index.query(query, SEARCH_LIMIT)
+            selected = min(selected, max(len(results) - 1, 0))
+            draw_search(query, results, selected)
+            screen.flush()
+            for key in screen.read_keys():
+                if key == "ESC":
+                    return
+                if key == "ENTER":
+                    if results:
+                        chosen = results[selected]
+                    break
+                if key == "UP":
+                    selected = max(selected - 1, 0)
+                elif key == "DOWN":
+                    selected += 1
+                elif key == "BACKSPACE":
+                    query, selected = query[:-1], 0
+                elif len(key) == 1 and key.isprintable():
+                    query, selected = query + key, 0
+    play_click()
+    open_entry(chosen)
 
 def show_markdown(path):
     clear()
@@ -360,14 +399,15 @@ def show_markdown(path):
 def settings_menu():
     while True:
         print_header()
-        print(color("menu_text_color") + "Settings:" + RESET)
-        print("[01] Change Title")
-        print("[02] Change Subtitle")
-        print("[03] Change Theme")
-        print("[04] Choose Animation")
-        print("[05] Toggle Sound")
-        print("[06] Update README (auto-generate)")
-        print("[00] Back")
+        screen.echo(tpl(TEXT).format("Settings:"))
+        screen.echo("[01] Change Title")
+        screen.echo("[02] Change Subtitle")
+        screen.echo("[03] Change Theme")
+        screen.echo("[04] Choose Animation")
+        screen.echo("[05] Toggle Sound")
+        screen.echo("[06] Update README (auto-generate)")
+        screen.echo("[07] Run statistics")
+        screen.echo("[00] Back")
         choice = safe_input("\nEnter number: ").strip()
         play_click()
         if choice == "00":
@@ -389,20 +429,59 @@ def settings_menu():
         elif choice == "05":
             toggle_sound()
         elif choice == "06":
-            update_readme_auto()
-            safe_input("README updated. Press ENTER...")
+            with run_animation(settings.get("animation", "spinner"), "Updating README"):
+                changed = update_readme_auto()
+            safe_input(("README updated." if changed else "README already up to date.") + " Press ENTER...")
+        elif choice == "07":
+            show_stats()
         else:
             continue
 
+# ------------------------
+# Run statistics (telemetry.py)
+# ------------------------
+STATS_TOP = 5
+
+def _fmt_kb(kb):
+    return f"{kb / 1024:.1f} MB" if kb else "-"
+
+def _fmt_s(seconds):
+    return f"{seconds:.2f}s" if seconds is not None else "-"
+
+def show_stats():
+    # telemetry.py records every launch (wall/CPU time, peak RSS, exit code)
+    import telemetry
+    stats = telemetry.report(top=STATS_TOP)
+    print_header()
+    screen.echo(tpl(TEXT).format("Run statistics:"))
+    if not stats["runs"]:
+        screen.echo("No runs recorded yet.")
+        safe_input("\nPress ENTER to return...")
+        return
+    wall, rss = stats["wall"], stats["maxrss_kb"]
+    screen.echo(f"{stats['runs']} runs, {stats['failures']} failed")
+    screen.echo(f"wall time  p50 {_fmt_s(wall[50])}  p90 {_fmt_s(wall[90])}  p99 {_fmt_s(wall[99])}")
+    screen.echo(f"peak RSS   p50 {_fmt_kb(rss[50])}  p90 {_fmt_kb(rss[90])}  p99 {_fmt_kb(rss[99])}")
+    screen.echo()
+    screen.echo(tpl(TEXT).format("Slowest (median wall time):"))
+    item = tpl(ITEM)
+    for i, s in enumerate(stats["slowest"], 1):
+        screen.echo(item.format(i, f"{s['script']:<32} {_fmt_s(s['p50']):>8}  max {_fmt_s(s['max'])}  ({s['runs']} runs)"))
+    screen.echo()
+    screen.echo(tpl(TEXT).format("Heaviest (peak RSS):"))
+    for i, s in enumerate(stats["heaviest"], 1):
+        screen.echo(item.format(i, f"{s['script']:<32} {_fmt_kb(s['maxrss_kb']):>8}  ({s['failures']} failed)"))
+    safe_input("\nPress ENTER to return...")
+
 def choose_theme():
-    themes = [t[:-5] for t in os.listdir(THEME_DIR) if t.endswith(".json")]
+    themes = store.theme_names()
     while True:
-        clear()
         print_header()
-        print(color("menu_text_color") + "Available Themes:" + RESET)
+        screen.echo(tpl(TEXT).format("Available Themes:"))
+        item = tpl(ITEM)
         for i, t in enumerate(themes, 1):
-            print(f"{color('menu_number_color')}{i:02d}{RESET} {color('menu_text_color')}{t}{RESET}")
-        print(f"{color('menu_number_color')}00{RESET} Back")
+            screen.echo(item.format(i, t))
+        screen.echo(tpl(BACK))
         choice = safe_input("\nChoose theme number: ").strip()
         play_click()
         if choice == "00":
@@ -412,21 +491,19 @@ def choose_theme():
         idx = int(choice) - 1
         if 0 <= idx < len(themes):
             config["theme"] = themes[idx]
+            # the palette follows config["theme"]; nothing to reload by hand
             save_config(config)
-            # reload theme global
-            global theme
-            theme = load_theme(config["theme"])
             return
 
 def choose_animation():
-    options = ["spinner", "progress", "diagonal", "dots"]
+    options = list(animation.KINDS)
     while True:
-        clear()
         print_header()
-        print(color("menu_text_color") + "Animation options:" + RESET)
+        screen.echo(tpl(TEXT).format("Animation options:"))
+        item = tpl(ITEM)
         for i, o in enumerate(options, 1):
-            print(f"{color('menu_number_color')}{i:02d}{RESET} {color('menu_text_color')}{o}{RESET}")
-        print(f"{color('menu_number_color')}00{RESET} Back")
+            screen.echo(item.format(i, o))
+        screen.echo(tpl(BACK))
         choice = safe_input("\nChoose animation: ").strip()
         play_click()
         if choice == "00":
@@ -462,26 +539,15 @@ def play_exit():
 # ------------------------
 def update_readme_auto():
     """
-    Create README.md (root) with an index of categories and files.
+    Refresh the index of categories and files in README.md (hubindex.py).
+    Returns True if README.md changed.
     """
+    import hubindex
     try:
-        readme_path = os.path.join(ROOT, "README.md")
-        with open(readme_path, "w", encoding="utf-8") as fh:
-            fh.write("# Python Hub (Auto-generated README)\n\n")
-            fh.write("## Categories and files\n\n")
-            cats = scan_categories()
-            if not cats:
-                fh.write("No categories found. Add folders under `Python/` (games, scripts, tools, etc.)\n")
-            for c in cats:
-                fh.write(f"### {c}\n\n")
-                files = list_folder_files(c)
-                if not files:
-                    fh.write("- (empty)\n\n")
-                for f in files:
-                    fh.write(f"- {f}\n")
-                fh.write("\n")
+        return hubindex.update(os.path.join(ROOT, "README.md"), PY_CONTENT)
     except Exception as e:
         print(color("error_color") + "Failed to update README: " + str(e) + RESET)
+        return False
 
 # ------------------------
 # Start program
@@ -491,5 +557,11 @@ if __name__ == "__main__":
     os.makedirs(PY_CONTENT, exist_ok=True)
     os.makedirs(THEME_DIR, exist_ok=True)
     os.makedirs(SOUND_DIR, exist_ok=True)
+    # background services start once the first menu frame is on screen
+    screen.on_first_frame(startup.first_frame)
+    startup.defer(catalog.start_watcher, (PY_CONTENT,))
+    startup.defer(sound.start, SOUND_DIR)
+    startup.defer(runner.warm_up, settings.get("launch_mode", "fresh"),
+                  runner.parse_list(settings.get("preload", "")))
     main_loop = category_menu
     main_loop()
@@ -1,99 +1,112 @@
+import startup   # first: its import starts the startup clock (--startup-profile)
+
 import os
-import json
-import time
-import pyfiglet
+import shutil
+
+import animation
+import banner
+import catalog
+import hubconfig
+import runner
+import screen
+
+startup.mark("import")
 
 # ============================
 # Load Configuration
+# (hubconfig.py store: config.json + themes.json, cached and hot-reloaded)
 # ============================
-def load_config():
-    with open("config.json", "r") as f:
-        return json.load(f)
+with startup.phase("config"):
+    store = hubconfig.store()
+config = store.app
 
-def load_themes():
-    with open("themes.json", "r") as f:
-        return json.load(f)
+def apply_config():
+    """Copy the active config and compiled theme into the module globals."""
+    global TITLE_COLOR, SUB_COLOR, CREATOR_COLOR, NUM_COLOR, TEXT_COLOR, HEADER_COLOR, RESET
+    global ITEM, ANIM_SPEED, LAUNCH_MODE
+    theme = store.app_palette()
 
-config = load_config()
-themes = load_themes()
+    TITLE_COLOR = theme["title"]
+    SUB_COLOR = theme["subtitle"]
+    CREATOR_COLOR = theme["creator"]
+    NUM_COLOR = theme["menu_number"]
+    TEXT_COLOR = theme["menu_text"]
+    HEADER_COLOR = theme["header"]
+    RESET = theme["reset"]
+    # numbered menu line with the theme's codes already baked in
+    ITEM = theme.compile("{menu_number}[{0:02d}]{reset} {menu_text}{1}{reset}")
 
-theme = themes[config["default_theme"]]
+    ANIM_SPEED = float(config["animation_speed"])
+    LAUNCH_MODE = config.get("launch_mode", "fresh")
 
-TITLE_COLOR = theme["title"]
-SUB_COLOR = theme["subtitle"]
-CREATOR_COLOR = theme["creator"]
-NUM_COLOR = theme["menu_number"]
-TEXT_COLOR = theme["menu_text"]
-HEADER_COLOR = theme["header"]
-RESET = theme["reset"]
-
-ANIM_SPEED = config["animation_speed"]
+with startup.phase("theme"):
+    apply_config()
 
 # ============================
 # Utility Functions
 # ============================
 def clear():
-    os.system("cls" if os.name == "nt" else "clear")
+    screen.clear()
 
 def loading(text="Loading"):
+    # use as a with-block: the dots run on a background thread until the work is done
     clear()
-    for i in range(3):
-        print(f"{TEXT_COLOR}{text}{'.' * (i+1)}{RESET}")
-        time.sleep(ANIM_SPEED)
-        clear()
+    return animation.running("dots", TEXT_COLOR + text, config.get("animation_min", 0), speed=ANIM_SPEED)
 
 # ============================
 # Title Rendering
 # ============================
 def render_title():
-    ascii_banner = pyfiglet.figlet_format(config["main_title"], font="ansi_shadow")
-    print(TITLE_COLOR + ascii_banner + RESET)
-    print(SUB_COLOR + config["subtitle"] + RESET)
-    print(CREATOR_COLOR + config["creator"] + RESET + "\n")
+    width = shutil.get_terminal_size().columns
+    ascii_banner = banner.render(config["main_title"], "ansi_shadow", width, TITLE_COLOR, RESET)
+    screen.echo(ascii_banner)
+    screen.echo(SUB_COLOR + config["subtitle"] + RESET)
+    screen.echo(CREATOR_COLOR + config["creator"] + RESET + "\n")
 
 # ============================
 # Auto Detect Categories
 # ============================
 def get_categories():
-    base_path = "Python"
-    items = []
-
-    for item in os.listdir(base_path):
-        full = os.path.join(base_path, item)
-        if os.path.isdir(full):
-            items.append(item)
-
-    return sorted(items)
+    return catalog.list_dirs("Python")
 
 # ============================
 # Auto Detect Scripts in Category
 # ============================
 def get_scripts(category):
     path = os.path.join("Python", category)
-    scripts = []
-
-    for f in os.listdir(path):
-        if f.endswith(".py"):
-            scripts.append(f)
-
-    return sorted(scripts)
+    return catalog.list_files(path, (".py",))
 
 # ============================
 # Execute a Script
 # ============================
 def run_script(category, script):
-    loading("Running")
-    os.system(f"python Python/{category}/{script}")
+    import scriptmeta
+    path = os.path.join("Python", category, script)
+    problems = scriptmeta.problems(path)
+    if problems:
+        print(HEADER_COLOR + f"{script} cannot run:" + RESET)
+        for problem in problems:
+            print(TEXT_COLOR + "  " + problem + RESET)
+        if not scriptmeta.info(path).get("compiles", True):
+            input("\nPress ENTER to return to the menu...")
+            return
+        if input(NUM_COLOR + "Run anyway? (y/n) [n]: " + RESET).strip().lower() != "y":
+            return
+    with loading("Running"):
+        runner.ready(LAUNCH_MODE)
+    clear()
+    runner.wait(runner.spawn(path, mode=LAUNCH_MODE))
     input("\nPress ENTER to return to the menu...")
 
 # ============================
 # README Viewer
 # ============================
 def view_readme():
-    loading("Opening README")
-    os.system("clear")
-    with open("README.md", "r") as f:
-        print(f.read())
+    with loading("Opening README"):
+        with open("README.md", "r") as f:
+            text = f.read()
+    clear()
+    print(text)
     input("\nPress ENTER to return to the menu...")
 
 # ============================
@@ -112,25 +125,31 @@ def about():
 # ============================
 def main():
     while True:
-        clear()
-        render_title()
+        if store.refresh():
+            apply_config()
+        screen.begin()
+        with startup.phase("banner"):
+            render_title()
 
-        categories = get_categories()
+        with startup.phase("catalog"):
+            categories = get_categories()
 
-        print(HEADER_COLOR + "[::] Select an option [::]" + RESET)
-        print()
+        screen.echo(HEADER_COLOR + "[::] Select an option [::]" + RESET)
+        screen.echo()
 
         for i, cat in enumerate(categories, start=1):
-            print(f"{NUM_COLOR}[{i:02d}]{RESET} {TEXT_COLOR}{cat.capitalize()}{RESET}")
+            screen.echo(ITEM.format(i, cat.capitalize()))
 
-        print(f"\n{NUM_COLOR}[98]{RESET} View README")
-        print(f"{NUM_COLOR}[99]{RESET} About")
-        print(f"{NUM_COLOR}[00]{RESET} Exit\n")
+        screen.echo(f"\n{NUM_COLOR}[98]{RESET} View README")
+        screen.echo(f"{NUM_COLOR}[99]{RESET} About")
+        screen.echo(f"{NUM_COLOR}[00]{RESET} Exit\n")
 
-        choice = input(NUM_COLOR + "[-] Select an option: " + RESET)
+        choice = screen.prompt(NUM_COLOR + "[-] Select an option: " + RESET)
 
         if choice == "00":
-            loading("Exiting")
+            with loading("Exiting"):
+                catalog.stop_watcher()
+                runner.shutdown()
             clear()
             print(TEXT_COLOR + "Goodbye!" + RESET)
             break
@@ -149,17 +168,21 @@ def main():
                 continue
 
             scripts = get_scripts(category)
-            clear()
+            screen.begin()
             render_title()
 
-            print(HEADER_COLOR + f"{category.capitalize()} Scripts:" + RESET)
+            screen.echo(HEADER_COLOR + f"{category.capitalize()} Scripts:" + RESET)
 
+            # scripts that cannot run are marked from static metadata, without spawning them
+            import scriptmeta
+            broken = scriptmeta.flags([os.path.join("Python", category, s) for s in scripts])
             for i, script in enumerate(scripts, start=1):
-                print(f"{NUM_COLOR}[{i:02d}]{RESET} {TEXT_COLOR}{script}{RESET}")
+                problem = broken.get(os.path.abspath(os.path.join("Python", category, script)))
+                screen.echo(ITEM.format(i, script) + (f"  {HEADER_COLOR}[{problem}]{RESET}" if problem else ""))
 
-            print(f"{NUM_COLOR}[00]{RESET} Back\n")
+            screen.echo(f"{NUM_COLOR}[00]{RESET} Back\n")
 
-            sub_choice = input(NUM_COLOR + "Select a script: " + RESET)
+            sub_choice = screen.prompt(NUM_COLOR + "Select a script: " + RESET)
 
             if sub_choice == "00":
                 continue
@@ -172,4 +195,8 @@ def main():
 
 
 if __name__ == "__main__":
+    # background services start once the first menu frame is on screen
+    screen.on_first_frame(startup.first_frame)
+    startup.defer(catalog.start_watcher, ("Python",))
+    startup.defer(runner.warm_up, LAUNCH_MODE)
     main()
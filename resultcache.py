@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+PythonHub resultcache.py
+Opt-in output cache for scripts that print the same thing on every run:
+- a script is cacheable if it has a '# pyhub: cache' comment near the top
+  or is listed in the 'cache' setting (like 'pristine', see runner.py)
+- entries are keyed by the script's content hash, the interpreter and a
+  few environment variables, so editing the script or switching Python
+  never replays stale output
+- stdout/stderr and the exit code of successful captured runs are stored
+  in .cache/results/; entries expire after a TTL and the least recently
+  used ones are evicted once the cache grows past MAX_BYTES
+"""
+
+import os
+import sys
+import json
+import time
+import hashlib
+import threading
+
+import hubconfig
+import runner
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(ROOT, ".cache", "results")
+INDEX_FILE = os.path.join(CACHE_DIR, "index.json")
+
+CACHE_MARKER = "pyhub: cache"
+DEFAULT_TTL = 600.0            # seconds
+MAX_BYTES = 16 * 1024 * 1024   # total stored output
+MAX_ENTRY_BYTES = 2 * 1024 * 1024
+# environment that can change a script's output
+KEY_ENV = ("PATH", "HOME", "LANG", "LC_ALL", "TERM", "PYTHONPATH")
+CHUNK_SIZE = 64 * 1024
+
+_lock = threading.Lock()
+_index = None      # key -> {"script", "created", "used", "size", "returncode"}
+
+def is_cacheable(script_path, cached=()):
+    """True if the script opted in to result caching."""
+    name = os.path.basename(script_path)
+    parent = os.path.basename(os.path.dirname(os.path.abspath(script_path)))
+    if name in cached or f"{parent}/{name}" in cached:
+        return True
+    try:
+        with open(script_path, "r", encoding="utf-8", errors="ignore") as fh:
+            head = fh.read(runner.MARKER_SCAN_BYTES)
+    except OSError:
+        return False
+    return CACHE_MARKER in head
+
+def options():
+    """(cached scripts, ttl seconds) from settings.txt."""
+    settings = hubconfig.store().settings
+    return (runner.parse_list(settings.get("cache", "")),
+            float(settings.get("cache_ttl", DEFAULT_TTL)))
+
+def cache_key(script_path, args=(), cwd=None):
+    """Content hash of the script plus interpreter, arguments, cwd and KEY_ENV."""
+    h = hashlib.sha256()
+    with open(script_path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(CHUNK_SIZE), b""):
+            h.update(chunk)
+    context = {
+        "python": sys.executable,
+        "version": sys.version,
+        "args": list(args),
+        "cwd": os.path.abspath(cwd or os.getcwd()),
+        "env": {k: os.environ.get(k) for k in KEY_ENV},
+    }
+    h.update(json.dumps(context, sort_keys=True).encode())
+    return h.hexdigest()[:32]
+
+# ------------------------
+# Index
+# ------------------------
+def _load():
+    global _index
+    if _index is None:
+        try:
+            with open(INDEX_FILE, "r", encoding="utf-8") as fh:
+                _index = json.load(fh)
+        except (OSError, ValueError):
+            _index = {}
+    return _index
+
+def _save():
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    hubconfig.atomic_write(INDEX_FILE, json.dumps(_index))
+
+def _paths(key):
+    base = os.path.join(CACHE_DIR, key)
+    return base + ".out", base + ".err"
+
+def _drop(key):
+    _index.pop(key, None)
+    for path in _paths(key):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+def _evict(now, ttl):
+    for key, meta in list(_index.items()):
+        if now - meta["created"] > ttl:
+            _drop(key)
+    total = sum(m["size"] for m in _index.values())
+    # least recently used first
+    for key, meta in sorted(_index.items(), key=lambda kv: kv[1]["used"]):
+        if total <= MAX_BYTES:
+            break
+        total -= meta["size"]
+        _drop(key)
+
+# ------------------------
+# Lookups
+# ------------------------
+class Hit:
+    """A cached result; output is read back from disk on demand."""
+
+    def __init__(self, key, meta):
+        self.key = key
+        self.returncode = meta["returncode"]
+        self.created = meta["created"]
+        self.stdout_path, self.stderr_path = _paths(key)
+
+    @property
+    def age(self):
+        return time.time() - self.created
+
+    def dump(self, which, fh=None):
+        """Copy the cached 'stdout' or 'stderr' to a binary file (terminal by default)."""
+        fh = fh or (sys.stdout.buffer if which == "stdout" else sys.stderr.buffer)
+        with open(self.stdout_path if which == "stdout" else self.stderr_path, "rb") as src:
+            for chunk in iter(lambda: src.read(CHUNK_SIZE), b""):
+                fh.write(chunk)
+        fh.flush()
+
+    def read(self, which):
+        with open(self.stdout_path if which == "stdout" else self.stderr_path, "rb") as src:
+            return src.read()
+
+def lookup(key, ttl=DEFAULT_TTL):
+    """Return a Hit for key, or None if missing or older than ttl seconds."""
+    with _lock:
+        meta = _load().get(key)
+        if meta is None:
+            return None
+        now = time.time()
+        if now - meta["created"] > ttl or not all(os.path.exists(p) for p in _paths(key)):
+            _drop(key)
+            _save()
+            return None
+        meta["used"] = now
+        _save()
+        hit = Hit(key, meta)
+    return hit
+
+def store(key, script_path, result, ttl=DEFAULT_TTL):
+    """
+    Keep the output of a successful capture.CapturedRun under key.
+    Returns False if the run failed or its output is too big to cache.
+    """
+    size = result.stdout_bytes + result.stderr_bytes
+    if result.returncode != 0 or size > MAX_ENTRY_BYTES:
+        return False
+    with _lock:
+        _load()
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        for path, chunks in zip(_paths(key), (result.iter_stdout(), result.iter_stderr())):
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "wb") as fh:
+                for chunk in chunks:
+                    fh.write(chunk)
+            os.replace(tmp, path)
+        now = time.time()
+        _index[key] = {"script": os.path.abspath(script_path), "created": now, "used": now,
+                       "size": size, "returncode": result.returncode}
+        _evict(now, ttl)
+        _save()
+    return True
+
+def invalidate(script_path=None):
+    """Forget cached results for one script (or all of them)."""
+    with _lock:
+        _load()
+        target = os.path.abspath(script_path) if script_path else None
+        for key, meta in list(_index.items()):
+            if target is None or meta["script"] == target:
+                _drop(key)
+        _save()
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+PythonHub runner.py
+Single entry point for starting hub scripts, shared by all launchers:
+- "warm" mode forks the script from the preloaded warmpool.py server
+- "fresh" mode (or any pristine script) starts a new interpreter
+A script opts out of the warm pool with a '# pyhub: pristine' comment near
+the top, or by being listed in the 'pristine' setting.
+warmpool.py and subprocess are imported on first launch, not at startup.
+wait() reaps a launched script and records its run in telemetry.py.
+"""
+
+import os
+import sys
+import time
+import signal
+import threading
+
+LAUNCH_MODES = ("warm", "fresh")
+PRISTINE_MARKER = "pyhub: pristine"
+MARKER_SCAN_BYTES = 2048
+
+def parse_list(value):
+    """Split a comma separated setting into a tuple of stripped names."""
+    return tuple(v.strip() for v in (value or "").split(",") if v.strip())
+
+def is_pristine(script_path, pristine=()):
+    """True if the script must run in a brand new interpreter."""
+    name = os.path.basename(script_path)
+    parent = os.path.basename(os.path.dirname(os.path.abspath(script_path)))
+    if name in pristine or f"{parent}/{name}" in pristine:
+        return True
+    try:
+        with open(script_path, "r", encoding="utf-8", errors="ignore") as fh:
+            head = fh.read(MARKER_SCAN_BYTES)
+    except OSError:
+        return False
+    return PRISTINE_MARKER in head
+
+def _pool():
+    import warmpool
+    return warmpool
+
+def warm_up(mode="warm", preload=None):
+    """Start the warm pool in the background so the first launch is already fast."""
+    if mode == "warm" and _pool().available():
+        _pool().start(_pool().DEFAULT_PRELOAD if preload is None else preload)
+
+def ready(mode="warm", timeout=None, preload=None):
+    """
+    Wait until the warm pool finished preloading (no-op in fresh mode).
+    A pool already started by warm_up() is only waited on; otherwise it is
+    started here with the same preload warm_up() would use.
+    """
+    if mode == "warm" and _pool().available():
+        warm_up(mode, preload)
+        return _pool().wait_ready(timeout or _pool().CONNECT_TIMEOUT)
+    return True
+
+def shutdown():
+    # nothing to stop if no launch ever loaded the pool
+    if "warmpool" in sys.modules:
+        _pool().stop()
+
+def spawn(script_path, mode="fresh", pristine=(), stdin=None, stdout=None, stderr=None, cwd=None,
+          policy=None):
+    """
+    Start script_path and return a Popen-like process object.
+    Falls back to a fresh interpreter if the warm pool is unavailable.
+    policy holds the resource limits (limits.py); by default they are
+    resolved from settings.txt for this script.
+    """
+    import subprocess
+    import limits
+    if policy is None:
+        policy = limits.policy_for(script_path)
+    # a script reading the terminal must own it: it runs in its own process group
+    foreground = stdin is None and sys.stdin is not None and sys.stdin.isatty()
+    started = time.monotonic()
+    proc = None
+    if mode == "warm" and _pool().available() and not is_pristine(script_path, pristine):
+        try:
+            proc = _pool().launch(script_path, stdin=stdin, stdout=stdout, stderr=stderr, cwd=cwd,
+                                  limits=policy, foreground=foreground)
+            mode_used = "warm"
+        except OSError:
+            pass
+    if proc is None:
+        proc = _spawn_fresh(script_path, stdin, stdout, stderr, cwd, policy, foreground)
+        mode_used = "fresh"
+    # read back by wait() for telemetry and limit reporting
+    proc.hub_run = {"path": os.path.abspath(script_path), "mode": mode_used, "started": started,
+                    "policy": policy, "foreground": foreground, "timed_out": False, "timer": None}
+    proc.limit_hit = None
+    if policy.get("timeout"):
+        timer = threading.Timer(policy["timeout"], _expire, (proc,))
+        timer.daemon = True
+        timer.start()
+        proc.hub_run["timer"] = timer
+    return proc
+
+def _spawn_fresh(script_path, stdin, stdout, stderr, cwd, policy, foreground):
+    """
+    New interpreter in its own process group. No preexec_fn (unsafe once the
+    launcher has threads): when there are limits to set, or process_group is
+    missing (Python < 3.11), the script is started through limits.bootstrap(),
+    which applies them in the child before exec'ing it. The terminal is handed
+    over by the parent.
+    """
+    import subprocess
+    import limits
+    argv = [sys.executable, script_path]
+    group = {}
+    if os.name == "posix":
+        if sys.version_info >= (3, 11):
+            group = {"process_group": 0}
+        if limits.needs_setup(policy) or not group:
+            argv = limits.bootstrap(policy, argv)
+    proc = subprocess.Popen(argv, stdin=stdin, stdout=stdout, stderr=stderr, cwd=cwd, **group)
+    if foreground and os.name == "posix":
+        limits.give_terminal(proc.pid)
+        # it may have touched the terminal before it owned it and been stopped
+        limits.kill_group(proc.pid, signal.SIGCONT)
+    return proc
+
+def _expire(proc):
+    """Timeout watchdog: SIGTERM the script's process group, SIGKILL after a grace period."""
+    import limits
+    if proc.returncode is not None:
+        return
+    proc.hub_run["timed_out"] = True
+    limits.kill_group(proc.pid, signal.SIGTERM)
+
+    def finish():
+        if proc.returncode is None:
+            limits.kill_group(proc.pid, signal.SIGKILL)
+    timer = threading.Timer(limits.KILL_GRACE, finish)
+    timer.daemon = True
+    timer.start()
+
+def _killed_by_signal(proc):
+    """True if proc already died from a signal; does not reap it."""
+    if hasattr(proc, "rusage"):
+        return (proc.poll() or 0) < 0
+    if proc.returncode is not None:
+        return proc.returncode < 0
+    try:
+        info = os.waitid(os.P_PID, proc.pid, os.WEXITED | os.WNOHANG | os.WNOWAIT)
+    except (ChildProcessError, AttributeError):
+        return False
+    return info is not None and info.si_code in (os.CLD_KILLED, os.CLD_DUMPED)
+
+def kill_leftovers(proc):
+    """
+    If the script was killed (e.g. by a resource limit), kill whatever is left
+    of its process group, so children holding its output pipes go too.
+    """
+    import limits
+    run = getattr(proc, "hub_run", None)
+    if run is None or run.get("leftovers_killed") or not _killed_by_signal(proc):
+        return False
+    run["leftovers_killed"] = True
+    return limits.kill_group(proc.pid)
+
+def _wait_usage(proc):
+    """Reap proc; returns its resource usage dict (None if unavailable)."""
+    if hasattr(proc, "rusage"):
+        # warm pool: the monitor process already did the wait4()
+        proc.wait()
+        return proc.rusage
+    if proc.returncode is None and hasattr(os, "wait4"):
+        try:
+            _, status, ru = os.wait4(proc.pid, 0)
+        except ChildProcessError:
+            proc.wait()
+            return None
+        proc.returncode = os.waitstatus_to_exitcode(status)
+        return {"utime": ru.ru_utime, "stime": ru.ru_stime, "maxrss": ru.ru_maxrss}
+    proc.wait()
+    return None
+
+def wait(proc, out_bytes=0, err_bytes=0, stderr_tail=()):
+    """
+    Wait for a process started by spawn() and return its exit code. The run
+    (wall/CPU time, peak RSS, exit code, output bytes) goes to telemetry,
+    and proc.limit_hit names the resource limit it ran into, if any.
+    """
+    rusage = _wait_usage(proc)
+    run = getattr(proc, "hub_run", None)
+    if run is not None:
+        import limits
+        import telemetry
+        if run["timer"] is not None:
+            run["timer"].cancel()
+        if run["foreground"]:
+            limits.take_terminal(0)
+        proc.limit_hit = limits.describe(run["policy"], proc.returncode, run["timed_out"], stderr_tail)
+        telemetry.record(run["path"], time.monotonic() - run["started"], rusage, proc.returncode,
+                         out_bytes, err_bytes, os.path.basename(sys.argv[0]), run["mode"])
+    return proc.returncode
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+PythonHub screen.py
+Differential terminal renderer shared by all launchers:
+- a menu screen is built in an off-screen frame (begin/echo)
+- flush() compares it with the previous frame and sends only the changed
+  lines, as one batched ANSI write
+- clear() wipes the terminal with an escape sequence instead of spawning
+  the 'clear' binary, and forces the next frame to be drawn in full
+Anything printed outside a frame (script output, markdown, animations)
+should be preceded by clear() so the next frame knows the screen is dirty.
+"""
+
+import os
+import re
+import sys
+import shutil
+import select
+from contextlib import contextmanager
+
+CSI = "\u001b["
+HOME_CLEAR = CSI + "H" + CSI + "2J"
+ERASE_EOL = CSI + "K"
+ERASE_BELOW = CSI + "J"
+SGR_RESET = CSI + "0m"
+_SGR = re.compile(r"\x1b\[[0-9;]*m")
+
+_frame = []        # lines of the frame being built
+_prev = None       # lines currently on screen, None = unknown
+_size = None       # terminal size when _prev was drawn
+_after_flush = []  # one-shot callbacks, see on_first_frame()
+
+def _out():
+    return sys.stdout
+
+def clear():
+    """Wipe the terminal and forget what was on it."""
+    global _prev
+    _prev = None
+    _out().write(HOME_CLEAR)
+    _out().flush()
+
+def invalidate():
+    """Force the next flush() to redraw everything (screen was written to)."""
+    global _prev
+    _prev = None
+
+def begin():
+    """Start building a new frame."""
+    _frame.clear()
+
+def echo(*parts, sep=" "):
+    """Append one or more lines to the current frame, like print()."""
+    # each stored line carries the colors still active from the lines above it,
+    # so it can be redrawn on its own
+    carry = ""
+    for line in sep.join(str(p) for p in parts).split("\n"):
+        _frame.append(carry + line)
+        for code in _SGR.findall(line):
+            carry = "" if code in (SGR_RESET, CSI + "m") else carry + code
+
+def _render(lines, prev, rows):
+    # frames that can scroll (incl. the prompt/echo lines after them) break
+    # absolute cursor addressing, so those are always drawn in full
+    if prev is None or len(lines) + 2 >= rows:
+        return SGR_RESET + HOME_CLEAR + "\n".join(lines) + "\n"
+    out = []
+    for i, line in enumerate(lines):
+        if i >= len(prev) or prev[i] != line:
+            out.append(f"{CSI}{i + 1};1H{SGR_RESET}{line}{ERASE_EOL}")
+    # drop leftovers: a longer old frame, the old prompt and its echo
+    out.append(f"{CSI}{len(lines) + 1};1H{SGR_RESET}{ERASE_BELOW}")
+    return "".join(out)
+
+def flush():
+    """Draw the current frame, sending only lines that differ from the last one."""
+    global _prev, _size
+    size = shutil.get_terminal_size()
+    prev = _prev if size == _size else None
+    lines = list(_frame)
+    _out().write(_render(lines, prev, size.lines))
+    _out().flush()
+    _prev = lines
+    _size = size
+    while _after_flush:
+        _after_flush.pop(0)()
+
+def on_first_frame(fn):
+    """Call fn() once, right after the next frame has been drawn."""
+    _after_flush.append(fn)
+
+def prompt(text=""):
+    """Flush the pending frame and read a line (EOF reads as empty)."""
+    if _frame:
+        flush()
+        _frame.clear()
+    try:
+        return input(text)
+    except EOFError:
+        return ""
+
+# ------------------------
+# Raw key input (type-ahead screens)
+# ------------------------
+KEY_NAMES = {
+    "\r": "ENTER", "\n": "ENTER", "\x7f": "BACKSPACE", "\x08": "BACKSPACE",
+    "\t": "TAB", "\x1b": "ESC",
+    "\x1b[A": "UP", "\x1b[B": "DOWN", "\x1b[C": "RIGHT", "\x1b[D": "LEFT",
+}
+_ESCAPE_SEQ = re.compile(r"\x1b\[[0-9;]*[A-Za-z~]|\x1b|.", re.S)
+
+def can_read_keys():
+    """True if stdin is a terminal we can switch to key-at-a-time input."""
+    try:
+        import termios  # noqa: F401
+    except ImportError:
+        return False
+    return sys.stdin.isatty()
+
+@contextmanager
+def raw_keys():
+    """Key-at-a-time input without echo (Ctrl+C still interrupts)."""
+    import termios
+    import tty
+    fd = sys.stdin.fileno()
+    saved = termios.tcgetattr(fd)
+    try:
+        tty.setcbreak(fd)
+        yield
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, saved)
+
+def read_keys():
+    """Block for input and return every key pressed so far, as names or characters."""
+    fd = sys.stdin.fileno()
+    data = os.read(fd, 64)
+    # finish a multi-byte character or escape sequence split across reads
+    while select.select([fd], [], [], 0.01)[0]:
+        more = os.read(fd, 64)
+        if not more:
+            break
+        data += more
+    text = data.decode("utf-8", "replace")
+    return [KEY_NAMES.get(k, k) for k in _ESCAPE_SEQ.findall(text)]
@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+"""
+PythonHub scriptmeta.py
+Static metadata about hub scripts, read without importing them:
+- one-line summary from the module docstring (parsed with ast)
+- whether the script compiles, and the first syntax error if not
+- the modules it imports, and which of them it cannot run without
+- whether it reads stdin / needs the terminal (input(), sys.stdin, curses...)
+- markdown files use their first heading / first line
+Results are cached per file (mtime + size) in .cache/scriptmeta.json;
+infos() parses many stale files in parallel on a process pool.
+problems() is the launch preflight: syntax errors and required modules
+that importlib cannot find (cached per interpreter in .cache/modules.json).
+"""
+
+import os
+import sys
+import ast
+import json
+import time
+import threading
+
+import catalog
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(ROOT, ".cache")
+META_FILE = os.path.join(CACHE_DIR, "scriptmeta.json")
+MODULES_FILE = os.path.join(CACHE_DIR, "modules.json")
+META_VERSION = 2
+SUMMARY_MAX = 100
+# stale files before parsing moves to a process pool
+PARALLEL_MIN = 64
+# seconds a listing's flags are reused while its folder is unchanged
+FLAGS_TTL = 30.0
+
+_lock = threading.Lock()
+_cache = None      # abs path -> {"stamp": [mtime_ns, size], "summary": str, ...}
+_dirty = False
+_flags = {}        # tuple of paths -> (catalog generation, time, flags), see flags()
+
+def _load():
+    global _cache
+    if _cache is None:
+        try:
+            with open(META_FILE, "r", encoding="utf-8") as fh:
+                data = json.load(fh)
+            _cache = data["files"] if data.get("version") == META_VERSION else {}
+        except (OSError, ValueError, KeyError):
+            _cache = {}
+    return _cache
+
+def save():
+    """Write the metadata cache if it changed."""
+    global _dirty
+    with _lock:
+        if not _dirty:
+            return
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            tmp = META_FILE + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as fh:
+                json.dump({"version": META_VERSION, "files": _cache}, fh)
+            os.replace(tmp, META_FILE)
+            _dirty = False
+        except OSError:
+            pass
+
+def _stamp(path):
+    st = os.stat(path)
+    return [st.st_mtime_ns, st.st_size]
+
+def _first_line(text):
+    for line in text.strip().splitlines():
+        line = line.strip().lstrip("#").strip()
+        if line:
+            return line[:SUMMARY_MAX]
+    return ""
+
+# ------------------------
+# Python source analysis
+# ------------------------
+# calls / attributes / modules that mean the script talks to the user
+_STDIN_CALLS = {"input", "getpass"}
+_STDIN_ATTRS = {"stdin"}
+_TERMINAL_MODULES = {"curses", "termios", "tty", "msvcrt", "getpass", "fileinput"}
+_IMPORT_ERRORS = {"ImportError", "ModuleNotFoundError", "Exception", "BaseException"}
+
+def _guards_import(handler):
+    # bare except / except ImportError / except (ImportError, ...) make imports optional
+    if handler.type is None:
+        return True
+    names = handler.type.elts if isinstance(handler.type, ast.Tuple) else [handler.type]
+    return any(getattr(n, "id", getattr(n, "attr", None)) in _IMPORT_ERRORS for n in names)
+
+def _required_imports(body, found):
+    # module-level imports that are not inside a try/except ImportError or a def
+    for node in body:
+        if isinstance(node, ast.Import):
+            found.update(a.name.split(".")[0] for a in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level == 0 and node.module:
+                found.add(node.module.split(".")[0])
+        elif isinstance(node, ast.Try):
+            if not any(_guards_import(h) for h in node.handlers):
+                _required_imports(node.body, found)
+            _required_imports(node.orelse, found)
+            _required_imports(node.finalbody, found)
+        elif isinstance(node, (ast.If, ast.With, ast.For, ast.While)):
+            _required_imports(node.body, found)
+            _required_imports(getattr(node, "orelse", []), found)
+    return found
+
+def _analyse(tree):
+    imports, stdin = set(), False
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            imports.update(a.name.split(".")[0] for a in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level == 0 and node.module:
+                imports.add(node.module.split(".")[0])
+        elif isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+            stdin = stdin or node.func.id in _STDIN_CALLS
+        elif isinstance(node, ast.Attribute):
+            stdin = stdin or node.attr in _STDIN_ATTRS
+    stdin = stdin or bool(imports & _TERMINAL_MODULES)
+    return {
+        "imports": sorted(imports),
+        "requires": sorted(_required_imports(tree.body, set())),
+        "stdin": stdin,
+    }
+
+def _extract(path):
+    with open(path, "rb") as fh:
+        source = fh.read()
+    if path.endswith(".md"):
+        return {"summary": _first_line(source.decode("utf-8", "replace"))}
+    try:
+        tree = ast.parse(source, filename=path)
+        # compile too: some errors ('return' outside function, ...) only show up here
+        compile(tree, path, "exec", dont_inherit=True)
+    except (SyntaxError, ValueError) as e:
+        line = getattr(e, "lineno", None)
+        where = f"line {line}: " if line else ""
+        return {"summary": "", "compiles": False,
+                "error": f"{type(e).__name__}: {where}{getattr(e, 'msg', None) or e}",
+                "imports": [], "requires": [], "stdin": False}
+    entry = {"summary": _first_line(ast.get_docstring(tree) or ""), "compiles": True, "error": ""}
+    entry.update(_analyse(tree))
+    return entry
+
+def _cached(path):
+    """(stamp, cache entry or None if stale/missing); stamp is None if unreadable."""
+    try:
+        stamp = _stamp(path)
+    except OSError:
+        return None, None
+    with _lock:
+        entry = _load().get(path)
+    if entry is not None and entry["stamp"] == stamp:
+        return stamp, entry
+    return stamp, None
+
+def _remember(path, stamp, entry):
+    global _dirty
+    entry["stamp"] = stamp
+    with _lock:
+        _cache[path] = entry
+        _dirty = True
+        _flags.clear()
+    return entry
+
+def info(path):
+    """Cached metadata dict for one file ({} if it cannot be read)."""
+    path = os.path.abspath(path)
+    stamp, entry = _cached(path)
+    if stamp is None:
+        return {}
+    if entry is not None:
+        return entry
+    try:
+        return _remember(path, stamp, _extract(path))
+    except OSError:
+        return {}
+
+def summary(path):
+    """One-line description of a script or markdown file."""
+    return info(path).get("summary", "")
+
+def _extract_many(paths):
+    # process pool worker: parse a chunk of files
+    found = []
+    for path in paths:
+        try:
+            found.append(_extract(path))
+        except OSError:
+            found.append(None)
+    return found
+
+def infos(paths, workers=None):
+    """
+    {abs path: metadata} for many files. Files whose cache entry is stale
+    are parsed in parallel on a process pool when there are enough of them;
+    the cache is saved once at the end.
+    """
+    result, stale = {}, []
+    with _lock:
+        cache = _load()
+    # hot loop: one stat per file, no per-file function calls
+    for path in paths:
+        if not path.startswith(os.sep):
+            path = os.path.abspath(path)
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        stamp = [st.st_mtime_ns, st.st_size]
+        entry = cache.get(path)
+        if entry is not None and entry["stamp"] == stamp:
+            result[path] = entry
+        else:
+            stale.append((path, stamp))
+    if len(stale) >= PARALLEL_MIN:
+        import multiprocessing
+        import concurrent.futures
+        workers = workers or os.cpu_count() or 1
+        size = max(16, len(stale) // (workers * 4))
+        chunks = [stale[i:i + size] for i in range(0, len(stale), size)]
+        # spawn, not fork: the launchers run threads (watcher, sound, animation)
+        # whose locks a forked child could inherit held
+        context = multiprocessing.get_context("spawn")
+        try:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+                parsed = pool.map(_extract_many, [[p for p, _ in chunk] for chunk in chunks])
+                for chunk, entries in zip(chunks, parsed):
+                    for (path, stamp), entry in zip(chunk, entries):
+                        if entry is not None:
+                            result[path] = _remember(path, stamp, entry)
+        except (OSError, concurrent.futures.process.BrokenProcessPool):
+            pass    # no worker processes here: the rest is parsed below
+        stale = [(p, stamp) for p, stamp in stale if p not in result]
+    for path, stamp in stale:
+        try:
+            result[path] = _remember(path, stamp, _extract(path))
+        except OSError:
+            pass
+    save()
+    return result
+
+def summaries(paths):
+    """{abs path: summary} for many files; the cache is saved once at the end."""
+    return {p: e.get("summary", "") for p, e in infos(paths).items()}
+
+# ------------------------
+# Launch preflight
+# ------------------------
+_modules = None    # {"key": interpreter key, "found": {module: bool}}
+_modules_dirty = False
+
+def _interpreter_key():
+    # a pip install touches site-packages, so its mtime is part of the key
+    parts = [sys.executable, sys.version]
+    for entry in sys.path:
+        try:
+            parts.append(f"{entry}:{os.stat(entry or '.').st_mtime_ns}")
+        except OSError:
+            parts.append(entry)
+    return "|".join(parts)
+
+def _load_modules():
+    global _modules
+    if _modules is None:
+        key = _interpreter_key()
+        try:
+            with open(MODULES_FILE, "r", encoding="utf-8") as fh:
+                data = json.load(fh)
+            if data.get("key") != key:
+                raise ValueError("other interpreter")
+            _modules = data
+        except (OSError, ValueError, AttributeError):
+            _modules = {"key": key, "found": {}}
+    return _modules["found"]
+
+def _save_modules():
+    global _modules_dirty
+    if not _modules_dirty:
+        return
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp = MODULES_FILE + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(_modules, fh)
+        os.replace(tmp, MODULES_FILE)
+        _modules_dirty = False
+    except OSError:
+        pass
+
+def _importable(name):
+    global _modules_dirty
+    stdlib = getattr(sys, "stdlib_module_names", ())
+    if name in stdlib or name in sys.builtin_module_names:
+        return True
+    with _lock:
+        found = _load_modules()
+        if name in found:
+            return found[name]
+    import importlib.util
+    try:
+        ok = importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        ok = False
+    with _lock:
+        found[name] = ok
+        _modules_dirty = True
+    return ok
+
+def _local(name, folder):
+    # scripts run with their own folder first on sys.path
+    base = os.path.join(folder, name)
+    return os.path.exists(base + ".py") or os.path.isdir(base)
+
+def missing_modules(path, entry=None):
+    """
+    Modules the script imports unconditionally that this interpreter cannot
+    find. Pass the script's info() entry if you already have it.
+    """
+    path = os.path.abspath(path)
+    folder = os.path.dirname(path)
+    if entry is None:
+        entry = info(path)
+    missing = [m for m in entry.get("requires", ())
+               if not _importable(m) and not _local(m, folder)]
+    with _lock:
+        _save_modules()
+    return missing
+
+def problems(path):
+    """
+    Reasons a script cannot run, found without starting it: a syntax error
+    or missing required modules. Empty list if it looks runnable.
+    """
+    if not path.endswith(".py"):
+        return []
+    entry = info(path)
+    if not entry:
+        return ["cannot be read"]
+    if not entry.get("compiles", True):
+        return [entry["error"]]
+    missing = missing_modules(path, entry)
+    return [f"missing module: {m}" for m in missing]
+
+def flags(paths):
+    """
+    {abs path: short problem label} for the scripts in a listing that look
+    broken. Listings are redrawn on every keypress, so the result is kept
+    until the catalog generation changes, new metadata is parsed (e.g. by
+    problems() at launch) or FLAGS_TTL seconds pass.
+    """
+    key = tuple(paths)
+    now = time.monotonic()
+    with _lock:
+        cached = _flags.get(key)
+    if cached is not None and cached[0] == catalog.generation() and now - cached[1] < FLAGS_TTL:
+        return cached[2]
+    generation = catalog.generation()
+    result = {}
+    for path, entry in infos([p for p in paths if p.endswith(".py")]).items():
+        if not entry.get("compiles", True):
+            result[path] = "syntax error"
+        elif entry.get("requires"):
+            missing = missing_modules(path, entry)
+            if missing:
+                result[path] = "needs " + ", ".join(missing)
+    with _lock:
+        _flags[key] = (generation, now, result)
+    return result
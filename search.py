@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+PythonHub search.py
+Type-ahead search over every category and script in the hub:
+- names are kept in two sorted indexes (whole names, and name suffixes that
+  start at a word boundary), so prefix and word matches are a bisect away
+- substring, docstring (scriptmeta.py) and fuzzy subsequence matches are
+  one C-level regex scan over a joined text blob that stops at the limit
+- typing more characters narrows the previous matches instead of starting over
+The index is built once and reused until the catalog reports a change.
+"""
+
+import os
+import re
+import bisect
+
+import catalog
+import scriptmeta
+
+_WORD_START = re.compile(r"[\s_\-.](?=\w)")
+# sentinel sorting after every real character, closes a prefix range
+_HIGH = "\U0010ffff"
+# best entries kept per one/two letter prefix (the first keystrokes)
+SHORT_KEEP = 64
+
+class Entry:
+    """One searchable item: a category (path is the folder) or a file."""
+
+    __slots__ = ("kind", "category", "name", "path", "doc", "key")
+
+    def __init__(self, kind, category, name, path, doc=""):
+        self.kind = kind
+        self.category = category
+        self.name = name
+        self.path = path
+        self.doc = doc
+        self.key = name.lower()
+
+    def __repr__(self):
+        return f"Entry({self.kind!r}, {self.category!r}, {self.name!r})"
+
+class Index:
+    """In-memory search index over the hub."""
+
+    def __init__(self, root=catalog.PY_CONTENT, ignore=(), extensions=(".py", ".md"), docs=True):
+        self.root = root
+        self.generation = catalog.generation()
+        entries = []
+        for cat in catalog.categories(root, ignore):
+            folder = os.path.join(os.path.abspath(root), cat)
+            entries.append(Entry("category", cat, cat, folder))
+            for name in catalog.scripts(cat, extensions, root):
+                entries.append(Entry("file", cat, name, os.path.join(folder, name)))
+        if docs:
+            found = scriptmeta.summaries([e.path for e in entries if e.kind == "file"])
+            for e in entries:
+                e.doc = found.get(e.path, "")
+        # entry ids follow the tie-break order (files first, then shorter names)
+        entries.sort(key=lambda e: (e.kind != "file", len(e.key), e.key))
+        self.entries = entries
+        self._build()
+        self._last = None      # (query, matching ids) of the previous substring scan
+
+    def _build(self):
+        self._names = sorted((e.key, i) for i, e in enumerate(self.entries))
+        words = []
+        for i, e in enumerate(self.entries):
+            for m in _WORD_START.finditer(e.key):
+                words.append((e.key[m.end():], i))
+        words.sort()
+        self._words = words
+        # ids are already in rank order, so the first SHORT_KEEP seen are the best
+        self._short_names, self._short_words = {}, {}
+        for i, e in enumerate(self.entries):
+            for n in (1, 2):
+                bucket = self._short_names.setdefault(e.key[:n], [])
+                if len(bucket) < SHORT_KEEP and (not bucket or bucket[-1] != i):
+                    bucket.append(i)
+        for suffix, i in words:
+            for n in (1, 2):
+                bucket = self._short_words.setdefault(suffix[:n], [])
+                if len(bucket) < SHORT_KEEP and i not in bucket:
+                    bucket.append(i)
+        for bucket in self._short_words.values():
+            bucket.sort()
+        # blobs: line i of each blob belongs to entry i
+        self._offsets = []
+        names, texts = [], []
+        pos = 0
+        for e in self.entries:
+            line = f"{e.key} {e.category.lower()} {' '.join(e.doc.lower().split())}"
+            self._offsets.append(pos)
+            names.append(e.key)
+            texts.append(line)
+            pos += len(line) + 1
+        self._text_blob = "\n".join(texts) + "\n"
+        self._name_offsets = []
+        pos = 0
+        for n in names:
+            self._name_offsets.append(pos)
+            pos += len(n) + 1
+        self._name_blob = "\n".join(names) + "\n"
+
+    def stale(self):
+        return catalog.generation() != self.generation
+
+    @staticmethod
+    def _prefix_range(sorted_pairs, q):
+        lo = bisect.bisect_left(sorted_pairs, (q,))
+        hi = bisect.bisect_left(sorted_pairs, (q + _HIGH,), lo)
+        return sorted_pairs[lo:hi]
+
+    def _scan(self, pattern, blob, offsets, ids=None):
+        """Yield entry ids whose blob line matches pattern, in id order."""
+        if ids is not None:
+            # narrowed search: test only the previous matches
+            for i in ids:
+                end = offsets[i + 1] - 1 if i + 1 < len(offsets) else len(blob) - 1
+                if pattern.search(blob, offsets[i], end):
+                    yield i
+            return
+        last = -1
+        for m in pattern.finditer(blob):
+            i = bisect.bisect_right(offsets, m.start()) - 1
+            if i != last:
+                last = i
+                yield i
+
+    def query(self, q, limit=10):
+        """
+        Best matches for q, ranked: name prefix, word prefix, substring of
+        name/category/docstring, then fuzzy subsequence of the name.
+        """
+        q = " ".join(q.lower().split())
+        if not q:
+            return []
+        ranked = []
+        seen = set()
+
+        def take(ids):
+            for i in ids:
+                if i not in seen:
+                    seen.add(i)
+                    ranked.append(i)
+                    if len(ranked) >= limit:
+                        return True
+            return False
+
+        short = len(q) <= 2 and limit <= SHORT_KEEP
+        if short:
+            prefix = self._short_names.get(q, [])
+        else:
+            prefix = sorted(i for _, i in self._prefix_range(self._names, q))
+        if take(prefix):
+            return [self.entries[i] for i in ranked]
+        if short:
+            words = self._short_words.get(q, [])
+        else:
+            words = sorted({i for _, i in self._prefix_range(self._words, q)})
+        if take(words):
+            return [self.entries[i] for i in ranked]
+        # substring scan; reuse the last keystroke's hits if the query only grew
+        previous = None
+        if self._last and q.startswith(self._last[0]) and self._last[1] is not None:
+            previous = self._last[1]
+        pattern = re.compile(re.escape(q))
+        hits = []
+        for i in self._scan(pattern, self._text_blob, self._offsets, previous):
+            hits.append(i)
+            if i not in seen and len(ranked) < limit:
+                seen.add(i)
+                ranked.append(i)
+            if len(ranked) >= limit and previous is None:
+                hits = None      # stopped early: hit list is incomplete
+                break
+        self._last = (q, hits)
+        if len(ranked) < limit and len(q) >= 2:
+            chars = q.replace(" ", "")
+            fuzzy = re.compile(re.escape(chars[0]) + "".join(
+                f"[^\\n{re.escape(c)}]*{re.escape(c)}" for c in chars[1:]))
+            take(self._scan(fuzzy, self._name_blob, self._name_offsets))
+        return [self.entries[i] for i in ranked]
+
+_index = None
+
+def get_index(root=catalog.PY_CONTENT, ignore=()):
+    """Shared index for root, rebuilt only when the catalog reports a change."""
+    global _index
+    if _index is None or _index.root != root or _index.stale():
+        _index = Index(root, ignore)
+    return _index
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+PythonHub sound.py
+Background sound service for menu clicks:
+- sounds/*.wav are found and decoded once, when the service starts
+- play() only drops a request on a queue and never blocks the UI thread
+- rapid repeats of the same sound are debounced and coalesced
+- player processes are tracked and reaped, never left as zombies
+Backends, best first: simpleaudio (plays the preloaded buffers),
+termux-media-player (Termux), playsound.
+Decoding and player modules are imported on the service thread, so
+importing this module costs the launcher nothing at startup.
+"""
+
+import os
+import time
+import queue
+import threading
+
+DEBOUNCE = 0.06        # seconds: repeats of one sound inside this window are dropped
+MAX_PLAYERS = 4        # concurrent external players before the oldest is stopped
+QUEUE_SIZE = 32
+DRAIN_TIMEOUT = 2.0    # seconds stop() lets the last sounds (e.g. exit.wav) play out
+
+_queue = queue.Queue(maxsize=QUEUE_SIZE)
+_thread = None
+
+class _Service(threading.Thread):
+
+    def __init__(self, sound_dir):
+        super().__init__(name="sound", daemon=True)
+        self.sound_dir = sound_dir
+        self.sounds = {}       # name -> (path, wave params, frames) ; frames None if undecodable
+        self.players = []      # running Popen / simpleaudio play objects
+        self.last_played = {}
+        self.backend = None
+
+    # ------------------------
+    # Startup: preload and pick a backend
+    # ------------------------
+    def _preload(self):
+        import wave
+        try:
+            names = [f for f in os.listdir(self.sound_dir) if f.endswith(".wav")]
+        except OSError:
+            names = []
+        for name in names:
+            path = os.path.join(self.sound_dir, name)
+            try:
+                with wave.open(path, "rb") as w:
+                    params = (w.getnchannels(), w.getsampwidth(), w.getframerate())
+                    frames = w.readframes(w.getnframes())
+            except (OSError, wave.Error, EOFError):
+                params, frames = None, None
+            self.sounds[name] = (path, params, frames)
+
+    def _pick_backend(self):
+        import shutil
+        try:
+            import simpleaudio
+            self.backend = ("simpleaudio", simpleaudio)
+            return
+        except ImportError:
+            pass
+        if shutil.which("termux-media-player"):
+            self.backend = ("termux", None)
+            return
+        try:
+            from playsound import playsound
+            self.backend = ("playsound", playsound)
+        except ImportError:
+            self.backend = None
+
+    # ------------------------
+    # Playback
+    # ------------------------
+    def _reap(self):
+        alive = []
+        for p in self.players:
+            done = p.poll() is not None if hasattr(p, "poll") else not p.is_playing()
+            if not done:
+                alive.append(p)
+        # too many overlapping clicks: stop the oldest ones
+        while len(alive) > MAX_PLAYERS:
+            old = alive.pop(0)
+            if hasattr(old, "poll"):
+                old.kill()
+                old.wait()
+            else:
+                old.stop()
+        self.players = alive
+
+    def _play(self, name):
+        sound = self.sounds.get(name)
+        if sound is None or self.backend is None:
+            return
+        path, params, frames = sound
+        kind, mod = self.backend
+        try:
+            if kind == "simpleaudio" and frames is not None:
+                self.players.append(mod.play_buffer(frames, *params))
+            elif kind == "termux":
+                import subprocess
+                self.players.append(subprocess.Popen(
+                    ["termux-media-player", "play", path],
+                    stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL))
+            elif kind == "playsound":
+                mod(path, block=False)
+        except Exception:
+            pass
+
+    def run(self):
+        self._preload()
+        self._pick_backend()
+        while True:
+            try:
+                names = [_queue.get(timeout=1.0)]
+            except queue.Empty:
+                self._reap()
+                continue
+            # coalesce everything that piled up while we were busy
+            while True:
+                try:
+                    names.append(_queue.get_nowait())
+                except queue.Empty:
+                    break
+            # stop() sentinel: still play what was queued before it
+            stopping = None in names
+            if stopping:
+                names = names[:names.index(None)]
+            now = time.monotonic()
+            for name in dict.fromkeys(names):
+                if now - self.last_played.get(name, 0) < DEBOUNCE:
+                    continue
+                self.last_played[name] = now
+                self._play(name)
+            self._reap()
+            if stopping:
+                break
+        self._drain()
+
+    def _drain(self):
+        # let the players finish, within DRAIN_TIMEOUT, then stop the rest
+        deadline = time.monotonic() + DRAIN_TIMEOUT
+        while self.players and time.monotonic() < deadline:
+            time.sleep(0.02)
+            self._reap()
+        for p in self.players:
+            if hasattr(p, "poll"):
+                p.kill()
+                p.wait()
+            else:
+                p.stop()
+        self.players = []
+
+def start(sound_dir):
+    """Start the sound service (idempotent)."""
+    global _thread
+    if _thread is None or not _thread.is_alive():
+        _thread = _Service(sound_dir)
+        _thread.start()
+
+def play(name):
+    """Queue a sound by file name; returns immediately."""
+    if _thread is None:
+        return
+    try:
+        _queue.put_nowait(name)
+    except queue.Full:
+        pass
+
+def stop():
+    global _thread
+    if _thread is not None:
+        try:
+            _queue.put(None, timeout=0.5)
+        except queue.Full:
+            pass
+        _thread.join(timeout=DRAIN_TIMEOUT + 0.5)
+        _thread = None
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+PythonHub startup.py
+Keeps launcher startup down to what the first menu frame needs:
+- defer() queues background work (catalog watcher, sound service, warm
+  pool) that only starts once the first frame is on screen
+- phase() times the startup phases (import, config, theme, catalog, ...)
+- run a launcher with --startup-profile to print those timings and exit
+  right after the first frame
+Import this module first in a launcher: its import time is the clock start.
+"""
+
+import sys
+import time
+import threading
+
+PROFILE_FLAG = "--startup-profile"
+
+_t0 = time.perf_counter()
+_phases = []           # (name, seconds) in the order they finished
+_deferred = []
+_done = False
+_first_frame = 0.0     # seconds from the clock start to the first frame
+
+def profiling():
+    return PROFILE_FLAG in sys.argv
+
+class phase:
+    """
+    Context manager timing one startup phase; free once the first frame is drawn.
+
+        with startup.phase("config"):
+            store = hubconfig.store()
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        if not _done:
+            _phases.append((self.name, time.perf_counter() - self._start))
+        return False
+
+def mark(name):
+    """Record a phase that started where the previous one (or the clock) stopped."""
+    if not _done:
+        _phases.append((name, time.perf_counter() - _t0 - sum(s for _, s in _phases)))
+
+def defer(fn, *args):
+    """
+    Run fn(*args) on a background thread once the first frame is drawn
+    (right away, still in the background, if it already was).
+    """
+    if _done:
+        _start_deferred([(fn, args)])
+    else:
+        _deferred.append((fn, args))
+
+def _run_deferred(jobs):
+    for fn, args in jobs:
+        try:
+            fn(*args)
+        except Exception:
+            pass
+
+def _start_deferred(jobs):
+    threading.Thread(target=_run_deferred, args=(jobs,), name="startup", daemon=True).start()
+
+def report(out=None):
+    """Print the recorded phases with their share of the time to the first frame."""
+    out = out or sys.stderr
+    total = time.perf_counter() - _t0 if not _done else _first_frame
+    out.write(f"startup profile ({sys.argv[0]})\n")
+    for name, seconds in _phases:
+        pct = seconds / total * 100 if total else 0
+        out.write(f"  {name:<12} {seconds * 1000:8.2f} ms  {pct:5.1f}%\n")
+    other = total - sum(s for _, s in _phases)
+    out.write(f"  {'other':<12} {other * 1000:8.2f} ms\n")
+    out.write(f"  {'first frame':<12} {total * 1000:8.2f} ms\n")
+    out.flush()
+
+def first_frame():
+    """Called once the first frame is on screen (see screen.on_first_frame)."""
+    global _done, _first_frame
+    if _done:
+        return
+    _first_frame = time.perf_counter() - _t0
+    _done = True
+    if profiling():
+        report()
+        sys.exit(0)
+    jobs = list(_deferred)
+    _deferred.clear()
+    if jobs:
+        _start_deferred(jobs)
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+PythonHub telemetry.py
+Local execution telemetry for every script launch:
+- wall time, CPU time (user/sys), peak RSS, exit code and output bytes
+- records are queued in memory and written to .cache/telemetry.db (SQLite,
+  WAL) in batches, one transaction per batch and at exit
+- report() gives wall time / memory percentiles and the slowest and
+  heaviest scripts (menu2.py: Settings -> Run statistics)
+Nothing leaves the device.
+"""
+
+import os
+import math
+import time
+import atexit
+import threading
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+PY_CONTENT = os.path.join(ROOT, "Python")
+CACHE_DIR = os.path.join(ROOT, ".cache")
+DB_FILE = os.path.join(CACHE_DIR, "telemetry.db")
+
+BATCH_SIZE = 32        # queued records that trigger a write
+FLUSH_INTERVAL = 30.0  # seconds: older queued records are written on the next record()
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    ts REAL NOT NULL,
+    script TEXT NOT NULL,
+    launcher TEXT,
+    mode TEXT,
+    wall REAL,
+    cpu_user REAL,
+    cpu_sys REAL,
+    maxrss_kb INTEGER,
+    returncode INTEGER,
+    out_bytes INTEGER,
+    err_bytes INTEGER
+);
+CREATE INDEX IF NOT EXISTS runs_script ON runs (script);
+"""
+
+_lock = threading.Lock()
+_pending = []
+_last_flush = time.monotonic()
+_registered = False
+
+def script_name(path):
+    """Scripts under Python/ are stored as 'category/file.py', others by absolute path."""
+    path = os.path.abspath(path)
+    if path.startswith(PY_CONTENT + os.sep):
+        return os.path.relpath(path, PY_CONTENT).replace(os.sep, "/")
+    return path
+
+def _connect():
+    import sqlite3
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    db = sqlite3.connect(DB_FILE, timeout=5.0)
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute("PRAGMA synchronous=NORMAL")
+    db.executescript(SCHEMA)
+    return db
+
+def record(script, wall, rusage=None, returncode=None, out_bytes=0, err_bytes=0,
+           launcher="", mode=""):
+    """Queue one finished run; cheap, the database is written in batches."""
+    global _registered
+    rusage = rusage or {}
+    row = (time.time(), script_name(script), launcher, mode, wall,
+           rusage.get("utime"), rusage.get("stime"), rusage.get("maxrss"),
+           returncode, out_bytes, err_bytes)
+    with _lock:
+        _pending.append(row)
+        if not _registered:
+            atexit.register(flush)
+            _registered = True
+        due = len(_pending) >= BATCH_SIZE or time.monotonic() - _last_flush > FLUSH_INTERVAL
+    if due:
+        flush()
+
+def flush():
+    """Write every queued record in one transaction."""
+    global _last_flush
+    with _lock:
+        rows = list(_pending)
+        _pending.clear()
+        _last_flush = time.monotonic()
+    if not rows:
+        return
+    try:
+        db = _connect()
+        with db:
+            db.executemany(
+                "INSERT INTO runs (ts, script, launcher, mode, wall, cpu_user, cpu_sys,"
+                " maxrss_kb, returncode, out_bytes, err_bytes) VALUES (?,?,?,?,?,?,?,?,?,?,?)",
+                rows)
+        db.close()
+    except Exception:
+        # telemetry must never break a launch
+        pass
+
+# ------------------------
+# Reports
+# ------------------------
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list (None if empty)."""
+    if not sorted_values:
+        return None
+    k = math.ceil(pct / 100 * len(sorted_values)) - 1
+    return sorted_values[max(0, min(k, len(sorted_values) - 1))]
+
+def report(top=5, since=None):
+    """
+    Aggregate statistics as a dict:
+    runs, failures, wall/maxrss percentiles, and the top slowest (by median
+    wall time) and heaviest (by peak RSS) scripts.
+    """
+    flush()
+    if not os.path.exists(DB_FILE):
+        return {"runs": 0}
+    db = _connect()
+    try:
+        where, args = ("WHERE ts >= ?", (since,)) if since else ("", ())
+        rows = db.execute(f"SELECT script, wall, maxrss_kb, returncode FROM runs {where}", args).fetchall()
+    finally:
+        db.close()
+    if not rows:
+        return {"runs": 0}
+    walls = sorted(r[1] for r in rows if r[1] is not None)
+    rss = sorted(r[2] for r in rows if r[2] is not None)
+    per_script = {}
+    for script, wall, maxrss, rc in rows:
+        s = per_script.setdefault(script, {"script": script, "runs": 0, "failures": 0,
+                                           "walls": [], "maxrss_kb": 0})
+        s["runs"] += 1
+        s["failures"] += rc not in (0, None)
+        if wall is not None:
+            s["walls"].append(wall)
+        s["maxrss_kb"] = max(s["maxrss_kb"], maxrss or 0)
+    for s in per_script.values():
+        s["walls"].sort()
+        s["p50"] = percentile(s["walls"], 50) or 0.0
+        s["max"] = s["walls"][-1] if s["walls"] else 0.0
+        del s["walls"]
+    scripts = list(per_script.values())
+    return {
+        "runs": len(rows),
+        "failures": sum(s["failures"] for s in scripts),
+        "wall": {p: percentile(walls, p) for p in (50, 90, 99)},
+        "maxrss_kb": {p: percentile(rss, p) for p in (50, 90, 99)},
+        "slowest": sorted(scripts, key=lambda s: s["p50"], reverse=True)[:top],
+        "heaviest": sorted(scripts, key=lambda s: s["maxrss_kb"], reverse=True)[:top],
+    }
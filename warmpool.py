@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+"""
+PythonHub warmpool.py
+Warm interpreter pool for launching hub scripts:
+- a single long-lived server interpreter preloads heavy modules once
+- every launch forks a clean child from it and runs the script with runpy
+- stdin/stdout/stderr are handed to the child over a unix socket (SCM_RIGHTS)
+- exit status and rusage come back over the same connection
+Only available on POSIX; runner.py falls back to a fresh interpreter elsewhere.
+"""
+
+import os
+import sys
+import json
+import time
+import select
+import socket
+import signal
+import tempfile
+import threading
+import subprocess
+
+DEFAULT_PRELOAD = ("json", "sqlite3", "random", "platform", "psutil")
+CONNECT_TIMEOUT = 5.0
+
+_server = None      # subprocess.Popen of the pool server
+_sock_path = None
+_ready = False
+_lock = threading.Lock()
+
+def available():
+    """True if this platform can run the warm pool."""
+    return hasattr(os, "fork") and hasattr(socket, "AF_UNIX") and hasattr(socket, "send_fds")
+
+# ------------------------
+# Client side
+# ------------------------
+def start(preload=DEFAULT_PRELOAD):
+    """Start the pool server in the background (idempotent)."""
+    global _server, _sock_path, _ready
+    with _lock:
+        if _server is not None and _server.poll() is None:
+            return
+        _ready = False
+        tmpdir = tempfile.mkdtemp(prefix="pyhub-pool-")
+        _sock_path = os.path.join(tmpdir, "pool.sock")
+        # the server exits when its stdin pipe closes, i.e. when we do;
+        # it writes one line to stdout once the preload is done
+        _server = subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__), "--serve", _sock_path, ",".join(preload)],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, close_fds=True,
+        )
+
+def wait_ready(timeout=CONNECT_TIMEOUT):
+    """Block until the server finished preloading. Returns True if it is ready."""
+    global _ready
+    if _ready:
+        return True
+    if not running():
+        return False
+    r, _, _ = select.select([_server.stdout], [], [], timeout)
+    if r and _server.stdout.readline():
+        _ready = True
+    return _ready
+
+def stop():
+    global _server
+    with _lock:
+        if _server is None:
+            return
+        try:
+            _server.stdin.close()
+            _server.wait(timeout=2)
+        except (OSError, subprocess.TimeoutExpired):
+            _server.kill()
+        _server.stdout.close()
+        _server = None
+
+def running():
+    return _server is not None and _server.poll() is None
+
+def _connect():
+    deadline = time.monotonic() + CONNECT_TIMEOUT
+    while True:
+        conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            conn.connect(_sock_path)
+            return conn
+        except (FileNotFoundError, ConnectionRefusedError):
+            conn.close()
+            if not running() or time.monotonic() > deadline:
+                raise OSError("warm pool server is not available")
+            time.sleep(0.01)
+
+def _resolve_fd(spec, default_fd, mode, parent_ends):
+    """Turn a Popen-style stdio spec into (fd to send, fd to close after sending)."""
+    if spec is None:
+        return default_fd, None
+    if spec == subprocess.DEVNULL:
+        fd = os.open(os.devnull, os.O_RDWR)
+        return fd, fd
+    if spec == subprocess.PIPE:
+        r, w = os.pipe()
+        if mode == "r":
+            parent_ends.append(os.fdopen(w, "wb"))
+            return r, r
+        parent_ends.append(os.fdopen(r, "rb"))
+        return w, w
+    if spec == subprocess.STDOUT:
+        return None, None
+    return (spec if isinstance(spec, int) else spec.fileno()), None
+
+class PoolProcess:
+    """A script running in the warm pool; mirrors the parts of Popen we use."""
+
+    def __init__(self, conn, pid, stdin=None, stdout=None, stderr=None):
+        self._conn = conn
+        self._buf = b""
+        self.pid = pid
+        self.stdin = stdin
+        self.stdout = stdout
+        self.stderr = stderr
+        self.returncode = None
+        self.rusage = None
+
+    def _read_status(self, timeout):
+        self._conn.settimeout(timeout)
+        while b"\n" not in self._buf:
+            try:
+                chunk = self._conn.recv(4096)
+            except (socket.timeout, BlockingIOError):
+                return False
+            if not chunk:
+                # monitor died without reporting: treat like a killed child
+                self.returncode = -signal.SIGKILL
+                return True
+            self._buf += chunk
+        line, self._buf = self._buf.split(b"\n", 1)
+        msg = json.loads(line)
+        self.returncode = os.waitstatus_to_exitcode(msg["status"])
+        self.rusage = msg.get("rusage")
+        self._conn.close()
+        return True
+
+    def poll(self):
+        if self.returncode is None:
+            self._read_status(0)
+        return self.returncode
+
+    def wait(self, timeout=None):
+        if self.returncode is None and not self._read_status(timeout):
+            raise subprocess.TimeoutExpired(str(self.pid), timeout)
+        return self.returncode
+
+    def send_signal(self, sig):
+        if self.returncode is None:
+            try:
+                os.kill(self.pid, sig)
+            except ProcessLookupError:
+                pass
+
+    def terminate(self):
+        self.send_signal(signal.SIGTERM)
+
+    def kill(self):
+        self.send_signal(signal.SIGKILL)
+
+    def communicate(self, timeout=None):
+        """Read stdout/stderr pipes to EOF and wait, like Popen.communicate."""
+        results = {}
+
+        def drain(name, fh):
+            results[name] = fh.read()
+            fh.close()
+
+        threads = [threading.Thread(target=drain, args=(n, fh), daemon=True)
+                   for n, fh in (("out", self.stdout), ("err", self.stderr)) if fh is not None]
+        for t in threads:
+            t.start()
+        if self.stdin is not None:
+            self.stdin.close()
+        for t in threads:
+            t.join(timeout)
+        self.wait(timeout)
+        return results.get("out"), results.get("err")
+
+def launch(script_path, args=(), stdin=None, stdout=None, stderr=None, cwd=None, env=None,
+           limits=None, foreground=False):
+    """
+    Run script_path in a fresh fork of the warm server. Returns a PoolProcess.
+    limits / foreground are applied in the child by limits.apply().
+    """
+    if not running():
+        start()
+    parent_ends = []
+    to_close = []
+    fds = []
+    for spec, default_fd, mode in ((stdin, 0, "r"), (stdout, 1, "w"), (stderr, 2, "w")):
+        fd, owned = _resolve_fd(spec, default_fd, mode, parent_ends)
+        if fd is None:   # stderr=STDOUT
+            fd = fds[1]
+        fds.append(fd)
+        if owned is not None:
+            to_close.append(owned)
+    request = {
+        "path": os.path.abspath(script_path),
+        "args": list(args),
+        "cwd": cwd or os.getcwd(),
+        "env": dict(os.environ if env is None else env),
+        "limits": limits or {},
+        "foreground": foreground,
+    }
+    conn = _connect()
+    try:
+        socket.send_fds(conn, [json.dumps(request).encode() + b"\n"], fds)
+    finally:
+        for fd in to_close:
+            os.close(fd)
+    buf = b""
+    while b"\n" not in buf:
+        chunk = conn.recv(4096)
+        if not chunk:
+            conn.close()
+            raise OSError("warm pool failed to fork")
+        buf += chunk
+    line, rest = buf.split(b"\n", 1)
+    ends = iter(parent_ends)
+    proc = PoolProcess(
+        conn, int(line),
+        stdin=next(ends) if stdin == subprocess.PIPE else None,
+        stdout=next(ends) if stdout == subprocess.PIPE else None,
+        stderr=next(ends) if stderr == subprocess.PIPE else None,
+    )
+    proc._buf = rest
+    return proc
+
+# ------------------------
+# Server side
+# ------------------------
+def _run_child(req, fds):
+    """Body of the forked worker: become the script and never return."""
+    for target, fd in enumerate(fds):
+        os.dup2(fd, target)
+    for fd in set(fds):
+        if fd > 2:
+            os.close(fd)
+    try:
+        import limits
+        limits.apply(req.get("limits", {}), req.get("foreground", False))
+    except Exception:
+        os._exit(126)
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+    code = 0
+    try:
+        import io
+        import runpy
+        import atexit
+        import traceback
+        os.chdir(req["cwd"])
+        os.environ.clear()
+        os.environ.update(req["env"])
+        # fresh std streams bound to the new fds, buffered like a normal interpreter
+        sys.stdin = sys.__stdin__ = io.TextIOWrapper(io.FileIO(0, "r", closefd=False))
+        sys.stdout = sys.__stdout__ = io.TextIOWrapper(
+            io.FileIO(1, "w", closefd=False), line_buffering=os.isatty(1), write_through=False)
+        sys.stderr = sys.__stderr__ = io.TextIOWrapper(
+            io.FileIO(2, "w", closefd=False), errors="backslashreplace", line_buffering=True)
+        sys.argv = [req["path"]] + req["args"]
+        sys.path[0] = os.path.dirname(req["path"])
+        try:
+            runpy.run_path(req["path"], run_name="__main__")
+        except SystemExit as e:
+            if e.code is None:
+                code = 0
+            elif isinstance(e.code, int):
+                code = e.code
+            else:
+                print(e.code, file=sys.stderr)
+                code = 1
+        except BaseException:
+            traceback.print_exc()
+            code = 1
+        atexit._run_exitfuncs()
+        sys.stdout.flush()
+        sys.stderr.flush()
+    except BaseException:
+        code = 1
+    os._exit(code & 0xFF)
+
+def _handle(conn):
+    """Body of the per-launch monitor: fork the worker, report pid and status."""
+    msg, fds, _flags, _addr = socket.recv_fds(conn, 1 << 20, 3)
+    while not msg.endswith(b"\n"):
+        chunk = conn.recv(1 << 20)
+        if not chunk:
+            os._exit(1)
+        msg += chunk
+    req = json.loads(msg)
+    pid = os.fork()
+    if pid == 0:
+        conn.close()
+        _run_child(req, fds)
+    for fd in fds:
+        os.close(fd)
+    conn.sendall(f"{pid}\n".encode())
+    _, status, ru = os.wait4(pid, 0)
+    rusage = {"utime": ru.ru_utime, "stime": ru.ru_stime, "maxrss": ru.ru_maxrss}
+    try:
+        conn.sendall(json.dumps({"status": status, "rusage": rusage}).encode() + b"\n")
+    except OSError:
+        pass
+    os._exit(0)
+
+def _serve(sock_path, preload):
+    import importlib
+    import selectors
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(sock_path)
+    os.chmod(sock_path, 0o600)
+    listener.listen(16)
+    # the modules every forked worker needs itself, so no launch pays for importing them
+    import io
+    import runpy
+    import atexit
+    import pkgutil      # runpy.run_path imports it (and typing) on first use
+    import traceback
+    import limits
+    for name in preload:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            pass
+    # monitors are reaped automatically; they wait on their own worker
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+    sys.stdout.write("ready\n")
+    sys.stdout.flush()
+    sel = selectors.DefaultSelector()
+    sel.register(listener, selectors.EVENT_READ)
+    sel.register(sys.stdin, selectors.EVENT_READ)
+    try:
+        while True:
+            for key, _ in sel.select():
+                if key.fileobj is sys.stdin:
+                    if not os.read(0, 1):
+                        return
+                    continue
+                conn, _ = listener.accept()
+                if os.fork() == 0:
+                    sel.close()
+                    listener.close()
+                    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+                    try:
+                        _handle(conn)
+                    finally:
+                        os._exit(1)
+                conn.close()
+    finally:
+        listener.close()
+        try:
+            os.unlink(sock_path)
+            os.rmdir(os.path.dirname(sock_path))
+        except OSError:
+            pass
+
+if __name__ == "__main__":
+    if len(sys.argv) >= 3 and sys.argv[1] == "--serve":
+        names = sys.argv[3].split(",") if len(sys.argv) > 3 and sys.argv[3] else []
+        _serve(sys.argv[2], names)